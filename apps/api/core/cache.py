@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from db.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Process-local LRU of query results.
+
+    Entries have no TTL: they stay valid until a write that can change them
+    calls `invalidate()`. Concurrent misses on the same key share a single
+    load, and a load that started before an invalidation is returned to its
+    callers but never stored.
+
+    When loads may read from a lagging replica, `settle_seconds` is set to
+    the largest lag accepted: loads started within that time after an
+    invalidation may not see the write behind it, so they are not stored
+    either.
+    """
+
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.settle_seconds = 0.0
+        self._invalidated_at = float("-inf")
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Returns the cached value of `key`, running `loader` on a miss."""
+        if self.max_size <= 0:
+            return await loader()
+
+        while key not in self._entries:
+            pending = self._pending.get(key)
+            if pending is None:
+                return await self._load(key, loader)
+            # Another request is already loading this key; wait for it and
+            # check again (it may have failed or been invalidated meanwhile).
+            await asyncio.wait({pending})
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._entries[key]
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        self.misses += 1
+        generation = self.generation
+        settled = time.monotonic() - self._invalidated_at >= self.settle_seconds
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        try:
+            value = await loader()
+            if generation == self.generation and settled:
+                self._entries[key] = value
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+            pending.set_result(None)
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drops every entry; loads already running will not be stored."""
+        self.generation += 1
+        self.invalidations += 1
+        self._invalidated_at = time.monotonic()
+        self._entries.clear()
+        self._pending.clear()
+        logger.debug(f"{self.name} cache invalidated ({reason or 'no reason given'})")
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "max_size": self.max_size,
+            "size": len(self._entries),
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+analytics_cache = ResultCache("analytics", settings.API_ANALYTICS_CACHE_SIZE)
@@ -0,0 +1,178 @@
+"""
+Negotiated response compression (brotli or gzip) for the API.
+
+Brotli is only offered when the `brotli` package is installed; otherwise
+clients that accept it get gzip. Streaming responses (NDJSON, JSON arrays)
+are compressed chunk by chunk with a flush after each one, so rows still
+reach the client as they are produced. Server-Sent Events, responses that
+are already encoded and bodies under the size threshold go out as they are.
+"""
+import logging
+import zlib
+from typing import Dict, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+# Server preference when the client accepts several with the same q-value.
+PREFERRED_ENCODINGS = ("br", "gzip")
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    return PREFERRED_ENCODINGS if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, offered: Tuple[str, ...]) -> Optional[str]:
+    """
+    Picks the content coding for an Accept-Encoding header (RFC 9110 12.5.3):
+    the offered coding with the highest q-value, '*' standing for any coding
+    not listed, ties broken by the order of `offered`. None means identity.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in offered:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _Encoder:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        """Compresses `data` and flushes it, so the client can decode it now."""
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best coding the client accepts.
+
+    `minimum_size` applies to complete bodies; a streaming response is
+    compressed whenever its first chunk is (its total size is unknown).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = available_encodings()
+        logger.info(
+            f"Response compression: {', '.join(self.encodings)} "
+            f"(>= {minimum_size} bytes, gzip level {gzip_level}, brotli quality {brotli_quality})"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressingResponder(self, encoding)(scope, receive, send)
+
+
+class _CompressingResponder:
+    """Per-request state: holds back the response start until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.middleware.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or media_type in UNCOMPRESSED_TYPES
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self.encoder = _Encoder(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.encoder.chunk(body)
+            else:
+                message["body"] = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(start)
+            await self.send(message)
+            return
+
+        message["body"] = self.encoder.chunk(body) if more_body else self.encoder.finish(body)
+        await self.send(message)
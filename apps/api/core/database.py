@@ -1,10 +1,39 @@
+import asyncio
 import logging
-from typing import Generator
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Generator, Optional
 import psycopg
 from fastapi import Request
-from psycopg_pool import ConnectionPool
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
+from starlette.types import ASGIApp, Receive, Scope, Send
+from db.config import settings
+from db.connection import create_db_pool, pool_stats
 
 logger = logging.getLogger(__name__)
+# Seconds the replica is behind. A server that is not in recovery (the
+# primary itself used as the read server) is not behind. A replica whose WAL
+# receiver is not streaming (disconnected, stopped or restarting) cannot know
+# what it is missing and counts as infinitely behind; one that streams and has
+# replayed everything it received is not behind, however long ago the last
+# write was. Roles without pg_read_all_stats (pg_monitor) only see the
+# receiver's pid, so for them a running receiver is taken as streaming.
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN NOT EXISTS (
+        SELECT 1
+        FROM pg_stat_wal_receiver
+        WHERE pid IS NOT NULL
+            AND COALESCE(status, 'streaming') = 'streaming'
+    ) THEN 'Infinity'
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(
+        EXTRACT(EPOCH FROM clock_timestamp() - pg_last_xact_replay_timestamp()),
+        'Infinity'
+    )
+END::float8 AS lag
+"""
 
 
 def get_db_connection(request: Request) -> Generator[psycopg.Connection, None, None]:
@@ -19,4 +48,186 @@ def get_db_connection(request: Request) -> Generator[psycopg.Connection, None, N
         except Exception as e:
             logger.error(f"Database transaction error: {e}")
             conn.rollback()
-            raise e
\ No newline at end of file
+            raise e
+
+
+class ReadRouter:
+    """
+    Sends read-only work to the read replica while it is reachable and no
+    more than `max_lag` seconds behind, and to the primary otherwise.
+
+    A background check measures the lag every `check_interval` seconds; a
+    replica checkout that fails or times out also switches reads to the
+    primary until the next successful check. Without a replica every read
+    simply goes to the primary.
+
+    After `note_write()` reads go to the primary for `settle_seconds` (by
+    default the most the replica may lag plus one check), so a client that
+    reloads a list right after changing it sees its own write.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncConnectionPool,
+        replica: Optional[AsyncConnectionPool] = None,
+        max_lag: float = 5.0,
+        check_interval: float = 2.0,
+        checkout_timeout: float = 1.0,
+        settle_seconds: Optional[float] = None,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.checkout_timeout = checkout_timeout
+        self.settle_seconds = (
+            max_lag + check_interval if settle_seconds is None else settle_seconds
+        )
+        self.use_replica = False
+        self._settled_at = 0.0
+        self.lag: Optional[float] = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.fallbacks = 0
+        self.reads_after_write = 0
+        self._monitor: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.replica is not None:
+            await self.check()
+            self._monitor = asyncio.create_task(self._run_checks())
+
+    async def stop(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+        if self.replica is not None:
+            await self.replica.close()
+            logger.info("Read replica connection pool closed.")
+
+    async def check(self) -> None:
+        """Measures the replica's lag and decides where reads go."""
+        try:
+            async with self.replica.connection(timeout=self.checkout_timeout) as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(REPLICA_LAG_SQL)
+                    self.lag = (await cur.fetchone())["lag"]
+        except Exception as e:
+            self.lag = None
+            self._route(False, f"replica check failed: {e}")
+            return
+        if self.lag > self.max_lag:
+            self._route(False, f"replica is {self.lag:.1f}s behind (max {self.max_lag:.1f}s)")
+        else:
+            self._route(True, f"replica is {self.lag:.1f}s behind")
+
+    async def _run_checks(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    def _route(self, use_replica: bool, reason: str) -> None:
+        if use_replica != self.use_replica:
+            if use_replica:
+                logger.info(f"Reads go to the replica again: {reason}")
+            else:
+                self.fallbacks += 1
+                logger.warning(f"Reads fall back to the primary: {reason}")
+        self.use_replica = use_replica
+
+    def note_write(self) -> None:
+        """Sends reads to the primary until the replica has had time to replay a write."""
+        self._settled_at = time.monotonic() + self.settle_seconds
+
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[Any]:
+        """A connection for read-only work: the replica's when usable, else the primary's."""
+        async with AsyncExitStack() as stack:
+            conn = None
+            if self.use_replica and time.monotonic() < self._settled_at:
+                self.reads_after_write += 1
+            elif self.use_replica:
+                try:
+                    conn = await stack.enter_async_context(
+                        self.replica.connection(timeout=self.checkout_timeout)
+                    )
+                    self.replica_reads += 1
+                except (PoolTimeout, psycopg.OperationalError) as e:
+                    self._route(False, f"replica checkout failed: {e}")
+            if conn is None:
+                conn = await stack.enter_async_context(self.primary.connection())
+                self.primary_reads += 1
+            yield conn
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "replica_configured": self.replica is not None,
+            "using_replica": self.use_replica,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "fallbacks": self.fallbacks,
+            "settle_seconds": self.settle_seconds,
+            "reads_after_write": self.reads_after_write,
+            "replica_pool": pool_stats(self.replica) if self.replica is not None else None,
+        }
+
+
+async def create_read_router(primary: AsyncConnectionPool) -> ReadRouter:
+    """
+    The app's ReadRouter. With DB_READ_HOST set a replica pool is opened
+    without waiting for it, so a replica that is down at startup only sends
+    reads to the primary until it comes up.
+    """
+    replica = None
+    if settings.read_database_url:
+        replica = await create_db_pool(
+            settings.read_database_url, name="read_pool", wait=False
+        )
+    router = ReadRouter(
+        primary,
+        replica,
+        max_lag=settings.DB_READ_MAX_LAG,
+        check_interval=settings.DB_READ_CHECK_INTERVAL,
+        checkout_timeout=settings.DB_READ_CHECKOUT_TIMEOUT,
+    )
+    await router.start()
+    return router
+
+
+class ReadYourWritesMiddleware:
+    """
+    Marks every request that may write (any method but GET, HEAD and
+    OPTIONS) on the app's ReadRouter, when it starts and when it ends, so
+    the reads that follow it go to the primary (see ReadRouter.note_write).
+    Only writes made through this process are seen.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = None
+        if scope["type"] == "http" and scope["method"] not in self.SAFE_METHODS:
+            router = getattr(scope["app"].state, "read_router", None)
+        if router is None:
+            await self.app(scope, receive, send)
+            return
+        router.note_write()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            router.note_write()
+
+
+async def get_read_connection(request: Request):
+    """
+    FastAPI dependency for read-only endpoints (lists, analytics): a replica
+    connection when one is usable, else a primary one. Requests must not
+    write through it; reads that follow a write request go to the primary
+    for a while (ReadYourWritesMiddleware).
+    """
+    async with request.app.state.read_router.read_connection() as conn:
+        yield conn
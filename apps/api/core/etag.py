@@ -0,0 +1,67 @@
+import logging
+from typing import Any, Callable, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
+from apps.api.core.database import get_read_connection
+
+logger = logging.getLogger(__name__)
+RESOURCE_VERSION_SQL = (
+    "SELECT versao, atualizado_em FROM recurso_versao WHERE recurso = %(resource)s"
+)
+
+
+async def get_resource_etag(conn: Any, resource: str) -> Optional[str]:
+    """
+    Weak ETag for the current version of `resource` (see recurso_versao).
+    None when the resource has no counter, so the response goes out uncached.
+    """
+    async with conn.cursor() as cur:
+        await cur.execute(RESOURCE_VERSION_SQL, {"resource": resource})
+        row = await cur.fetchone()
+    if not row:
+        logger.warning(f"No version counter for resource '{resource}'")
+        return None
+    stamp = int(row["atualizado_em"].timestamp() * 1_000_000)
+    return f'W/"{resource}-{row["versao"]}-{stamp:x}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: the W/ prefix is ignored on both sides.
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def resource_etag(resource: str) -> Callable:
+    """
+    Builds a dependency for conditional GETs of a versioned resource.
+
+    The version is read before the handler runs its query, on the request's
+    read connection (shared with a repository built on get_read_connection),
+    so version and body come from the same server and the ETag is never
+    newer than the body it goes out with (at worst older, costing one extra
+    download later). A matching If-None-Match ends the request with
+    304 Not Modified before the handler runs.
+    """
+
+    async def dependency(
+        request: Request, conn: Any = Depends(get_read_connection)
+    ) -> Optional[str]:
+        etag = await get_resource_etag(conn, resource)
+        if_none_match = request.headers.get("if-none-match")
+        if etag and if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Vary": "Accept"},
+            )
+        return etag
+
+    return dependency
+
+
+def with_etag(response: Response, etag: Optional[str]) -> Response:
+    """Adds the validator headers to a response the route builds itself."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Vary"] = "Accept"
+    return response
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+import orjson
+import psycopg
+from fastapi import Request
+from db.config import settings
+
+logger = logging.getLogger(__name__)
+ORDER_EVENTS_CHANNEL = "order_changes"
+RESYNC_EVENT = {"table": None, "op": "RESYNC", "orders": None}
+
+
+class OrderEventBroker:
+    """
+    Fans out the 'order_changes' NOTIFY events to in-process subscribers.
+
+    A single dedicated LISTEN connection (outside the pool) serves every
+    subscriber, so the database sees the same load whether one screen or a
+    hundred are open. Each subscriber gets its own bounded queue; one that
+    falls behind is sent a RESYNC event instead of the events it missed.
+    The same happens to everyone after the LISTEN connection is re-opened,
+    since notifications sent while it was down are lost.
+    """
+
+    def __init__(self, conninfo: str, channel: str = ORDER_EVENTS_CHANNEL, queue_size: int = 100):
+        self.conninfo = conninfo
+        self.channel = channel
+        self.queue_size = queue_size
+        self.last_event_id = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Registers a synchronous callback run for every event (e.g. cache invalidation)."""
+        self._listeners.append(callback)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="order-event-broker")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Order event broker stopped.")
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Registers a subscriber queue of events (each with its 'id') for the block."""
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers.add(queue)
+        logger.debug(f"Order event subscriber added ({len(self._subscribers)} total)")
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+            logger.debug(f"Order event subscriber removed ({len(self._subscribers)} total)")
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def _run(self) -> None:
+        delay = 1.0
+        first = True
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self.conninfo, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {self.channel}")
+                    logger.info(f"Listening for order changes on '{self.channel}'.")
+                    if not first:
+                        self._publish(dict(RESYNC_EVENT))
+                    first = False
+                    delay = 1.0
+                    async for notify in conn.notifies():
+                        self._publish(self._decode(notify.payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Order event listener failed, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                first = False
+
+    @staticmethod
+    def _decode(payload: str) -> Dict[str, Any]:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Malformed order change payload: {payload!r}")
+            return dict(RESYNC_EVENT)
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        self.last_event_id += 1
+        event["id"] = self.last_event_id
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.exception(f"Order event listener callback failed: {e}")
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Too far behind: drop its backlog and ask it to reload.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({**RESYNC_EVENT, "id": event["id"]})
+
+
+def create_order_event_broker() -> OrderEventBroker:
+    return OrderEventBroker(settings.database_url, queue_size=settings.API_EVENTS_QUEUE_SIZE)
+
+
+async def sse_events(request: Request, broker: OrderEventBroker) -> AsyncIterator[bytes]:
+    """
+    Server-Sent Events body for one subscriber.
+    Sends a comment line as heartbeat when idle, so proxies keep the
+    connection open and disconnected clients are noticed.
+    """
+    async with broker.subscribe() as queue:
+        yield b"retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), settings.API_SSE_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            yield (
+                f"id: {event['id']}\nevent: order_change\ndata: ".encode()
+                + orjson.dumps(event)
+                + b"\n\n"
+            )
@@ -0,0 +1,3 @@
+class QueryRegistryError(Exception):
+    """Raised when the SQL query registry cannot be loaded or a query is unknown."""
+    pass
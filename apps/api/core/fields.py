@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    """
+    The top-level fields a client asked for (?fields= / ?exclude=), in the
+    response model's field order. Repositories use it to skip the SQL of
+    nested collections nobody asked for; routes use it to shape the output.
+    """
+
+    names: Tuple[str, ...]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def pick(self, item: BaseModel) -> Dict[str, Any]:
+        """The selected fields of a response model, as a dict ready for dumps()."""
+        values = item.__dict__
+        return {name: values[name] for name in self.names}
+
+
+def wants(fields: Optional[FieldSet], name: str) -> bool:
+    """True unless a field selection was given and leaves `name` out."""
+    return fields is None or name in fields
+
+
+def shaped(fields: Optional[FieldSet], to_model: Callable[[Any], BaseModel]) -> Callable[[Any], Any]:
+    """Wraps a row mapper so it emits only the selected fields (streaming path)."""
+    if fields is None:
+        return to_model
+    return lambda row: fields.pick(to_model(row))
+
+
+def sparse_fields(model: Type[BaseModel], always: Tuple[str, ...] = ("id",)):
+    """
+    Builds a dependency parsing comma separated ?fields= or ?exclude= lists
+    against `model`. Yields None when neither is given (full documents).
+    The `always` fields (the id) are kept so clients can still key the rows.
+    """
+    known = tuple(model.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Comma separated fields to return: {', '.join(known)}"
+        ),
+        exclude: Optional[str] = Query(
+            None, description="Comma separated fields to leave out"
+        ),
+    ) -> Optional[FieldSet]:
+        if fields is None and exclude is None:
+            return None
+        if fields is not None and exclude is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either 'fields' or 'exclude', not both.",
+            )
+        requested = {name.strip() for name in (fields or exclude).split(",") if name.strip()}
+        unknown = requested.difference(known)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field(s): {', '.join(sorted(unknown))}.",
+            )
+        if fields is not None:
+            selected = requested.union(always)
+        else:
+            selected = set(known).difference(requested).union(always)
+        return FieldSet(tuple(name for name in known if name in selected))
+
+    return dependency
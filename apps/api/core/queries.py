@@ -0,0 +1,204 @@
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from db.config import settings
+from db.prepared import get_prepared_cache
+from apps.api.core.exceptions import QueryRegistryError
+
+logger = logging.getLogger(__name__)
+MODULES_PATH = Path(__file__).resolve().parent.parent / "modules"
+PLACEHOLDER_RE = re.compile(r"%\((\w+)\)s")
+PREPARE_DIRECTIVE_RE = re.compile(r"^--\s*prepare:\s*(\S+)\s*$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Query:
+    """An immutable, pre-loaded SQL statement."""
+
+    module: str
+    name: str
+    sql: str
+    params: FrozenSet[str]
+    prepare_threshold: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.module}:{self.name}"
+
+    async def execute(self, cur, params: Optional[Dict[str, Any]] = None):
+        """
+        Executes the query on `cur`, preparing it server-side once it has
+        crossed its prepare threshold on that connection.
+        """
+        cache = get_prepared_cache(cur.connection)
+        prepare = (
+            cache.should_prepare(self.key, self.prepare_threshold) if cache else None
+        )
+        return await cur.execute(self.sql, params, prepare=prepare)
+
+
+class QuerySet:
+    """
+    Named view over the registry for a single module.
+    Declares the queries the module needs so a missing file fails at startup.
+    """
+
+    def __init__(self, registry: "QueryRegistry", module: str, prefix: str, required: Tuple[str, ...]):
+        self._registry = registry
+        self.module = module
+        self.prefix = prefix
+        self.required = required
+
+    def _qualify(self, name: str) -> str:
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def __getitem__(self, name: str) -> Query:
+        return self._registry.get(self.module, self._qualify(name))
+
+    def missing(self) -> List[str]:
+        return [
+            self._qualify(name)
+            for name in self.required
+            if not self._registry.has(self.module, self._qualify(name))
+        ]
+
+
+class QueryRegistry:
+    """
+    Loads every `modules/**/queries/**/*.sql` file once (at API startup)
+    and serves them to the repositories as immutable Query objects.
+    """
+
+    def __init__(self, root: Path = MODULES_PATH):
+        self.root = root
+        self._queries: Dict[Tuple[str, str], Query] = {}
+        self._bindings: List[QuerySet] = []
+        self._loaded = False
+
+    def bind(self, module: str, prefix: str = "", required: Iterable[str] = ()) -> QuerySet:
+        """Returns a module-scoped view. Called at import time by repositories."""
+        query_set = QuerySet(self, module, prefix, tuple(required))
+        self._bindings.append(query_set)
+        return query_set
+
+    def load(self) -> None:
+        """
+        Reads and validates all query files.
+        Raises QueryRegistryError on any malformed or missing query.
+        """
+        started = time.perf_counter()
+        queries: Dict[Tuple[str, str], Query] = {}
+        errors: List[str] = []
+        for queries_dir in sorted(self.root.rglob("queries")):
+            if not queries_dir.is_dir():
+                continue
+            module = queries_dir.parent.relative_to(self.root).as_posix()
+            for sql_file in sorted(queries_dir.rglob("*.sql")):
+                name = sql_file.relative_to(queries_dir).with_suffix("").as_posix()
+                try:
+                    queries[(module, name)] = self._parse(module, name, sql_file)
+                except QueryRegistryError as e:
+                    errors.append(str(e))
+
+        self._queries = queries
+        self._loaded = True
+        for query_set in self._bindings:
+            errors.extend(
+                f"{query_set.module}:{name}: query file not found"
+                for name in query_set.missing()
+            )
+        if errors:
+            self._loaded = False
+            raise QueryRegistryError(
+                "Invalid SQL query registry:\n  " + "\n  ".join(errors)
+            )
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        per_module = Counter(module for module, _ in queries)
+        logger.info(
+            f"Loaded {len(queries)} SQL queries in {elapsed_ms:.1f}ms "
+            f"({', '.join(f'{m}={c}' for m, c in sorted(per_module.items()))})"
+        )
+
+    def has(self, module: str, name: str) -> bool:
+        return (module, name) in self._queries
+
+    def get(self, module: str, name: str) -> Query:
+        if not self._loaded:
+            raise QueryRegistryError("Query registry has not been loaded.")
+        try:
+            return self._queries[(module, name)]
+        except KeyError:
+            raise QueryRegistryError(f"Unknown query '{module}:{name}'")
+
+    @staticmethod
+    def _parse(module: str, name: str, sql_file: Path) -> Query:
+        key = f"{module}:{name}"
+        try:
+            sql = sql_file.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            raise QueryRegistryError(f"{key}: unreadable ({e})")
+
+        code = _strip_comments_and_literals(sql)
+        if not code.strip().rstrip(";").strip():
+            raise QueryRegistryError(f"{key}: file is empty")
+        if ";" in code.strip().rstrip(";"):
+            raise QueryRegistryError(f"{key}: more than one statement")
+        stray = PLACEHOLDER_RE.sub("", sql).replace("%%", "")
+        if "%" in stray:
+            raise QueryRegistryError(f"{key}: malformed placeholder (use %(name)s)")
+
+        return Query(
+            module=module,
+            name=name,
+            sql=sql,
+            params=frozenset(PLACEHOLDER_RE.findall(sql)),
+            prepare_threshold=_parse_prepare_directive(key, sql),
+        )
+
+
+def _parse_prepare_directive(key: str, sql: str) -> Optional[int]:
+    """
+    Reads an optional `-- prepare: <n|off>` header.
+    Without one, the query uses DB_PREPARE_THRESHOLD.
+    """
+    match = PREPARE_DIRECTIVE_RE.search(sql)
+    if not match:
+        return settings.DB_PREPARE_THRESHOLD
+    value = match.group(1).lower()
+    if value == "off":
+        return None
+    if not value.isdigit():
+        raise QueryRegistryError(f"{key}: invalid prepare directive '{value}'")
+    return int(value)
+
+
+def _strip_comments_and_literals(sql: str) -> str:
+    """Blanks out comments and quoted literals so validation only sees SQL code."""
+    out = []
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end == -1 else end
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif ch in ("'", '"'):
+            end = sql.find(ch, i + 1)
+            while end != -1 and sql.startswith(ch * 2, end):
+                end = sql.find(ch, end + 2)
+            i = n if end == -1 else end + 1
+            out.append(" ")
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+query_registry = QueryRegistry()
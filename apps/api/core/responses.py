@@ -0,0 +1,38 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """
+    orjson fallback for the types it does not know.
+    Decimal is written as a string, the same as Pydantic's JSON mode.
+    Models are unpacked through their field dict; the response models have
+    no aliases or custom serializers, so this matches model_dump_json().
+    """
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serializes response content (models, Decimals, datetimes) with orjson."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-backed JSON response for hot read endpoints.
+
+    Returning it directly from a route skips FastAPI's response_model
+    dump/validate/serialize pass, while the route's response_model still
+    documents the schema in OpenAPI. Only use it with content built from
+    trusted (database) data.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
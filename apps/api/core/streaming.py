@@ -0,0 +1,108 @@
+import logging
+import sys
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from db.config import settings
+from apps.api.core.queries import Query
+from apps.api.core.responses import dumps
+
+logger = logging.getLogger(__name__)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+
+@dataclass(frozen=True)
+class RowStream:
+    """
+    A list query plus how to encode its rows: either a mapper to a response
+    model, or the name of a column that already holds the row's final JSON
+    text (Postgres-rendered documents, written out as-is).
+    """
+
+    query: Query
+    params: Dict[str, Any]
+    to_model: Optional[Callable[[Dict[str, Any]], BaseModel]] = None
+    raw_column: Optional[str] = None
+
+
+def stream_format(request: Request, stream: bool = False) -> Optional[str]:
+    """
+    Picks the streaming mode for a list endpoint.
+    'ndjson' when the client accepts NDJSON, 'json' (array) for ?stream=true,
+    None for the regular buffered response.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return "ndjson"
+    if stream:
+        return "json"
+    return None
+
+
+async def stream_response(
+    request: Request,
+    rows: RowStream,
+    fmt: str,
+    chunk_size: Optional[int] = None,
+    read_only: bool = False,
+) -> StreamingResponse:
+    """
+    Runs `rows.query` on a server-side cursor and streams it out chunk by chunk.
+    The statement and the first fetch run before the response starts, so query
+    errors still surface as a regular 500. The connection is held (on its own,
+    outside the request dependency) until the last chunk is written.
+    With `read_only` it comes from the read replica when one is usable.
+    """
+    chunk_size = chunk_size or settings.API_STREAM_CHUNK_SIZE
+    stack = AsyncExitStack()
+    try:
+        source = (
+            request.app.state.read_router.read_connection()
+            if read_only
+            else request.app.state.pool.connection()
+        )
+        conn = await stack.enter_async_context(source)
+        cur = await stack.enter_async_context(conn.cursor(name="api_stream"))
+        await cur.execute(rows.query.sql, rows.params)
+        first_chunk = await cur.fetchmany(chunk_size)
+    except BaseException:
+        await stack.__aexit__(*sys.exc_info())
+        raise
+
+    async def body() -> AsyncIterator[bytes]:
+        async with stack:
+            sent = 0
+            chunk = first_chunk
+            try:
+                if fmt == "json":
+                    yield b"["
+                while chunk:
+                    yield _encode_chunk(chunk, rows, fmt, first=sent == 0)
+                    sent += len(chunk)
+                    if len(chunk) < chunk_size:
+                        break
+                    chunk = await cur.fetchmany(chunk_size)
+                if fmt == "json":
+                    yield b"]"
+            except Exception as e:
+                logger.exception(f"Stream of {rows.query.key} aborted after {sent} rows: {e}")
+                raise
+            logger.debug(f"Streamed {sent} rows of {rows.query.key} as {fmt}")
+
+    media_type = NDJSON_MEDIA_TYPE if fmt == "ndjson" else JSON_MEDIA_TYPE
+    return StreamingResponse(body(), media_type=media_type)
+
+
+def _encode_chunk(
+    chunk: List[Dict[str, Any]], rows: RowStream, fmt: str, first: bool
+) -> bytes:
+    if rows.raw_column:
+        encoded = [row[rows.raw_column].encode() for row in chunk]
+    else:
+        encoded = [dumps(rows.to_model(row)) for row in chunk]
+    if fmt == "ndjson":
+        return b"\n".join(encoded) + b"\n"
+    return (b"" if first else b",") + b",".join(encoded)
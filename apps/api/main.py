@@ -1,12 +1,14 @@
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from db.config import settings
-from db.connection import create_db_pool
+from db.connection import create_db_pool, log_pool_stats, pool_stats
+from db.prepared import stats as prepared_stats
 
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
@@ -17,6 +19,13 @@ from apps.api.modules.staff.routers import router as staff_router
 from apps.api.modules.orders.router import router as order_router
 from apps.api.modules.reviews.router import router as review_router
 from apps.api.modules.analytics.router import router as analytics_router
+from apps.api.modules.kitchen.router import router as kitchen_router
+from apps.api.modules.pages.router import router as pages_router
+from apps.api.core.cache import analytics_cache
+from apps.api.core.compression import CompressionMiddleware
+from apps.api.core.database import ReadYourWritesMiddleware, create_read_router
+from apps.api.core.events import create_order_event_broker
+from apps.api.core.queries import query_registry
 from packages.common.src.log_config import setup_logging
 
 setup_logging(app_name="api", log_dir=Path("logs"))
@@ -28,9 +37,29 @@ class StateFastAPI(FastAPI):
 @asynccontextmanager
 async def lifespan(application: StateFastAPI):
     logger.info("Application starting up...")
+    query_registry.load()
     application.state.pool = await create_db_pool()
+    pool_monitor = None
+    if settings.DB_POOL_STATS_INTERVAL > 0:
+        pool_monitor = asyncio.create_task(
+            log_pool_stats(application.state.pool, settings.DB_POOL_STATS_INTERVAL)
+        )
+    application.state.read_router = await create_read_router(application.state.pool)
+    if application.state.read_router.replica is not None:
+        analytics_cache.settle_seconds = settings.DB_READ_MAX_LAG
+    application.state.order_events = create_order_event_broker()
+    application.state.order_events.add_listener(
+        lambda event: analytics_cache.invalidate(f"order_changes {event['op']}")
+    )
+    await application.state.order_events.start()
     yield
     logger.info("Application shutting down...")
+    if pool_monitor is not None:
+        pool_monitor.cancel()
+    if hasattr(application.state, "order_events"):
+        await application.state.order_events.stop()
+    if hasattr(application.state, "read_router"):
+        await application.state.read_router.stop()
     if hasattr(application.state, "pool"):
         await application.state.pool.close()
         logger.info("Database connection pool closed.")
@@ -48,6 +77,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadYourWritesMiddleware)
+
+if settings.API_COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.API_COMPRESSION_MIN_SIZE,
+        gzip_level=settings.API_GZIP_LEVEL,
+        brotli_quality=settings.API_BROTLI_QUALITY,
+    )
 
 app.include_router(menu_router, prefix="/api/v1")
 app.include_router(customer_router, prefix="/api/v1")
@@ -56,11 +94,33 @@ app.include_router(staff_router, prefix="/api/v1")
 app.include_router(order_router, prefix="/api/v1")
 app.include_router(review_router, prefix="/api/v1")
 app.include_router(analytics_router, prefix="/api/v1")
+app.include_router(kitchen_router, prefix="/api/v1")
+app.include_router(pages_router, prefix="/api/v1")
 
 @app.get("/api/v1/health")
 def health_check():
     return {"status": "ok", "app": settings.PROJECT_NAME}
 
+@app.get("/api/v1/health/prepared")
+def prepared_statements_stats():
+    """Executions run as prepared / plain statements (per query) in this process."""
+    return prepared_stats.snapshot()
+
+@app.get("/api/v1/health/pool")
+def database_pool_stats(request: Request):
+    """Database connection pool usage (in use/idle/waiting) and counters since startup."""
+    return pool_stats(request.app.state.pool)
+
+@app.get("/api/v1/health/replica")
+def read_replica_status(request: Request):
+    """Where reads are routed (replica or primary), the replica's lag and its pool usage."""
+    return request.app.state.read_router.snapshot()
+
+@app.get("/api/v1/health/cache")
+def analytics_cache_stats():
+    """Analytics result cache counters (hits/misses/invalidations) for this process."""
+    return analytics_cache.snapshot()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("apps.api.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -22,6 +22,20 @@ from packages.common.src.models.orders_models import (
     OrderResponse,
     OrderItemCreate,
     OrderItemResponse,
+    OrderChanges,
+)
+from packages.common.src.models.kitchen_models import (
+    KitchenTicket,
+    KitchenTicketItem,
+    KitchenTickets,
+)
+from packages.common.src.models.pages_models import (
+    DishOption,
+    FreeTable,
+    NamedOption,
+    OrdersPage,
+    ReviewableItem,
+    ReviewsPage,
 )
 from packages.common.src.models.reviews_models import (
     ReviewCreate,
@@ -55,6 +69,16 @@ __all__ = [
     "OrderResponse",
     "OrderItemCreate",
     "OrderItemResponse",
+    "OrderChanges",
+    "KitchenTicket",
+    "KitchenTicketItem",
+    "KitchenTickets",
+    "DishOption",
+    "FreeTable",
+    "NamedOption",
+    "OrdersPage",
+    "ReviewableItem",
+    "ReviewsPage",
     "ReviewCreate",
     "ReviewResponse",
     "ReviewUpdate",
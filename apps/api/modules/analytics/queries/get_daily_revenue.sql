@@ -1,9 +1,33 @@
+-- Revenue per time bucket inside [start, end).
+-- Closed orders come from the daily rollup unless use_rollups is off
+-- (hourly buckets or a category filter), in which case they are read
+-- from pedido like the open orders, one index range on (status, data_pedido).
+WITH sales AS (
+    SELECT r.dia::timestamp AS instante, r.total_pedidos, r.receita_total
+    FROM resumo_vendas_diario r
+    WHERE %(use_rollups)s
+        AND r.dia >= %(start)s::date
+        AND r.dia < %(end)s::date
+    UNION ALL
+    SELECT p.data_pedido, 1, COALESCE(c.receita, p.valor_total)
+    FROM pedido p
+        LEFT JOIN LATERAL (
+            SELECT SUM(ip.quantidade * pr.preco) AS receita
+            FROM item_pedido ip
+                JOIN prato pr ON pr.id_prato = ip.id_prato
+            WHERE ip.id_pedido = p.id_pedido
+                AND pr.categoria = %(category)s::text
+        ) c ON %(category)s::text IS NOT NULL
+    WHERE p.status = ANY(%(statuses)s)
+        AND p.data_pedido >= %(start)s
+        AND p.data_pedido < %(end)s
+        AND (%(category)s::text IS NULL OR c.receita IS NOT NULL)
+)
 SELECT
-    DATE(data_pedido) as data,
-    COUNT(id_pedido) as total_pedidos,
-    SUM(valor_total) as receita_total
-FROM pedido
-WHERE status != 'CANCELADO'
-GROUP BY DATE(data_pedido)
-ORDER BY DATE(data_pedido) DESC
-LIMIT 30;
\ No newline at end of file
+    date_trunc(%(bucket)s::text, instante) as periodo,
+    SUM(total_pedidos) as total_pedidos,
+    SUM(receita_total) as receita_total
+FROM sales
+GROUP BY 1
+ORDER BY 1 DESC
+LIMIT %(limit)s;
@@ -1,12 +1,39 @@
-SELECT
-    p.nome as nome_prato,
-    p.categoria,
-    SUM(ip.quantidade) as total_vendido,
-    SUM(ip.quantidade * p.preco) as receita_estimada
-FROM item_pedido ip
-JOIN prato p ON ip.id_prato = p.id_prato
-JOIN pedido ped ON ip.id_pedido = ped.id_pedido
-WHERE ped.status != 'CANCELADO'
-GROUP BY p.id_prato, p.nome, p.categoria, p.preco
-ORDER BY total_vendido DESC
-LIMIT 10;
\ No newline at end of file
+-- Best selling dishes inside [start, end), top `limit` per time bucket
+-- (a single ranking when no bucket is given).
+-- Closed orders come from the per-dish rollup unless use_rollups is off
+-- (hourly buckets); open orders are always read live.
+WITH sold AS (
+    SELECT r.dia::timestamp AS instante, r.id_prato, r.quantidade_vendida AS quantidade, r.receita
+    FROM resumo_prato_diario r
+    WHERE %(use_rollups)s
+        AND r.dia >= %(start)s::date
+        AND r.dia < %(end)s::date
+    UNION ALL
+    SELECT p.data_pedido, ip.id_prato, ip.quantidade, ip.quantidade * pr.preco
+    FROM pedido p
+        JOIN item_pedido ip ON ip.id_pedido = p.id_pedido
+        JOIN prato pr ON pr.id_prato = ip.id_prato
+    WHERE p.status = ANY(%(statuses)s)
+        AND p.data_pedido >= %(start)s
+        AND p.data_pedido < %(end)s
+),
+ranked AS (
+    SELECT
+        date_trunc(%(bucket)s::text, s.instante) as periodo,
+        p.nome as nome_prato,
+        p.categoria,
+        SUM(s.quantidade) as total_vendido,
+        SUM(s.receita) as receita_estimada,
+        ROW_NUMBER() OVER (
+            PARTITION BY date_trunc(%(bucket)s::text, s.instante)
+            ORDER BY SUM(s.quantidade) DESC, p.nome
+        ) as posicao
+    FROM sold s
+        JOIN prato p ON s.id_prato = p.id_prato
+    WHERE %(category)s::text IS NULL OR p.categoria = %(category)s::text
+    GROUP BY 1, p.id_prato, p.nome, p.categoria
+)
+SELECT periodo, nome_prato, categoria, total_vendido, receita_estimada
+FROM ranked
+WHERE posicao <= %(limit)s
+ORDER BY periodo DESC NULLS FIRST, posicao;
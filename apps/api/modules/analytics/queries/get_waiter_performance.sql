@@ -1,8 +1,44 @@
-SELECT
-    g.nome as nome_garcom,
-    COUNT(p.id_pedido) as total_pedidos,
-    COALESCE(SUM(p.valor_total), 0) as total_vendas
-FROM garcom g
-LEFT JOIN pedido p ON g.id_funcionario = p.id_funcionario AND p.status != 'CANCELADO'
-GROUP BY g.id_funcionario, g.nome
-ORDER BY total_vendas DESC;
\ No newline at end of file
+-- Sales per waiter inside [start, end), per time bucket when one is given.
+-- Closed orders come from the per-waiter rollup unless use_rollups is off
+-- (hourly buckets or a category filter); open orders are always read live.
+-- Without a bucket, waiters with no sales are listed with zeros.
+WITH sales AS (
+    SELECT r.dia::timestamp AS instante, r.id_funcionario, r.total_pedidos, r.total_vendas
+    FROM resumo_garcom_diario r
+    WHERE %(use_rollups)s
+        AND r.dia >= %(start)s::date
+        AND r.dia < %(end)s::date
+    UNION ALL
+    SELECT p.data_pedido, p.id_funcionario, 1, COALESCE(c.receita, p.valor_total)
+    FROM pedido p
+        LEFT JOIN LATERAL (
+            SELECT SUM(ip.quantidade * pr.preco) AS receita
+            FROM item_pedido ip
+                JOIN prato pr ON pr.id_prato = ip.id_prato
+            WHERE ip.id_pedido = p.id_pedido
+                AND pr.categoria = %(category)s::text
+        ) c ON %(category)s::text IS NOT NULL
+    WHERE p.status = ANY(%(statuses)s)
+        AND p.data_pedido >= %(start)s
+        AND p.data_pedido < %(end)s
+        AND (%(category)s::text IS NULL OR c.receita IS NOT NULL)
+),
+ranked AS (
+    SELECT
+        date_trunc(%(bucket)s::text, s.instante) as periodo,
+        g.nome as nome_garcom,
+        COALESCE(SUM(s.total_pedidos), 0) as total_pedidos,
+        COALESCE(SUM(s.total_vendas), 0) as total_vendas,
+        ROW_NUMBER() OVER (
+            PARTITION BY date_trunc(%(bucket)s::text, s.instante)
+            ORDER BY COALESCE(SUM(s.total_vendas), 0) DESC, g.nome
+        ) as posicao
+    FROM garcom g
+        LEFT JOIN sales s ON g.id_funcionario = s.id_funcionario
+    WHERE %(bucket)s::text IS NULL OR s.instante IS NOT NULL
+    GROUP BY 1, g.id_funcionario, g.nome
+)
+SELECT periodo, nome_garcom, total_pedidos, total_vendas
+FROM ranked
+WHERE posicao <= COALESCE(%(limit)s::int, posicao)
+ORDER BY periodo DESC NULLS FIRST, posicao;
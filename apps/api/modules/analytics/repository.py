@@ -1,88 +1,195 @@
-from typing import List
-from pathlib import Path
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional
 import logging
 from packages.common.src.models.analytics_models import (
     DailyRevenue,
     DishPopularity,
     WaiterPerformance,
 )
+from apps.api.core.cache import analytics_cache
+from apps.api.core.queries import Query, query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind(
+    "analytics",
+    required=("get_daily_revenue", "get_top_dishes", "get_waiter_performance"),
+)
 
 
 class AnalyticsRepository:
     """
     Repository for Analytical Read-Only operations.
     Aggregates data for dashboards.
+    Results are cached in-process until an order write invalidates them.
     """
 
     def __init__(self, db_connection):
         self.conn = db_connection
 
-    async def get_daily_revenue(self) -> List[DailyRevenue]:
+    @staticmethod
+    def _range_params(
+        date_from: Optional[date],
+        date_to: Optional[date],
+        bucket: Optional[str],
+        category: Optional[str],
+        limit: Optional[int],
+        use_rollups: bool,
+    ) -> Dict[str, Any]:
+        """
+        Builds the shared parameters of the analytics queries.
+        The range is [date_from 00:00, date_to + 1 day), either end open.
+        The daily rollups only hold closed orders at day resolution, so when
+        they cannot answer, closed orders are read from pedido instead.
+        """
+        start = datetime.combine(date_from or date.min, time.min)
+        end = (
+            datetime.combine(date_to + timedelta(days=1), time.min)
+            if date_to
+            else datetime.max
+        )
+        return {
+            "start": start,
+            "end": end,
+            "bucket": bucket,
+            "category": category,
+            "limit": limit,
+            "use_rollups": use_rollups,
+            "statuses": ["ABERTO"] if use_rollups else ["ABERTO", "FECHADO"],
+        }
+
+    async def _fetch_all(self, query: Query, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Runs `query` through the analytics cache, keyed by query and parameters."""
+        key = (query.key,) + tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(params.items())
+        )
+
+        async def load():
+            async with self.conn.cursor() as cur:
+                await query.execute(cur, params)
+                return await cur.fetchall()
+
+        return await analytics_cache.get_or_load(key, load)
+
+    async def get_daily_revenue(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        bucket: str = "day",
+        category: Optional[str] = None,
+        limit: Optional[int] = 30,
+    ) -> List[DailyRevenue]:
         """
-        Fetches revenue aggregated by day for the last 30 days.
+        Fetches revenue aggregated per time bucket, latest buckets first.
+        By default, the last 30 days with sales.
+
+        Args:
+            date_from (Optional[date]): First day included.
+            date_to (Optional[date]): Last day included.
+            bucket (str): One of hour, day, week, month.
+            category (Optional[str]): Only count items of this dish category.
+            limit (Optional[int]): Maximum buckets returned.
 
         Returns:
-            List[DailyRevenue]: List of daily stats.
+            List[DailyRevenue]: List of per-bucket stats.
         """
-        sql_file = QUERY_PATH / "get_daily_revenue.sql"
-        query = sql_file.read_text()
-
-        async with self.conn.cursor() as cur:
-            await cur.execute(query)
-            rows = await cur.fetchall()
-            return [
-                DailyRevenue(
-                    data=row["data"],
-                    quantidade_ordem=row["total_pedidos"],
-                    receita_total=row["receita_total"] or 0,
-                )
-                for row in rows
-            ]
-
-    async def get_top_dishes(self) -> List[DishPopularity]:
+        query = QUERIES["get_daily_revenue"]
+        params = self._range_params(
+            date_from,
+            date_to,
+            bucket,
+            category,
+            limit,
+            use_rollups=bucket != "hour" and category is None,
+        )
+
+        rows = await self._fetch_all(query, params)
+        return [
+            DailyRevenue(
+                data=row["periodo"].date(),
+                periodo=row["periodo"],
+                quantidade_ordem=row["total_pedidos"],
+                receita_total=row["receita_total"] or 0,
+            )
+            for row in rows
+        ]
+
+    async def get_top_dishes(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        bucket: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[DishPopularity]:
         """
-        Fetches top 10 selling dishes.
+        Fetches the top selling dishes, all-time by default.
+
+        Args:
+            date_from (Optional[date]): First day included.
+            date_to (Optional[date]): Last day included.
+            bucket (Optional[str]): Rank per hour, day, week or month.
+            category (Optional[str]): Only rank dishes of this category.
+            limit (int): Dishes returned (per bucket, when given).
 
         Returns:
             List[DishPopularity]: List of dish stats.
         """
-        sql_file = QUERY_PATH / "get_top_dishes.sql"
-        query = sql_file.read_text()
-
-        async with self.conn.cursor() as cur:
-            await cur.execute(query)
-            rows = await cur.fetchall()
-            return [
-                DishPopularity(
-                    nome_prato=row["nome_prato"],
-                    categoria=row["categoria"],
-                    quantidade_vendida=row["total_vendido"],
-                    receita_estimada=row["receita_estimada"] or 0,
-                )
-                for row in rows
-            ]
-
-    async def get_waiter_performance(self) -> List[WaiterPerformance]:
+        query = QUERIES["get_top_dishes"]
+        params = self._range_params(
+            date_from, date_to, bucket, category, limit, use_rollups=bucket != "hour"
+        )
+
+        rows = await self._fetch_all(query, params)
+        return [
+            DishPopularity(
+                periodo=row["periodo"],
+                nome_prato=row["nome_prato"],
+                categoria=row["categoria"],
+                quantidade_vendida=row["total_vendido"],
+                receita_estimada=row["receita_estimada"] or 0,
+            )
+            for row in rows
+        ]
+
+    async def get_waiter_performance(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        bucket: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[WaiterPerformance]:
         """
-        Fetches sales performance per waiter.
+        Fetches sales performance per waiter, all-time by default.
+
+        Args:
+            date_from (Optional[date]): First day included.
+            date_to (Optional[date]): Last day included.
+            bucket (Optional[str]): Report per hour, day, week or month.
+            category (Optional[str]): Only count items of this dish category.
+            limit (Optional[int]): Waiters returned (per bucket, when given).
 
         Returns:
             List[WaiterPerformance]: List of waiter stats.
         """
-        sql_file = QUERY_PATH / "get_waiter_performance.sql"
-        query = sql_file.read_text()
-
-        async with self.conn.cursor() as cur:
-            await cur.execute(query)
-            rows = await cur.fetchall()
-            return [
-                WaiterPerformance(
-                    nome_garcom=row["nome_garcom"],
-                    pedidos_atentidos=row["total_pedidos"],
-                    vendas_totais=row["total_vendas"],
-                )
-                for row in rows
-            ]
\ No newline at end of file
+        query = QUERIES["get_waiter_performance"]
+        params = self._range_params(
+            date_from,
+            date_to,
+            bucket,
+            category,
+            limit,
+            use_rollups=bucket != "hour" and category is None,
+        )
+
+        rows = await self._fetch_all(query, params)
+        return [
+            WaiterPerformance(
+                periodo=row["periodo"],
+                nome_garcom=row["nome_garcom"],
+                pedidos_atentidos=row["total_pedidos"],
+                vendas_totais=row["total_vendas"],
+            )
+            for row in rows
+        ]
\ No newline at end of file
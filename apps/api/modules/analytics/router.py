@@ -1,34 +1,52 @@
 import logging
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+from datetime import date
+from typing import Any, Dict, List, Literal, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from packages.common.src.models.analytics_models import (
     DailyRevenue,
     DishPopularity,
     WaiterPerformance,
 )
 from apps.api.modules.analytics.repository import AnalyticsRepository
+from apps.api.core.database import get_read_connection
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 logger = logging.getLogger(__name__)
+Bucket = Literal["hour", "day", "week", "month"]
 
-async def get_db_connection(request: Request):
+def get_repository(conn=Depends(get_read_connection)):
     """
-    Acquires an asynchronous connection from the pool attached to the app state.
+    Dependency injection for AnalyticsRepository.
+    Analytics only read, so they run on the read replica when one is usable.
     """
-    async with request.app.state.pool.connection() as conn:
-        yield conn
-
-def get_repository(conn=Depends(get_db_connection)):
-    """Dependency injection for AnalyticsRepository."""
     return AnalyticsRepository(conn)
 
+def get_range(
+    date_from: Optional[date] = Query(None, alias="from", description="First day included"),
+    date_to: Optional[date] = Query(None, alias="to", description="Last day included"),
+    category: Optional[str] = Query(None, description="Only count dishes of this category"),
+) -> Dict[str, Any]:
+    """Shared time range / category filters of the analytics endpoints."""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'",
+        )
+    return {"date_from": date_from, "date_to": date_to, "category": category}
+
 @router.get("/revenue", response_model=List[DailyRevenue])
-async def get_revenue_stats(repo: AnalyticsRepository = Depends(get_repository)):
+async def get_revenue_stats(
+    filters: Dict[str, Any] = Depends(get_range),
+    bucket: Bucket = Query("day", description="Time bucket size"),
+    limit: int = Query(30, ge=1, le=1000, description="Latest buckets returned"),
+    repo: AnalyticsRepository = Depends(get_repository),
+):
     """
-    Get daily revenue statistics for the last 30 days.
+    Get revenue statistics per time bucket, latest first.
+    Defaults to the last 30 days with sales.
     """
     try:
-        return await repo.get_daily_revenue()
+        return await repo.get_daily_revenue(bucket=bucket, limit=limit, **filters)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -39,12 +57,17 @@ async def get_revenue_stats(repo: AnalyticsRepository = Depends(get_repository))
         )
 
 @router.get("/popular-dishes", response_model=List[DishPopularity])
-async def get_popular_dishes(repo: AnalyticsRepository = Depends(get_repository)):
+async def get_popular_dishes(
+    filters: Dict[str, Any] = Depends(get_range),
+    bucket: Optional[Bucket] = Query(None, description="Rank per time bucket"),
+    limit: int = Query(10, ge=1, le=100, description="Dishes returned (per bucket)"),
+    repo: AnalyticsRepository = Depends(get_repository),
+):
     """
-    Get top 10 most popular dishes based on quantity sold.
+    Get the most popular dishes based on quantity sold (top 10, all-time by default).
     """
     try:
-        return await repo.get_top_dishes()
+        return await repo.get_top_dishes(bucket=bucket, limit=limit, **filters)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -55,12 +78,17 @@ async def get_popular_dishes(repo: AnalyticsRepository = Depends(get_repository)
         )
 
 @router.get("/staff-performance", response_model=List[WaiterPerformance])
-async def get_staff_stats(repo: AnalyticsRepository = Depends(get_repository)):
+async def get_staff_stats(
+    filters: Dict[str, Any] = Depends(get_range),
+    bucket: Optional[Bucket] = Query(None, description="Report per time bucket"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Waiters returned (per bucket)"),
+    repo: AnalyticsRepository = Depends(get_repository),
+):
     """
     Get performance statistics (orders handled, total sales) for waiters.
     """
     try:
-        return await repo.get_waiter_performance()
+        return await repo.get_waiter_performance(bucket=bucket, limit=limit, **filters)
     except HTTPException as e:
         raise e
     except Exception as e:
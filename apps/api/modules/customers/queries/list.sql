@@ -0,0 +1,5 @@
+SELECT c.id_cliente, c.nome, c.telefone, c.email
+FROM cliente c
+WHERE c.id_cliente > %(after)s
+ORDER BY c.id_cliente
+LIMIT %(limit)s;
@@ -3,13 +3,22 @@ SELECT
     c.nome,
     c.telefone,
     c.email,
-    COALESCE(
+    COALESCE(o.pedidos, '[]'::jsonb) as pedidos
+FROM (
+    SELECT id_cliente, nome, telefone, email
+    FROM cliente
+    WHERE id_cliente > %(after)s
+    ORDER BY id_cliente
+    LIMIT %(limit)s
+) c
+LEFT JOIN LATERAL (
+    SELECT
         jsonb_agg(
             jsonb_build_object(
                 'id', p.id_pedido,
                 'id_cliente', c.id_cliente,
                 'criado_em', p.data_pedido,
-                'valor_total', p.valor_total,
+                'valor_total', p.valor_total::text,
                 'status', p.status,
                 'quantidade_cliente', p.quantidade_pessoas,
                 'nome_cliente', c.nome,
@@ -26,8 +35,8 @@ SELECT
                                 'quantidade', ip.quantidade,
                                 'observacoes', ip.observacao,
                                 'nome_prato', pr.nome,
-                                'preco_unitario', pr.preco,
-                                'preco_total', (ip.quantidade * pr.preco)
+                                'preco_unitario', pr.preco::text,
+                                'preco_total', (ip.quantidade * pr.preco)::text
                             )
                         )
                         FROM item_pedido ip
@@ -37,12 +46,15 @@ SELECT
                     '[]'::jsonb
                 )
             ) ORDER BY p.data_pedido DESC
-        ) FILTER (WHERE p.id_pedido IS NOT NULL),
-        '[]'
-    ) as pedidos
-FROM cliente c
-LEFT JOIN pedido p ON c.id_cliente = p.id_cliente
-LEFT JOIN mesa m ON p.id_mesa = m.id_mesa
-LEFT JOIN garcom g ON p.id_funcionario = g.id_funcionario
-GROUP BY c.id_cliente, c.nome, c.telefone, c.email
-ORDER BY c.nome;
\ No newline at end of file
+        ) as pedidos
+    FROM (
+        SELECT id_pedido, data_pedido, valor_total, status, quantidade_pessoas, id_mesa, id_funcionario
+        FROM pedido
+        WHERE id_cliente = c.id_cliente
+        ORDER BY data_pedido DESC
+        LIMIT %(orders_limit)s
+    ) p
+    JOIN mesa m ON p.id_mesa = m.id_mesa
+    JOIN garcom g ON p.id_funcionario = g.id_funcionario
+) o ON TRUE
+ORDER BY c.id_cliente;
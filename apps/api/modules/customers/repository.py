@@ -1,12 +1,13 @@
-from typing import List
-from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import logging
-import json
 from packages.common.src.models.customers_models import CustomerCreate, CustomerResponse
 from packages.common.src.models.orders_models import OrderResponse
+from apps.api.core.fields import FieldSet, shaped
+from apps.api.core.queries import Query, query_registry
+from apps.api.core.streaming import RowStream
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind("customers", required=("create", "list", "list_with_orders"))
 
 
 class CustomerRepository:
@@ -19,14 +20,13 @@ class CustomerRepository:
         """
         Register a new customer in the database.
         """
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(f"Creating customer: {customer.nome}")
             try:
-                await cur.execute(
-                    query,
+                await query.execute(
+                    cur,
                     {
                         "name": customer.nome,
                         "phone": customer.telefone,
@@ -51,30 +51,60 @@ class CustomerRepository:
                 logger.error(f"Error creating customer: {e}")
                 raise e
 
-    async def get_all_customers(self) -> List[CustomerResponse]:
+    @staticmethod
+    def _list_query(
+        after: int, limit: Optional[int], include_orders: bool, orders_limit: int
+    ) -> Tuple[Query, Dict[str, Any]]:
+        params: Dict[str, Any] = {"after": after, "limit": limit}
+        if include_orders:
+            params["orders_limit"] = orders_limit
+            return QUERIES["list_with_orders"], params
+        return QUERIES["list"], params
+
+    @staticmethod
+    def _map_row_to_response(row) -> CustomerResponse:
+        """
+        Helper to map a DB row (optionally with 'pedidos') to CustomerResponse.
+        The customer columns come straight from typed DB columns, so the model
+        is built without validation (EmailStr checks dominate otherwise);
+        nested orders (jsonb) are still validated.
+        """
+        orders_data = row.get("pedidos")
+        if orders_data is None:
+            orders_data = []
+        return CustomerResponse.model_construct(
+            id=row["id_cliente"],
+            nome=row["nome"],
+            telefone=row["telefone"],
+            email=row["email"],
+            pedidos=[OrderResponse(**o) for o in orders_data],
+        )
+
+    async def get_customers(
+        self,
+        after: int = 0,
+        limit: int = 100,
+        include_orders: bool = False,
+        orders_limit: int = 20,
+    ) -> List[CustomerResponse]:
         """
-        Fetch all registered customers with their full order history.
+        Fetch one keyset page of customers (id > after, ordered by id).
+        Orders are only joined in when requested, capped per customer.
         """
-        sql_file = QUERY_PATH / "list_populated.sql"
-        query = sql_file.read_text()
+        query, params = self._list_query(after, limit, include_orders, orders_limit)
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur, params)
             rows = await cur.fetchall()
-            results = []
-            for row in rows:
-                orders_data = row["pedidos"]
-                if isinstance(orders_data, str):
-                    orders_data = json.loads(orders_data)
-                if orders_data is None:
-                    orders_data = []
-                orders_list = [OrderResponse(**o) for o in orders_data]
-                results.append(
-                    CustomerResponse(
-                        id=row["id_cliente"],
-                        nome=row["nome"],
-                        telefone=row["telefone"],
-                        email=row["email"],
-                        pedidos=orders_list,
-                    )
-                )
-            return results
\ No newline at end of file
+            return [self._map_row_to_response(row) for row in rows]
+
+    def stream_customers(
+        self,
+        after: int = 0,
+        limit: Optional[int] = None,
+        include_orders: bool = False,
+        orders_limit: int = 20,
+        fields: Optional[FieldSet] = None,
+    ) -> RowStream:
+        """Same listing as get_customers for the streaming path; limit=None means all."""
+        query, params = self._list_query(after, limit, include_orders, orders_limit)
+        return RowStream(query, params, shaped(fields, self._map_row_to_response))
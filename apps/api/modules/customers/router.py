@@ -1,11 +1,17 @@
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends, Request
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Query
+from typing import List, Literal, Optional
 from packages.common.src.models.customers_models import CustomerCreate, CustomerResponse
 from apps.api.modules.customers.repository import CustomerRepository
+from apps.api.core.database import get_read_connection
+from apps.api.core.fields import FieldSet, sparse_fields, wants
+from apps.api.core.streaming import stream_format, stream_response
+from apps.api.core.responses import FastJSONResponse
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 logger = logging.getLogger(__name__)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
 async def get_db_connection(request: Request):
     async with request.app.state.pool.connection() as conn:
@@ -15,13 +21,64 @@ def get_repository(conn=Depends(get_db_connection)):
     """Dependency to provide the CustomerRepository."""
     return CustomerRepository(conn)
 
+def get_read_repository(conn=Depends(get_read_connection)):
+    """CustomerRepository on the read replica, for the list endpoint."""
+    return CustomerRepository(conn)
+
 @router.get("/", response_model=List[CustomerResponse])
-async def list_customers(repo: CustomerRepository = Depends(get_repository)):
+async def list_customers(
+    request: Request,
+    after: int = Query(0, ge=0, description="Return customers with id greater than this"),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Page size (default 100, max 500; unbounded when streaming)"
+    ),
+    include: Optional[Literal["orders"]] = Query(None, description="Expand related data"),
+    orders_limit: int = Query(20, ge=1, le=200, description="Latest orders per customer"),
+    stream: bool = Query(False, description="Stream the result as a JSON array"),
+    fields: Optional[FieldSet] = Depends(sparse_fields(CustomerResponse)),
+    repo: CustomerRepository = Depends(get_read_repository),
+):
     """
-    Get all registered customers.
+    Get registered customers, one keyset page at a time.
+    When the page is full, the cursor for the next one is sent in X-Next-After.
+    With ?stream=true or 'Accept: application/x-ndjson' rows are streamed instead.
+    ?fields= / ?exclude= trim the documents; excluding 'pedidos' skips the orders join.
     """
     try:
-        return await repo.get_all_customers()
+        fmt = stream_format(request, stream)
+        include_orders = include == "orders" and wants(fields, "pedidos")
+        if fmt:
+            return await stream_response(
+                request,
+                repo.stream_customers(
+                    after=after,
+                    limit=limit,
+                    include_orders=include_orders,
+                    orders_limit=orders_limit,
+                    fields=fields,
+                ),
+                fmt,
+                read_only=True,
+            )
+
+        limit = limit or DEFAULT_PAGE_SIZE
+        if limit > MAX_PAGE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"limit must be at most {MAX_PAGE_SIZE} (use streaming for more).",
+            )
+        customers = await repo.get_customers(
+            after=after,
+            limit=limit,
+            include_orders=include_orders,
+            orders_limit=orders_limit,
+        )
+        headers = {}
+        if len(customers) == limit:
+            headers["X-Next-After"] = str(customers[-1].id)
+        if fields:
+            return FastJSONResponse([fields.pick(c) for c in customers], headers=headers)
+        return FastJSONResponse(customers, headers=headers)
     except HTTPException as e:
         raise e
     except Exception as e:
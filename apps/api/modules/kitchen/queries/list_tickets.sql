@@ -0,0 +1,46 @@
+-- prepare: off
+-- Kitchen tickets: open orders with their items, only the columns the kitchen
+-- screen shows. Full sync (active_only) reads the open slice of
+-- idx_pedido_status_data; incremental syncs read idx_pedido_atualizado and also
+-- return orders that left the kitchen (closed, or no items), to be removed,
+-- and the ids of orders deleted since then (pedido_removido).
+-- Items come from idx_item_pedido_pedido.
+SELECT
+    now() AS sincronizado_em,
+    ARRAY(
+        SELECT r.id_pedido
+        FROM pedido_removido r
+        WHERE r.removido_em >= %(since)s
+            AND NOT %(active_only)s
+        ORDER BY r.id_pedido
+    ) AS removidos,
+    t.*
+FROM (SELECT 1) AS one
+    LEFT JOIN LATERAL (
+        SELECT
+            p.id_pedido,
+            p.status,
+            m.numero AS mesa_numero,
+            g.nome AS garcom_nome,
+            floor(extract(epoch FROM LOCALTIMESTAMP - p.data_pedido) / 60)::int AS minutos_espera,
+            i.items
+        FROM pedido p
+            JOIN mesa m ON p.id_mesa = m.id_mesa
+            JOIN garcom g ON p.id_funcionario = g.id_funcionario
+            LEFT JOIN LATERAL (
+                SELECT json_agg(
+                    json_build_object(
+                        'quantidade', ip.quantidade,
+                        'nome_prato', pr.nome,
+                        'observacoes', ip.observacao
+                    )
+                    ORDER BY ip.id_item_pedido
+                ) AS items
+                FROM item_pedido ip
+                    JOIN prato pr ON ip.id_prato = pr.id_prato
+                WHERE ip.id_pedido = p.id_pedido
+            ) i ON TRUE
+        WHERE p.atualizado_em >= %(since)s
+            AND (p.status = 'ABERTO' OR NOT %(active_only)s)
+    ) t ON TRUE
+ORDER BY t.id_pedido;
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+from typing import Optional
+import logging
+from packages.common.src.models.kitchen_models import KitchenTicket, KitchenTickets
+from apps.api.core.queries import query_registry
+from apps.api.modules.orders.repositories.order_repository import (
+    CHANGES_OVERLAP,
+    cursor_expired,
+)
+
+logger = logging.getLogger(__name__)
+QUERIES = query_registry.bind("kitchen", required=("list_tickets",))
+
+
+class KitchenRepository:
+    """Read-only repository for the kitchen display."""
+
+    def __init__(self, db_connection):
+        self.conn = db_connection
+
+    async def list_tickets(self, since: Optional[datetime]) -> KitchenTickets:
+        """
+        Open orders that have items, as kitchen tickets.
+        With `since` (a previous 'sincronizado_em'), only orders updated since
+        then; those that no longer make a ticket, deleted ones included, are
+        listed in 'removidos'. A cursor too old for that gets a full sync.
+        """
+        query = QUERIES["list_tickets"]
+        if cursor_expired(since):
+            since = None
+        params = {
+            "since": since - CHANGES_OVERLAP
+            if since
+            else datetime.min.replace(tzinfo=timezone.utc),
+            "active_only": since is None,
+        }
+
+        async with self.conn.cursor() as cur:
+            await query.execute(cur, params)
+            rows = await cur.fetchall()
+
+        tickets, removed = [], list(rows[0]["removidos"])
+        for row in rows:
+            if row["id_pedido"] is None:
+                continue
+            if row["status"] != "ABERTO" or not row["items"]:
+                removed.append(row["id_pedido"])
+                continue
+            tickets.append(
+                KitchenTicket.model_validate(
+                    {
+                        "id_pedido": row["id_pedido"],
+                        "numero_mesa": row["mesa_numero"],
+                        "nome_garcom": row["garcom_nome"],
+                        "minutos_espera": row["minutos_espera"],
+                        "itens": row["items"],
+                    }
+                )
+            )
+        return KitchenTickets(
+            tickets=tickets,
+            removidos=removed,
+            sincronizado_em=rows[0]["sincronizado_em"],
+            completo=since is None,
+        )
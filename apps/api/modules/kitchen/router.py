@@ -0,0 +1,40 @@
+import logging
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from packages.common.src.models.kitchen_models import KitchenTickets
+from apps.api.modules.kitchen.repository import KitchenRepository
+from apps.api.core.responses import FastJSONResponse
+
+router = APIRouter(prefix="/kitchen", tags=["Kitchen"])
+logger = logging.getLogger(__name__)
+
+async def get_db_connection(request: Request):
+    async with request.app.state.pool.connection() as conn:
+        yield conn
+
+def get_repository(conn=Depends(get_db_connection)):
+    """Dependency injection for KitchenRepository."""
+    return KitchenRepository(conn)
+
+@router.get("/tickets", response_model=KitchenTickets)
+async def list_tickets(
+    since: Optional[datetime] = Query(
+        None, description="'sincronizado_em' of the previous sync; omit for a full sync"
+    ),
+    repo: KitchenRepository = Depends(get_repository),
+):
+    """
+    Pending items grouped by open order, with table number, waiting time and notes.
+    With 'since', only tickets changed after that cursor plus the ids to remove.
+    """
+    try:
+        return FastJSONResponse(await repo.list_tickets(since))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error fetching kitchen tickets: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
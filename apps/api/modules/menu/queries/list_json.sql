@@ -0,0 +1,30 @@
+-- One final DishResponse document per dish (JSON passthrough mode).
+-- Keys follow the model's field order; money is emitted as text like Pydantic does.
+SELECT
+    json_build_object(
+        'nome', p.nome,
+        'preco', p.preco::text,
+        'categoria', p.categoria,
+        'id', p.id_prato,
+        'avaliacoes', COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'nota', a.nota,
+                        'comentario', a.comentario,
+                        'id', a.id_avaliacao,
+                        'criado_em', a.data_avaliacao,
+                        'nome_cliente', c.nome,
+                        'nome_prato', p.nome
+                    )
+                    ORDER BY a.data_avaliacao DESC
+                )
+                FROM avaliacao a
+                    JOIN cliente c ON a.id_cliente = c.id_cliente
+                WHERE a.id_prato = p.id_prato
+            ),
+            '[]'::json
+        )
+    )::text as doc
+FROM prato p
+ORDER BY p.nome;
@@ -1,13 +1,17 @@
 from typing import List, Optional
-from pathlib import Path
 import logging
-import json
 
 from packages.common.src.models.menu_models import DishCreate, DishResponse, DishUpdate
-from packages.common.src.models.reviews_models import ReviewResponse
+from apps.api.core.cache import analytics_cache
+from apps.api.core.fields import FieldSet, shaped
+from apps.api.core.queries import query_registry
+from apps.api.core.streaming import RowStream
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind(
+    "menu",
+    required=("categories", "create", "delete", "list_json", "list_populated", "update"),
+)
 
 
 class MenuRepository:
@@ -21,22 +25,21 @@ class MenuRepository:
         Deletes a dish from the database.
         Returns True if a row was deleted, False otherwise.
         """
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": dish_id})
+            await query.execute(cur, {"id": dish_id})
             rows_deleted = cur.rowcount
             await self.conn.commit()
+            analytics_cache.invalidate("dish deleted")
             return rows_deleted > 0
 
     async def get_categories(self) -> List[str]:
         """Fetch all unique categories currently in the database."""
-        sql_file = QUERY_PATH / "categories.sql"
-        query = sql_file.read_text()
+        query = QUERIES["categories"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur)
             rows = await cur.fetchall()
             return [row["categoria"] for row in rows]
 
@@ -44,13 +47,12 @@ class MenuRepository:
         """
         Insert a new dish into the database.
         """
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(f"Creating dish: {dish.nome}")
-            await cur.execute(
-                query,
+            await query.execute(
+                cur,
                 {"name": dish.nome, "price": dish.preco, "category": dish.categoria},
             )
             row = await cur.fetchone()
@@ -65,42 +67,58 @@ class MenuRepository:
                 avaliacoes=[],
             )
 
-    async def get_all_dishes(self) -> List[DishResponse]:
+    @staticmethod
+    def _map_row_to_response(row) -> DishResponse:
+        """
+        Helper to map a populated dish row to DishResponse.
+        Validated in a single model_validate() call: for these small nested
+        models pydantic-core is cheaper than model_construct() per review.
+        """
+        reviews_data = row["reviews"]
+        return DishResponse.model_validate(
+            {
+                "id": row["id_prato"],
+                "nome": row["nome"],
+                "preco": row["preco"],
+                "categoria": row["categoria"],
+                "avaliacoes": reviews_data,
+            }
+        )
+
+    async def get_all_dishes(self, with_reviews: bool = True) -> List[DishResponse]:
         """
         Fetch all dishes populated with their reviews.
+        With with_reviews=False the reviews are not aggregated at all ('avaliacoes' is empty).
         """
-        sql_file = QUERY_PATH / "list_populated.sql"
-        query = sql_file.read_text()
+        query = QUERIES["list_populated"]
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur, {"with_reviews": with_reviews})
             rows = await cur.fetchall()
-            results = []
-            for row in rows:
-                reviews_data = row["reviews"]
-                if isinstance(reviews_data, str):
-                    reviews_data = json.loads(reviews_data)
-                reviews_list = [ReviewResponse(**r) for r in reviews_data]
-                results.append(
-                    DishResponse(
-                        id=row["id_prato"],
-                        nome=row["nome"],
-                        preco=row["preco"],
-                        categoria=row["categoria"],
-                        avaliacoes=reviews_list,
-                    )
-                )
-            return results
+            return [self._map_row_to_response(row) for row in rows]
+
+    def stream_dishes(
+        self, with_reviews: bool = True, fields: Optional[FieldSet] = None
+    ) -> RowStream:
+        """Populated dish listing for the streaming path."""
+        return RowStream(
+            QUERIES["list_populated"],
+            {"with_reviews": with_reviews},
+            shaped(fields, self._map_row_to_response),
+        )
+
+    def stream_dish_documents(self) -> RowStream:
+        """Dishes as Postgres-rendered JSON documents (passthrough mode)."""
+        return RowStream(QUERIES["list_json"], {}, raw_column="doc")
 
     async def update_dish(self, dish_id: int, dish: DishUpdate) -> Optional[DishResponse]:
         """
         Update a dish's details.
         """
-        sql_file = QUERY_PATH / "update.sql"
-        query = sql_file.read_text()
+        query = QUERIES["update"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(
-                query,
+            await query.execute(
+                cur,
                 {
                     "name": dish.nome,
                     "price": dish.preco,
@@ -110,6 +128,7 @@ class MenuRepository:
             )
             row = await cur.fetchone()
             await self.conn.commit()
+            analytics_cache.invalidate("dish updated")
 
             if not row:
                 return None
@@ -1,8 +1,14 @@
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends, Request
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Query, Response
+from typing import List, Optional
 from packages.common.src.models.menu_models import DishCreate, DishResponse, DishUpdate
 from apps.api.modules.menu.repository import MenuRepository
+from apps.api.core.database import get_read_connection
+from apps.api.core.etag import resource_etag, with_etag
+from apps.api.core.fields import FieldSet, sparse_fields, wants
+from apps.api.core.streaming import stream_format, stream_response
+from apps.api.core.responses import FastJSONResponse
+from db.config import settings
 
 router = APIRouter(prefix="/menu", tags=["Menu"])
 logger = logging.getLogger(__name__)
@@ -14,12 +20,22 @@ async def get_db_connection(request: Request):
 def get_repository(conn = Depends(get_db_connection)):
     return MenuRepository(conn)
 
+def get_read_repository(conn = Depends(get_read_connection)):
+    """MenuRepository on the read replica, for the list endpoints."""
+    return MenuRepository(conn)
+
 @router.get("/categories", response_model=List[str])
-async def list_categories(repo: MenuRepository = Depends(get_repository)):
+async def list_categories(
+    response: Response,
+    etag: Optional[str] = Depends(resource_etag("menu")),
+    repo: MenuRepository = Depends(get_read_repository),
+):
     """
     Get distinct categories available in the menu.
+    Conditional: answers 304 when If-None-Match holds the current ETag.
     """
     try:
+        with_etag(response, etag)
         return await repo.get_categories()
     except HTTPException as e:
         raise e
@@ -31,12 +47,40 @@ async def list_categories(repo: MenuRepository = Depends(get_repository)):
         )
 
 @router.get("/dishes", response_model=List[DishResponse])
-async def list_dishes(repo: MenuRepository = Depends(get_repository)):
+async def list_dishes(
+    request: Request,
+    stream: bool = Query(False, description="Stream the result as a JSON array"),
+    fields: Optional[FieldSet] = Depends(sparse_fields(DishResponse)),
+    etag: Optional[str] = Depends(resource_etag("menu")),
+    repo: MenuRepository = Depends(get_read_repository),
+):
     """
     Get all available dishes in the menu.
+    With ?stream=true or 'Accept: application/x-ndjson' rows are streamed instead.
+    ?fields= / ?exclude= trim the documents; reviews are only queried when returned.
+    Conditional: answers 304 when If-None-Match holds the current ETag.
     """
     try:
-        return await repo.get_all_dishes()
+        fmt = stream_format(request, stream)
+        with_reviews = wants(fields, "avaliacoes")
+        if settings.API_JSON_PASSTHROUGH and fields is None:
+            return with_etag(
+                await stream_response(
+                    request, repo.stream_dish_documents(), fmt or "json", read_only=True
+                ),
+                etag,
+            )
+        if fmt:
+            return with_etag(
+                await stream_response(
+                    request, repo.stream_dishes(with_reviews, fields), fmt, read_only=True
+                ),
+                etag,
+            )
+        dishes = await repo.get_all_dishes(with_reviews)
+        if fields:
+            return with_etag(FastJSONResponse([fields.pick(d) for d in dishes]), etag)
+        return with_etag(FastJSONResponse(dishes), etag)
     except HTTPException as e:
         raise e
     except Exception as e:
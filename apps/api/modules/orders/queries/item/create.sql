@@ -1,3 +1,4 @@
+-- prepare: 0
 INSERT INTO item_pedido (id_pedido, id_prato, quantidade, observacao)
 VALUES (%(order_id)s, %(dish_id)s, %(quantity)s, %(notes)s)
 RETURNING id_item_pedido;
\ No newline at end of file
@@ -1,3 +1,4 @@
+-- prepare: 0
 SELECT
     ip.id_item_pedido, ip.quantidade, ip.observacao,
     pr.id_prato, pr.nome as nome_prato, pr.preco
@@ -0,0 +1,86 @@
+-- valor_total is bumped once by trg_order_total_insert after this statement,
+-- so the returned total adds the new lines to the pre-insert snapshot.
+WITH target AS (
+    SELECT p.id_pedido, p.status
+    FROM pedido p
+    WHERE p.id_pedido = %(order_id)s
+    FOR UPDATE
+),
+lines AS (
+    SELECT l.id_prato, l.quantidade, l.observacao, l.ordem
+    FROM unnest(%(dish_ids)s::int[], %(quantities)s::int[], %(notes)s::text[])
+        WITH ORDINALITY AS l(id_prato, quantidade, observacao, ordem)
+),
+missing AS (
+    SELECT DISTINCT l.id_prato
+    FROM lines l
+        LEFT JOIN prato pr ON pr.id_prato = l.id_prato
+    WHERE pr.id_prato IS NULL
+),
+inserted AS (
+    INSERT INTO item_pedido (id_pedido, id_prato, quantidade, observacao)
+    SELECT t.id_pedido, l.id_prato, l.quantidade, l.observacao
+    FROM target t
+        CROSS JOIN lines l
+    WHERE t.status = 'ABERTO'
+        AND NOT EXISTS (SELECT 1 FROM missing)
+    ORDER BY l.ordem
+    RETURNING id_item_pedido, id_pedido, id_prato, quantidade, observacao
+),
+order_items AS (
+    SELECT ip.id_item_pedido, ip.id_prato, ip.quantidade, ip.observacao, pr.nome, pr.preco
+    FROM item_pedido ip
+        JOIN prato pr ON ip.id_prato = pr.id_prato
+    WHERE ip.id_pedido = %(order_id)s
+    UNION ALL
+    SELECT i.id_item_pedido, i.id_prato, i.quantidade, i.observacao, pr.nome, pr.preco
+    FROM inserted i
+        JOIN prato pr ON pr.id_prato = i.id_prato
+)
+SELECT
+    EXISTS (SELECT 1 FROM target) AS order_found,
+    (SELECT status FROM target) AS order_status,
+    COALESCE((SELECT array_agg(id_prato ORDER BY id_prato) FROM missing), '{}') AS missing_dishes,
+    EXISTS (SELECT 1 FROM inserted) AS item_added,
+    o.*
+FROM (SELECT 1) AS one
+    LEFT JOIN LATERAL (
+        SELECT
+            p.id_pedido,
+            p.id_cliente,
+            p.data_pedido,
+            p.valor_total + COALESCE(
+                (SELECT SUM(i.quantidade * pr.preco) FROM inserted i JOIN prato pr ON pr.id_prato = i.id_prato),
+                0
+            ) AS valor_total,
+            p.status,
+            p.quantidade_pessoas,
+            p.id_mesa,
+            p.id_funcionario as id_garcom,
+            c.nome as cliente_nome,
+            m.numero as mesa_numero,
+            g.nome as garcom_nome,
+            COALESCE(
+                (
+                    SELECT jsonb_agg(
+                        jsonb_build_object(
+                            'id', oi.id_item_pedido,
+                            'id_prato', oi.id_prato,
+                            'quantidade', oi.quantidade,
+                            'observacoes', oi.observacao,
+                            'nome_prato', oi.nome,
+                            'preco_unitario', oi.preco::text,
+                            'preco_total', (oi.quantidade * oi.preco)::text
+                        )
+                        ORDER BY oi.id_item_pedido
+                    )
+                    FROM order_items oi
+                ),
+                '[]'
+            ) as items
+        FROM pedido p
+            JOIN cliente c ON p.id_cliente = c.id_cliente
+            JOIN mesa m ON p.id_mesa = m.id_mesa
+            JOIN garcom g ON p.id_funcionario = g.id_funcionario
+        WHERE p.id_pedido = %(order_id)s
+    ) o ON TRUE;
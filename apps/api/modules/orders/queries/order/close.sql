@@ -0,0 +1,37 @@
+-- Closes an ABERTO order and folds it into the analytics rollups.
+-- Closing an order that is not ABERTO changes nothing, so rollups are never double counted.
+WITH closed AS (
+    UPDATE pedido
+    SET status = 'FECHADO'
+    WHERE id_pedido = %(id)s
+        AND status = 'ABERTO'
+    RETURNING id_pedido, DATE(data_pedido) AS dia, id_funcionario, valor_total
+),
+daily AS (
+    INSERT INTO resumo_vendas_diario (dia, total_pedidos, receita_total)
+    SELECT dia, 1, valor_total
+    FROM closed
+    ON CONFLICT (dia) DO UPDATE
+    SET total_pedidos = resumo_vendas_diario.total_pedidos + EXCLUDED.total_pedidos,
+        receita_total = resumo_vendas_diario.receita_total + EXCLUDED.receita_total
+),
+waiter AS (
+    INSERT INTO resumo_garcom_diario (dia, id_funcionario, total_pedidos, total_vendas)
+    SELECT dia, id_funcionario, 1, valor_total
+    FROM closed
+    ON CONFLICT (dia, id_funcionario) DO UPDATE
+    SET total_pedidos = resumo_garcom_diario.total_pedidos + EXCLUDED.total_pedidos,
+        total_vendas = resumo_garcom_diario.total_vendas + EXCLUDED.total_vendas
+),
+dishes AS (
+    INSERT INTO resumo_prato_diario (dia, id_prato, quantidade_vendida, receita)
+    SELECT c.dia, ip.id_prato, SUM(ip.quantidade), SUM(ip.quantidade * pr.preco)
+    FROM closed c
+        JOIN item_pedido ip ON ip.id_pedido = c.id_pedido
+        JOIN prato pr ON pr.id_prato = ip.id_prato
+    GROUP BY c.dia, ip.id_prato
+    ON CONFLICT (dia, id_prato) DO UPDATE
+    SET quantidade_vendida = resumo_prato_diario.quantidade_vendida + EXCLUDED.quantidade_vendida,
+        receita = resumo_prato_diario.receita + EXCLUDED.receita
+)
+SELECT COUNT(*) AS closed FROM closed;
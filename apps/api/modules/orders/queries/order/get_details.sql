@@ -1,3 +1,4 @@
+-- prepare: 0
 SELECT
     p.id_pedido,
     p.id_cliente,
@@ -18,8 +19,8 @@ SELECT
                 'quantidade', ip.quantidade,
                 'observacoes', ip.observacao,
                 'nome_prato', pr.nome,
-                'preco_unitario', pr.preco,
-                'preco_total', (ip.quantidade * pr.preco)
+                'preco_unitario', pr.preco::text,
+                'preco_total', (ip.quantidade * pr.preco)::text
             )
         ) FILTER (WHERE ip.id_item_pedido IS NOT NULL),
         '[]'
@@ -1,3 +1,6 @@
+-- prepare: 0
+-- Items are aggregated per order only when with_items is true
+-- (a CASE branch that is not taken never runs its subquery).
 SELECT
     p.id_pedido,
     p.id_cliente,
@@ -10,37 +13,30 @@ SELECT
     c.nome as cliente_nome,
     m.numero as mesa_numero,
     g.nome as garcom_nome,
-    COALESCE(
-        jsonb_agg(
-            jsonb_build_object(
-                'id', ip.id_item_pedido,
-                'id_prato', pr.id_prato,
-                'quantidade', ip.quantidade,
-                'observacoes', ip.observacao,
-                'nome_prato', pr.nome,
-                'preco_unitario', pr.preco,
-                'preco_total', (ip.quantidade * pr.preco)
-            )
-        ) FILTER (WHERE ip.id_item_pedido IS NOT NULL),
-        '[]'
-    ) as items
+    CASE WHEN %(with_items)s THEN
+        COALESCE(
+            (
+                SELECT jsonb_agg(
+                    jsonb_build_object(
+                        'id', ip.id_item_pedido,
+                        'id_prato', pr.id_prato,
+                        'quantidade', ip.quantidade,
+                        'observacoes', ip.observacao,
+                        'nome_prato', pr.nome,
+                        'preco_unitario', pr.preco::text,
+                        'preco_total', (ip.quantidade * pr.preco)::text
+                    ) ORDER BY ip.id_item_pedido
+                )
+                FROM item_pedido ip
+                    JOIN prato pr ON ip.id_prato = pr.id_prato
+                WHERE ip.id_pedido = p.id_pedido
+            ),
+            '[]'::jsonb
+        )
+    ELSE '[]'::jsonb END as items
 FROM pedido p
     JOIN cliente c ON p.id_cliente = c.id_cliente
     JOIN mesa m ON p.id_mesa = m.id_mesa
     JOIN garcom g ON p.id_funcionario = g.id_funcionario
-    LEFT JOIN item_pedido ip ON p.id_pedido = ip.id_pedido
-    LEFT JOIN prato pr ON ip.id_prato = pr.id_prato
 WHERE p.status = 'ABERTO'
-GROUP BY
-    p.id_pedido,
-    p.id_cliente,
-    p.data_pedido,
-    p.valor_total,
-    p.status,
-    p.quantidade_pessoas,
-    p.id_mesa,
-    p.id_funcionario,
-    c.nome,
-    m.numero,
-    g.nome
-ORDER BY p.data_pedido DESC;
\ No newline at end of file
+ORDER BY p.data_pedido DESC;
@@ -0,0 +1,43 @@
+-- prepare: 0
+-- One final OrderResponse document per active order (JSON passthrough mode).
+-- Keys follow the model's field order; money is emitted as text like Pydantic does.
+SELECT
+    json_build_object(
+        'id', p.id_pedido,
+        'id_cliente', p.id_cliente,
+        'criado_em', p.data_pedido,
+        'valor_total', p.valor_total::text,
+        'status', p.status,
+        'quantidade_cliente', p.quantidade_pessoas,
+        'nome_cliente', c.nome,
+        'id_mesa', p.id_mesa,
+        'id_garcom', p.id_funcionario,
+        'numero_mesa', m.numero,
+        'nome_garcom', g.nome,
+        'itens', COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'id_prato', pr.id_prato,
+                        'quantidade', ip.quantidade,
+                        'observacoes', ip.observacao,
+                        'id', ip.id_item_pedido,
+                        'nome_prato', pr.nome,
+                        'preco_unitario', pr.preco::text,
+                        'preco_total', (ip.quantidade * pr.preco)::text
+                    )
+                    ORDER BY ip.id_item_pedido
+                )
+                FROM item_pedido ip
+                    JOIN prato pr ON ip.id_prato = pr.id_prato
+                WHERE ip.id_pedido = p.id_pedido
+            ),
+            '[]'::json
+        )
+    )::text as doc
+FROM pedido p
+    JOIN cliente c ON p.id_cliente = c.id_cliente
+    JOIN mesa m ON p.id_mesa = m.id_mesa
+    JOIN garcom g ON p.id_funcionario = g.id_funcionario
+WHERE p.status = 'ABERTO'
+ORDER BY p.data_pedido DESC;
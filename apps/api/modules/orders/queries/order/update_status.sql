@@ -1 +0,0 @@
-UPDATE pedido SET status = %(status)s WHERE id_pedido = %(id)s;
\ No newline at end of file
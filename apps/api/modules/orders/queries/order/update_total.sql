@@ -1 +0,0 @@
-UPDATE pedido SET valor_total = %(total)s WHERE id_pedido = %(id)s;
\ No newline at end of file
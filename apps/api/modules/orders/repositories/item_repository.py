@@ -1,10 +1,13 @@
 from typing import List
-from pathlib import Path
 import logging
 from packages.common.src.models.orders_models import OrderItemCreate, OrderItemResponse
+from apps.api.core.cache import analytics_cache
+from apps.api.core.queries import query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent.parent / "queries" / "item"
+QUERIES = query_registry.bind(
+    "orders", prefix="item", required=("create", "delete", "get_by_order")
+)
 
 
 class ItemRepository:
@@ -15,12 +18,11 @@ class ItemRepository:
 
     async def add_item(self, order_id: int, item: OrderItemCreate):
         """Inserts an item into the database."""
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(
-                query,
+            await query.execute(
+                cur,
                 {
                     "order_id": order_id,
                     "dish_id": item.id_prato,
@@ -29,23 +31,23 @@ class ItemRepository:
                 },
             )
             await self.conn.commit()
+        analytics_cache.invalidate("order item added")
 
     async def remove_item(self, item_id: int):
         """Removes an item from the database."""
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"item_id": item_id})
+            await query.execute(cur, {"item_id": item_id})
             await self.conn.commit()
+        analytics_cache.invalidate("order item removed")
 
     async def get_items_by_order(self, order_id: int) -> List[OrderItemResponse]:
         """Fetches all items for a specific order with Dish details."""
-        sql_file = QUERY_PATH / "get_by_order.sql"
-        query = sql_file.read_text()
+        query = QUERIES["get_by_order"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"order_id": order_id})
+            await query.execute(cur, {"order_id": order_id})
             rows = await cur.fetchall()
 
             items = []
@@ -1,13 +1,48 @@
-from typing import List, Optional
-from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 import logging
-import json
-from decimal import Decimal
 
-from packages.common.src.models.orders_models import OrderCreate, OrderResponse, OrderItemResponse
+from packages.common.src.models.orders_models import (
+    OrderCreate,
+    OrderResponse,
+    OrderItemCreate,
+    OrderChanges,
+)
+from apps.api.core.cache import analytics_cache
+from apps.api.core.fields import FieldSet, shaped
+from apps.api.core.queries import query_registry
+from apps.api.core.streaming import RowStream
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent.parent / "queries" / "order"
+# A write committed just after a sync may carry an earlier atualizado_em
+# (set when its statement ran); re-reading this window catches it.
+CHANGES_OVERLAP = timedelta(seconds=5)
+# Deleted orders are only remembered this long (migration 010); an older
+# cursor gets a full sync instead.
+TOMBSTONE_RETENTION = timedelta(days=1)
+QUERIES = query_registry.bind(
+    "orders",
+    prefix="order",
+    required=(
+        "create",
+        "add_item",
+        "add_items",
+        "get_details",
+        "get_details_json",
+        "list_active",
+        "list_active_json",
+        "list_changed",
+        "close",
+    ),
+)
+
+
+def cursor_expired(since: Optional[datetime]) -> bool:
+    """True when the deletes since `since` may no longer all be known."""
+    return (
+        since is not None
+        and datetime.now(timezone.utc) - since.astimezone(timezone.utc) > TOMBSTONE_RETENTION
+    )
 
 
 class OrderRepository:
@@ -18,15 +53,14 @@ class OrderRepository:
 
     async def create_order(self, order: OrderCreate) -> int:
         """Creates a new order header and returns its ID."""
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(
                 f"Opening order for Customer {order.id_cliente} at Table {order.id_mesa}"
             )
-            await cur.execute(
-                query,
+            await query.execute(
+                cur,
                 {
                     "customer_id": order.id_cliente,
                     "table_id": order.id_mesa,
@@ -36,67 +70,165 @@ class OrderRepository:
             )
             row = await cur.fetchone()
             await self.conn.commit()
+            analytics_cache.invalidate("order created")
             if not row:
                 raise Exception("Failed to create order")
             return row["id_pedido"]
 
     @staticmethod
     def _map_row_to_response(row) -> OrderResponse:
-        """Helper to map a DB row to OrderResponse."""
-        items_data = row.get(
-            "items"
-        )
-        if isinstance(items_data, str):
-            items_data = json.loads(items_data)
-        if not items_data:
-            items_list = []
-        else:
-            items_list = [OrderItemResponse(**item) for item in items_data]
-        return OrderResponse(
-            id=row["id_pedido"],
-            id_cliente=row["id_cliente"],
-            criado_em=row["data_pedido"],
-            valor_total=row["valor_total"],
-            status=row["status"],
-            quantidade_cliente=row["quantidade_pessoas"],
-            nome_cliente=row["cliente_nome"],
-            id_mesa=row["id_mesa"],
-            id_garcom=row["id_garcom"],
-            numero_mesa=row["mesa_numero"],
-            nome_garcom=row["garcom_nome"],
-            itens=items_list,
+        """
+        Helper to map a DB row to OrderResponse.
+        Header and jsonb items are validated in one model_validate() call.
+        """
+        items_data = row.get("items")
+        return OrderResponse.model_validate(
+            {
+                "id": row["id_pedido"],
+                "id_cliente": row["id_cliente"],
+                "criado_em": row["data_pedido"],
+                "valor_total": row["valor_total"],
+                "status": row["status"],
+                "quantidade_cliente": row["quantidade_pessoas"],
+                "nome_cliente": row["cliente_nome"],
+                "id_mesa": row["id_mesa"],
+                "id_garcom": row["id_garcom"],
+                "numero_mesa": row["mesa_numero"],
+                "nome_garcom": row["garcom_nome"],
+                "itens": items_data or [],
+            }
         )
 
     async def get_order_details(self, order_id: int) -> Optional[OrderResponse]:
-        sql_file = QUERY_PATH / "get_details.sql"
-        query = sql_file.read_text()
+        query = QUERIES["get_details"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"order_id": order_id})
+            await query.execute(cur, {"order_id": order_id})
             row = await cur.fetchone()
             if not row:
                 return None
             return self._map_row_to_response(row)
 
-    async def list_active_orders(self) -> List[OrderResponse]:
-        sql_file = QUERY_PATH / "list_active.sql"
-        query = sql_file.read_text()
+    async def list_active_orders(self, with_items: bool = True) -> List[OrderResponse]:
+        query = QUERIES["list_active"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur, {"with_items": with_items})
             rows = await cur.fetchall()
             return [self._map_row_to_response(row) for row in rows]
 
-    async def update_order_total(self, order_id: int, new_total: Decimal):
-        sql_file = QUERY_PATH / "update_total.sql"
-        query = sql_file.read_text()
+    async def list_changed_orders(self, since: Optional[datetime]) -> OrderChanges:
+        """
+        Orders updated or deleted since `since` (any status), or every active
+        order when `since` is None or too old to know the deletes since then.
+        The returned cursor is the value for the next call.
+        """
+        query = QUERIES["list_changed"]
+        if cursor_expired(since):
+            since = None
+        params = {
+            "since": since - CHANGES_OVERLAP
+            if since
+            else datetime.min.replace(tzinfo=timezone.utc),
+            "active_only": since is None,
+        }
+
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"total": new_total, "id": order_id})
-            await self.conn.commit()
+            await query.execute(cur, params)
+            rows = await cur.fetchall()
+            return OrderChanges(
+                pedidos=[
+                    self._map_row_to_response(row)
+                    for row in rows
+                    if row["id_pedido"] is not None
+                ],
+                removidos=rows[0]["removidos"],
+                sincronizado_em=rows[0]["sincronizado_em"],
+                completo=since is None,
+            )
+
+    async def get_order_document(self, order_id: int) -> Optional[str]:
+        """Order details as final JSON text rendered by Postgres (passthrough mode)."""
+        query = QUERIES["get_details_json"]
 
-    async def update_status(self, order_id: int, status: str):
-        sql_file = QUERY_PATH / "update_status.sql"
-        query = sql_file.read_text()
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"status": status, "id": order_id})
-            await self.conn.commit()
\ No newline at end of file
+            await query.execute(cur, {"order_id": order_id})
+            row = await cur.fetchone()
+            return row["doc"] if row else None
+
+    def stream_active_orders(
+        self, with_items: bool = True, fields: Optional[FieldSet] = None
+    ) -> RowStream:
+        """Active order listing for the streaming path."""
+        return RowStream(
+            QUERIES["list_active"],
+            {"with_items": with_items},
+            shaped(fields, self._map_row_to_response),
+        )
+
+    def stream_active_order_documents(self) -> RowStream:
+        """Active orders as Postgres-rendered JSON documents (passthrough mode)."""
+        return RowStream(QUERIES["list_active_json"], {}, raw_column="doc")
+
+    async def add_item(
+        self, order_id: int, item: OrderItemCreate
+    ) -> Tuple[Optional[str], bool, Optional[OrderResponse]]:
+        """
+        Validates and inserts in a single statement, committed in the same
+        pipeline sync: one round trip, one transaction.
+        Returns (order status, dish found, updated order). The order is None
+        when it does not exist; nothing is written unless it is ABERTO and
+        the dish exists.
+        """
+        row = await self._execute_and_commit(
+            QUERIES["add_item"],
+            {
+                "order_id": order_id,
+                "dish_id": item.id_prato,
+                "quantity": item.quantidade,
+                "notes": item.observacoes,
+            },
+        )
+        if not row["order_found"]:
+            return None, row["dish_found"], None
+        return row["order_status"], row["dish_found"], self._map_row_to_response(row)
+
+    async def add_items(
+        self, order_id: int, items: List[OrderItemCreate]
+    ) -> Tuple[Optional[str], List[int], Optional[OrderResponse]]:
+        """
+        Bulk variant of add_item: all lines go in through one unnest()-based
+        INSERT, so the total trigger fires once and there is a single commit.
+        Returns (order status, unknown dish ids, updated order). Nothing is
+        written if any dish is unknown or the order is not ABERTO.
+        """
+        row = await self._execute_and_commit(
+            QUERIES["add_items"],
+            {
+                "order_id": order_id,
+                "dish_ids": [item.id_prato for item in items],
+                "quantities": [item.quantidade for item in items],
+                "notes": [item.observacoes for item in items],
+            },
+        )
+        if not row["order_found"]:
+            return None, row["missing_dishes"], None
+        return row["order_status"], row["missing_dishes"], self._map_row_to_response(row)
+
+    async def _execute_and_commit(self, query, params):
+        """Runs a write statement and its COMMIT in one pipeline sync."""
+        async with self.conn.pipeline():
+            async with self.conn.cursor() as cur:
+                await query.execute(cur, params)
+                await self.conn.commit()
+                row = await cur.fetchone()
+        analytics_cache.invalidate(f"{query.key} committed")
+        return row
+
+    async def close_order(self, order_id: int) -> bool:
+        """
+        Closes an ABERTO order and adds it to the daily analytics rollups in the
+        same statement. Returns False when the order was not ABERTO.
+        """
+        row = await self._execute_and_commit(QUERIES["close"], {"id": order_id})
+        return bool(row and row["closed"])
\ No newline at end of file
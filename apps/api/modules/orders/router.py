@@ -1,8 +1,20 @@
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Path as PathParam, Request
-from packages.common.src.models.orders_models import OrderCreate, OrderResponse, OrderItemCreate
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Path as PathParam, Request, Query, Response
+from packages.common.src.models.orders_models import (
+    OrderChanges,
+    OrderCreate,
+    OrderResponse,
+    OrderItemCreate,
+)
 from apps.api.modules.orders.service import OrderService
+from fastapi.responses import StreamingResponse
+from apps.api.core.events import sse_events
+from apps.api.core.fields import FieldSet, sparse_fields, wants
+from apps.api.core.streaming import stream_format, stream_response
+from apps.api.core.responses import FastJSONResponse
+from db.config import settings
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 logger = logging.getLogger(__name__)
@@ -44,12 +56,27 @@ async def create_order(
         )
 
 @router.get("/", response_model=List[OrderResponse])
-async def list_orders(service: OrderService = Depends(get_service)):
+async def list_orders(
+    request: Request,
+    stream: bool = Query(False, description="Stream the result as a JSON array"),
+    fields: Optional[FieldSet] = Depends(sparse_fields(OrderResponse)),
+    service: OrderService = Depends(get_service),
+):
     """
     List all active orders.
+    With ?stream=true or 'Accept: application/x-ndjson' rows are streamed instead.
+    ?fields= / ?exclude= trim the documents; items are only queried when returned.
     """
     try:
-        return await service.list_orders()
+        fmt = stream_format(request, stream)
+        if fmt or (settings.API_JSON_PASSTHROUGH and fields is None):
+            return await stream_response(
+                request, service.stream_orders(fields), fmt or "json"
+            )
+        orders = await service.list_orders(wants(fields, "itens"))
+        if fields:
+            return FastJSONResponse([fields.pick(o) for o in orders])
+        return FastJSONResponse(orders)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -59,6 +86,43 @@ async def list_orders(service: OrderService = Depends(get_service)):
             detail="Internal Server Error",
         )
 
+@router.get("/changes", response_model=OrderChanges)
+async def list_order_changes(
+    since: Optional[datetime] = Query(
+        None, description="'sincronizado_em' of the previous sync; omit for a full sync"
+    ),
+    service: OrderService = Depends(get_service),
+):
+    """
+    Incremental order sync.
+    Returns the orders changed since the cursor (closed ones included, so
+    clients can drop them) and the cursor for the next call.
+    """
+    try:
+        return FastJSONResponse(await service.list_order_changes(since))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.exception(f"API Error list_order_changes: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+@router.get("/stream")
+async def stream_order_changes(request: Request):
+    """
+    Server-Sent Events feed of order changes ('order_change' events).
+    Each event carries the table, operation and affected order ids (null
+    means reload everything; op RESYNC means events may have been missed).
+    Holds no database connection: all subscribers share one LISTEN.
+    """
+    return StreamingResponse(
+        sse_events(request, request.app.state.order_events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.get("/{order_id}", response_model=OrderResponse)
 async def get_order_details(
     order_id: int = PathParam(..., description="ID of the order"),
@@ -68,7 +132,11 @@ async def get_order_details(
     Get full details of a specific order, including items.
     """
     try:
-        return await service.get_order_details(order_id)
+        if settings.API_JSON_PASSTHROUGH:
+            return Response(
+                await service.get_order_document(order_id), media_type="application/json"
+            )
+        return FastJSONResponse(await service.get_order_details(order_id))
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -99,6 +167,27 @@ async def add_item(
             detail="Internal Server Error",
         )
 
+@router.post("/{order_id}/items:batch", response_model=OrderResponse)
+async def add_items(
+    order_id: int,
+    items: List[OrderItemCreate],
+    service: OrderService = Depends(get_service)
+):
+    """
+    Add a round of dishes to an existing order (Must be open).
+    Duplicate dish lines are merged; all items are committed together.
+    """
+    try:
+        return await service.add_items_to_order(order_id, items)
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.exception(f"API Error add_items: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
 @router.delete("/{order_id}/items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_item(
     order_id: int,
@@ -1,16 +1,19 @@
 import logging
-from decimal import Decimal
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException, status
 from packages.common.src.models.orders_models import (
     OrderCreate,
     OrderResponse,
     OrderItemCreate,
+    OrderChanges,
 )
 from apps.api.modules.orders.repositories.order_repository import OrderRepository
 from apps.api.modules.orders.repositories.item_repository import ItemRepository
-from apps.api.modules.menu.repository import MenuRepository
 from apps.api.modules.tables.repository import TableRepository
+from apps.api.core.fields import FieldSet, wants
+from apps.api.core.streaming import RowStream
+from db.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +21,13 @@ logger = logging.getLogger(__name__)
 class OrderService:
     """
     Business logic for Orders.
-    Coordinates between OrderRepo, ItemRepo, MenuRepo, and TableRepo.
+    Coordinates between OrderRepo, ItemRepo, and TableRepo.
     """
 
     def __init__(self, db_connection):
         self.conn = db_connection
         self.order_repo = OrderRepository(db_connection)
         self.item_repo = ItemRepository(db_connection)
-        self.menu_repo = MenuRepository(db_connection)
         self.table_repo = TableRepository(db_connection)
 
     async def create_order(self, order_data: OrderCreate) -> OrderResponse:
@@ -56,50 +58,110 @@ class OrderService:
         order = await self.order_repo.get_order_details(order_id)
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
-        calc_total = sum(i.preco_total for i in order.itens)
-        if abs(calc_total - order.valor_total) > Decimal("0.01"):
-            logger.warning(
-                f"Order {order_id} total mismatch. DB: {order.valor_total}, Calc: {calc_total}"
-            )
-
         return order
 
-    async def list_orders(self) -> List[OrderResponse]:
-        """Lists all ACTIVE orders deeply populated."""
-        return await self.order_repo.list_active_orders()
+    async def list_orders(self, with_items: bool = True) -> List[OrderResponse]:
+        """Lists all ACTIVE orders deeply populated (items only if with_items)."""
+        return await self.order_repo.list_active_orders(with_items)
+
+    async def list_order_changes(self, since: Optional[datetime]) -> OrderChanges:
+        """Orders changed since the previous sync cursor (full sync without one)."""
+        return await self.order_repo.list_changed_orders(since)
+
+    def stream_orders(self, fields: Optional[FieldSet] = None) -> RowStream:
+        """
+        Streaming variant of list_orders (rows are mapped as they are sent).
+        In JSON passthrough mode the rows are Postgres-rendered documents,
+        unless only some fields were asked for.
+        """
+        if settings.API_JSON_PASSTHROUGH and fields is None:
+            return self.order_repo.stream_active_order_documents()
+        return self.order_repo.stream_active_orders(wants(fields, "itens"), fields)
+
+    async def get_order_document(self, order_id: int) -> str:
+        """Order details as Postgres-rendered JSON text (passthrough mode)."""
+        doc = await self.order_repo.get_order_document(order_id)
+        if doc is None:
+            raise HTTPException(status_code=404, detail="Order not found")
+        return doc
 
     async def add_item_to_order(
         self, order_id: int, item_data: OrderItemCreate
     ) -> OrderResponse:
         """
         Adds an item to an existing order.
-        Validates order status is OPEN.
+        Status check, dish lookup, insert and new total happen in one
+        statement and one commit (see order/add_item.sql).
         """
-        order = await self.order_repo.get_order_details(order_id)
-        if not order:
+        try:
+            order_status, dish_found, order = await self.order_repo.add_item(
+                order_id, item_data
+            )
+        except Exception as e:
+            logger.error(f"Service Error add_item_to_order: {e}")
+            await self.conn.rollback()
+            raise e
+
+        if order is None:
             raise HTTPException(status_code=404, detail="Order not found")
-        if order.status != "ABERTO":
+        if order_status != "ABERTO":
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot add items to a {order.status} order.",
+                detail=f"Cannot add items to a {order_status} order.",
             )
-        try:
-            dishes = await self.menu_repo.get_all_dishes()
-            target_dish = next((d for d in dishes if d.id == item_data.id_prato), None)
-            if not target_dish:
-                raise HTTPException(status_code=404, detail="Dish not found")
-
-            await self.item_repo.add_item(order_id, item_data)
-            await self._recalculate_total(order_id)
-            return await self.get_order_details(order_id)
+        if not dish_found:
+            raise HTTPException(status_code=404, detail="Dish not found")
+        return order
 
+    async def add_items_to_order(
+        self, order_id: int, items: List[OrderItemCreate]
+    ) -> OrderResponse:
+        """
+        Adds a whole round of items in one statement and one commit.
+        Lines for the same dish with the same notes are merged into one.
+        """
+        if not items:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one item is required.",
+            )
+        try:
+            order_status, missing_dishes, order = await self.order_repo.add_items(
+                order_id, self._merge_item_lines(items)
+            )
         except Exception as e:
-            logger.error(f"Service Error add_item_to_order: {e}")
+            logger.error(f"Service Error add_items_to_order: {e}")
             await self.conn.rollback()
             raise e
 
+        if order is None:
+            raise HTTPException(status_code=404, detail="Order not found")
+        if order_status != "ABERTO":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot add items to a {order_status} order.",
+            )
+        if missing_dishes:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Dish not found: {', '.join(map(str, missing_dishes))}",
+            )
+        return order
+
+    @staticmethod
+    def _merge_item_lines(items: List[OrderItemCreate]) -> List[OrderItemCreate]:
+        """Sums quantities of lines sharing dish and notes, keeping first-seen order."""
+        merged: Dict[Tuple[int, Optional[str]], OrderItemCreate] = {}
+        for item in items:
+            key = (item.id_prato, item.observacoes)
+            if key in merged:
+                merged[key].quantidade += item.quantidade
+            else:
+                merged[key] = item.model_copy()
+        return list(merged.values())
+
     async def remove_item_from_order(self, order_id: int, item_id: int):
-        """Removes an item and recalculates total."""
+        """Removes an item. The order total is adjusted by trigger."""
         order = await self.order_repo.get_order_details(order_id)
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
@@ -111,7 +173,6 @@ class OrderService:
 
         try:
             await self.item_repo.remove_item(item_id)
-            await self._recalculate_total(order_id)
         except Exception as e:
             logger.error(f"Error removing item: {e}")
             raise e
@@ -122,11 +183,11 @@ class OrderService:
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
 
-        await self.order_repo.update_status(order_id, "FECHADO")
+        if not await self.order_repo.close_order(order_id):
+            if order.status == "CANCELADO":
+                raise HTTPException(
+                    status_code=400, detail="Cannot close a cancelled order"
+                )
+            logger.info(f"Order {order_id} is already closed")
         return await self.get_order_details(order_id)
 
-    async def _recalculate_total(self, order_id: int):
-        """Helper to sum items and update order header."""
-        items = await self.item_repo.get_items_by_order(order_id)
-        new_total = sum(i.preco_total for i in items)
-        await self.order_repo.update_order_total(order_id, new_total)
\ No newline at end of file
@@ -0,0 +1,3 @@
+SELECT id_cliente AS id, nome
+FROM cliente
+ORDER BY nome, id_cliente;
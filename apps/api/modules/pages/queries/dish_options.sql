@@ -0,0 +1,3 @@
+SELECT id_prato AS id, nome, preco
+FROM prato
+ORDER BY nome, id_prato;
@@ -0,0 +1,9 @@
+SELECT m.id_mesa AS id, m.numero, m.capacidade, m.localizacao
+FROM mesa m
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM pedido p
+    WHERE p.id_mesa = m.id_mesa
+      AND p.status = 'ABERTO'
+)
+ORDER BY m.numero;
@@ -0,0 +1,12 @@
+-- Dishes of the customer's closed orders, latest order first.
+SELECT
+    p.id_pedido,
+    pr.id_prato,
+    pr.nome AS nome_prato,
+    p.data_pedido
+FROM pedido p
+    JOIN item_pedido ip ON ip.id_pedido = p.id_pedido
+    JOIN prato pr ON pr.id_prato = ip.id_prato
+WHERE p.id_cliente = %(customer_id)s
+  AND p.status = 'FECHADO'
+ORDER BY p.data_pedido DESC, p.id_pedido DESC, ip.id_item_pedido;
@@ -0,0 +1,11 @@
+-- Customers with at least one closed order that has items.
+SELECT c.id_cliente AS id, c.nome
+FROM cliente c
+WHERE EXISTS (
+    SELECT 1
+    FROM pedido p
+        JOIN item_pedido ip ON ip.id_pedido = p.id_pedido
+    WHERE p.id_cliente = c.id_cliente
+      AND p.status = 'FECHADO'
+)
+ORDER BY c.nome, c.id_cliente;
@@ -0,0 +1,3 @@
+SELECT id_funcionario AS id, nome
+FROM garcom
+ORDER BY nome, id_funcionario;
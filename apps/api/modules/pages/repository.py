@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+import logging
+from packages.common.src.models.pages_models import OrdersPage, ReviewsPage
+from apps.api.core.queries import Query, query_registry
+
+logger = logging.getLogger(__name__)
+QUERIES = query_registry.bind(
+    "pages",
+    required=(
+        "customer_options",
+        "dish_options",
+        "free_tables",
+        "reviewable_items",
+        "reviewer_options",
+        "waiter_options",
+    ),
+)
+
+
+class PagesRepository:
+    """
+    Read-only projections for the UI pages ("backend-for-frontend").
+
+    Each page is assembled from several small queries run concurrently,
+    each on its own pooled connection (one connection runs one query at a
+    time), so the response takes as long as the slowest query.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def _fetch_all(
+        self, query: Query, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        async with self.pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await query.execute(cur, params)
+                return await cur.fetchall()
+
+    async def get_orders_page(self) -> OrdersPage:
+        """Dropdown data for the new order and add item forms."""
+        customers, tables, waiters, dishes = await asyncio.gather(
+            self._fetch_all(QUERIES["customer_options"]),
+            self._fetch_all(QUERIES["free_tables"]),
+            self._fetch_all(QUERIES["waiter_options"]),
+            self._fetch_all(QUERIES["dish_options"]),
+        )
+        return OrdersPage.model_validate(
+            {
+                "clientes": customers,
+                "mesas_livres": tables,
+                "garcons": waiters,
+                "pratos": dishes,
+            }
+        )
+
+    async def get_reviews_page(self, customer_id: Optional[int]) -> ReviewsPage:
+        """
+        Dishes, customers able to review and, given `customer_id`,
+        the dishes that customer can review.
+        """
+        calls = [
+            self._fetch_all(QUERIES["dish_options"]),
+            self._fetch_all(QUERIES["reviewer_options"]),
+        ]
+        if customer_id is not None:
+            calls.append(
+                self._fetch_all(QUERIES["reviewable_items"], {"customer_id": customer_id})
+            )
+        dishes, customers, *items = await asyncio.gather(*calls)
+        return ReviewsPage.model_validate(
+            {
+                "pratos": [{"id": d["id"], "nome": d["nome"]} for d in dishes],
+                "clientes": customers,
+                "itens": items[0] if items else [],
+            }
+        )
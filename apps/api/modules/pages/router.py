@@ -0,0 +1,49 @@
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from packages.common.src.models.pages_models import OrdersPage, ReviewsPage
+from apps.api.modules.pages.repository import PagesRepository
+from apps.api.core.responses import FastJSONResponse
+
+router = APIRouter(prefix="/ui", tags=["UI Pages"])
+logger = logging.getLogger(__name__)
+
+def get_repository(request: Request):
+    """
+    Dependency injection for PagesRepository.
+    It takes the pool itself: its queries run concurrently, on separate connections.
+    """
+    return PagesRepository(request.app.state.pool)
+
+@router.get("/orders-page", response_model=OrdersPage)
+async def get_orders_page(repo: PagesRepository = Depends(get_repository)):
+    """Customers, free tables, waiters and dishes for the Orders page forms."""
+    try:
+        return FastJSONResponse(await repo.get_orders_page())
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error building orders page: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+@router.get("/reviews-page", response_model=ReviewsPage)
+async def get_reviews_page(
+    customer_id: Optional[int] = Query(
+        None, description="Also list the dishes this customer can review"
+    ),
+    repo: PagesRepository = Depends(get_repository),
+):
+    """Dishes, customers with closed orders and (optionally) one customer's reviewable dishes."""
+    try:
+        return FastJSONResponse(await repo.get_reviews_page(customer_id))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error building reviews page: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
@@ -1,10 +1,13 @@
 from typing import List, Optional
-from pathlib import Path
 import logging
 from packages.common.src.models.reviews_models import ReviewCreate, ReviewResponse, ReviewUpdate
+from apps.api.core.queries import query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind(
+    "reviews",
+    required=("check_eligibility", "create", "delete", "get_details", "list_by_dish", "update"),
+)
 
 
 class ReviewRepository:
@@ -21,10 +24,9 @@ class ReviewRepository:
         """
         Verifies if the customer actually ordered the dish in the specific order.
         """
-        sql_file = QUERY_PATH / "check_eligibility.sql"
-        query = sql_file.read_text()
-        await cur.execute(
-            query,
+        query = QUERIES["check_eligibility"]
+        await query.execute(
+            cur,
             {"customer_id": customer_id, "order_id": order_id, "dish_id": dish_id},
         )
         return await cur.fetchone() is not None
@@ -33,8 +35,8 @@ class ReviewRepository:
         """
         Submits a new review with strict eligibility checks.
         """
-        sql_create = (QUERY_PATH / "create.sql").read_text()
-        sql_details = (QUERY_PATH / "get_details.sql").read_text()
+        create_query = QUERIES["create"]
+        details_query = QUERIES["get_details"]
         async with self.conn.cursor() as cur:
             logger.info(
                 f"Attempting to create review for Dish {review.id_prato} by Customer {review.id_cliente}"
@@ -49,8 +51,8 @@ class ReviewRepository:
                     "Eligibility Error: Customer did not order this dish in the specified order."
                 )
             try:
-                await cur.execute(
-                    sql_create,
+                await create_query.execute(
+                    cur,
                     {
                         "rating": review.nota,
                         "comment": review.comentario,
@@ -63,7 +65,7 @@ class ReviewRepository:
                 if not row_id:
                     raise Exception("Failed to insert review (No ID returned).")
                 new_id = row_id["id_avaliacao"]
-                await cur.execute(sql_details, {"review_id": new_id})
+                await details_query.execute(cur, {"review_id": new_id})
                 row = await cur.fetchone()
                 await self.conn.commit()
                 if not row:
@@ -87,11 +89,10 @@ class ReviewRepository:
         """
         Fetch all reviews for a specific dish.
         """
-        sql_file = QUERY_PATH / "list_by_dish.sql"
-        query = sql_file.read_text()
+        query = QUERIES["list_by_dish"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"dish_id": dish_id})
+            await query.execute(cur, {"dish_id": dish_id})
             rows = await cur.fetchall()
 
             return [
@@ -107,10 +108,9 @@ class ReviewRepository:
             ]
 
     async def delete_review(self, review_id: int) -> bool:
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": review_id})
+            await query.execute(cur, {"id": review_id})
             deleted = cur.rowcount
             await self.conn.commit()
             return deleted > 0
@@ -121,13 +121,13 @@ class ReviewRepository:
         """
         Updates an existing review's rating or comment.
         """
-        sql_update = (QUERY_PATH / "update.sql").read_text()
-        sql_details = (QUERY_PATH / "get_details.sql").read_text()
+        update_query = QUERIES["update"]
+        details_query = QUERIES["get_details"]
 
         async with self.conn.cursor() as cur:
             try:
-                await cur.execute(
-                    sql_update,
+                await update_query.execute(
+                    cur,
                     {
                         "rating": review_update.nota,
                         "comment": review_update.comentario,
@@ -138,7 +138,7 @@ class ReviewRepository:
                 if not row_id:
                     await self.conn.rollback()
                     return None
-                await cur.execute(sql_details, {"review_id": review_id})
+                await details_query.execute(cur, {"review_id": review_id})
                 row = await cur.fetchone()
                 await self.conn.commit()
                 if not row:
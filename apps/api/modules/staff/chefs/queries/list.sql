@@ -0,0 +1,3 @@
+SELECT id_funcionario, nome, cpf, salario, especialidade
+FROM cozinheiro
+ORDER BY nome;
\ No newline at end of file
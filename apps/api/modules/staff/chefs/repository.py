@@ -1,10 +1,10 @@
 from typing import List
-from pathlib import Path
 import logging
 from packages.common.src.models.chef_models import ChefCreate, ChefResponse
+from apps.api.core.queries import query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind("staff/chefs", required=("create", "delete", "list"))
 
 class ChefRepository:
     """Repository for accessing 'cozinheiro' table data."""
@@ -14,24 +14,22 @@ class ChefRepository:
 
 
     async def delete_chef(self, waiter_id: int) -> bool:
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": waiter_id})
+            await query.execute(cur, {"id": waiter_id})
             deleted = cur.rowcount
             await self.conn.commit()
             return deleted > 0
 
     async def create_chef(self, chef: ChefCreate) -> ChefResponse:
         """Register a new chef."""
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(f"Creating chef: {chef.nome}")
             try:
-                await cur.execute(
-                    query,
+                await query.execute(
+                    cur,
                     {
                         "name": chef.nome,
                         "cpf": chef.cpf,
@@ -59,10 +57,10 @@ class ChefRepository:
 
     async def get_all_chefs(self) -> List[ChefResponse]:
         """Fetch all chefs."""
-        query = "SELECT id_funcionario, nome, cpf, salario, especialidade FROM cozinheiro ORDER BY nome;"
+        query = QUERIES["list"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur)
             rows = await cur.fetchall()
 
             return [
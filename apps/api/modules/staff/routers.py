@@ -1,10 +1,12 @@
 import logging
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends, Request
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from packages.common.src.models.waiters_models import WaiterCreate, WaiterResponse
 from apps.api.modules.staff.waiters.repository import WaiterRepository
 from packages.common.src.models.chef_models import ChefCreate, ChefResponse
 from apps.api.modules.staff.chefs.repository import ChefRepository
+from apps.api.core.database import get_read_connection
+from apps.api.core.etag import resource_etag, with_etag
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +22,21 @@ def get_waiter_repo(conn=Depends(get_db_connection)):
 def get_chef_repo(conn=Depends(get_db_connection)):
     return ChefRepository(conn)
 
+def get_waiter_read_repo(conn=Depends(get_read_connection)):
+    return WaiterRepository(conn)
+
+def get_chef_read_repo(conn=Depends(get_read_connection)):
+    return ChefRepository(conn)
+
 @router.get("/waiters", response_model=List[WaiterResponse])
-async def list_waiters(repo: WaiterRepository = Depends(get_waiter_repo)):
-    """List all waiters."""
+async def list_waiters(
+    response: Response,
+    etag: Optional[str] = Depends(resource_etag("waiters")),
+    repo: WaiterRepository = Depends(get_waiter_read_repo),
+):
+    """List all waiters. Conditional on If-None-Match (304 when unchanged)."""
     try:
+        with_etag(response, etag)
         return await repo.get_all_waiters()
     except HTTPException as e:
         raise e
@@ -76,9 +89,14 @@ async def create_waiter(waiter: WaiterCreate, repo: WaiterRepository = Depends(g
         )
 
 @router.get("/chefs", response_model=List[ChefResponse])
-async def list_chefs(repo: ChefRepository = Depends(get_chef_repo)):
-    """List all chefs."""
+async def list_chefs(
+    response: Response,
+    etag: Optional[str] = Depends(resource_etag("chefs")),
+    repo: ChefRepository = Depends(get_chef_read_repo),
+):
+    """List all chefs. Conditional on If-None-Match (304 when unchanged)."""
     try:
+        with_etag(response, etag)
         return await repo.get_all_chefs()
     except HTTPException as e:
         raise e
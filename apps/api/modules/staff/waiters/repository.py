@@ -1,10 +1,11 @@
 from typing import List
-from pathlib import Path
 import logging
 from packages.common.src.models.waiters_models import WaiterCreate, WaiterResponse
+from apps.api.core.cache import analytics_cache
+from apps.api.core.queries import query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind("staff/waiters", required=("create", "delete", "list"))
 
 class WaiterRepository:
     """Repository for accessing 'garcom' table data."""
@@ -13,24 +14,23 @@ class WaiterRepository:
         self.conn = db_connection
 
     async def delete_waiter(self, waiter_id: int) -> bool:
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": waiter_id})
+            await query.execute(cur, {"id": waiter_id})
             deleted = cur.rowcount
             await self.conn.commit()
+            analytics_cache.invalidate("waiter deleted")
             return deleted > 0
 
     async def create_waiter(self, waiter: WaiterCreate) -> WaiterResponse:
         """Register a new waiter."""
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(f"Creating waiter: {waiter.nome}")
             try:
-                await cur.execute(
-                    query,
+                await query.execute(
+                    cur,
                     {
                         "name": waiter.nome,
                         "cpf": waiter.cpf,
@@ -44,6 +44,8 @@ class WaiterRepository:
 
                 if not row:
                     raise Exception("Failed to insert waiter")
+                # Waiter performance lists every waiter, sales or not.
+                analytics_cache.invalidate("waiter created")
 
                 return WaiterResponse(
                     id=row["id_funcionario"],
@@ -60,10 +62,10 @@ class WaiterRepository:
 
     async def get_all_waiters(self) -> List[WaiterResponse]:
         """Fetch all waiters."""
-        query = "SELECT id_funcionario, nome, cpf, salario, turno, comissao FROM garcom ORDER BY nome;"
+        query = QUERIES["list"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur)
             rows = await cur.fetchall()
 
             return [
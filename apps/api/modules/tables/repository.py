@@ -1,11 +1,13 @@
 from typing import List, Optional
-from pathlib import Path
 import logging
 
 from packages.common.src.models.tables_models import TableCreate, TableResponse
+from apps.api.core.queries import query_registry
 
 logger = logging.getLogger(__name__)
-QUERY_PATH = Path(__file__).parent / "queries"
+QUERIES = query_registry.bind(
+    "tables", required=("create", "delete", "get_by_id", "list")
+)
 
 
 class TableRepository:
@@ -15,10 +17,9 @@ class TableRepository:
         self.conn = db_connection
 
     async def delete_table(self, table_id: int) -> bool:
-        sql_file = QUERY_PATH / "delete.sql"
-        query = sql_file.read_text()
+        query = QUERIES["delete"]
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": table_id})
+            await query.execute(cur, {"id": table_id})
             deleted = cur.rowcount
             await self.conn.commit()
             return deleted > 0
@@ -27,14 +28,13 @@ class TableRepository:
         """
         Register a new table in the database.
         """
-        sql_file = QUERY_PATH / "create.sql"
-        query = sql_file.read_text()
+        query = QUERIES["create"]
 
         async with self.conn.cursor() as cur:
             logger.info(f"Creating table #{table.numero} at {table.localizacao}")
             try:
-                await cur.execute(
-                    query,
+                await query.execute(
+                    cur,
                     {
                         "number": table.numero,
                         "capacity": table.capacidade,
@@ -63,11 +63,10 @@ class TableRepository:
         """
         Fetch all tables with occupancy status.
         """
-        sql_file = QUERY_PATH / "list.sql"
-        query = sql_file.read_text()
+        query = QUERIES["list"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query)
+            await query.execute(cur)
             rows = await cur.fetchall()
 
             return [
@@ -83,11 +82,10 @@ class TableRepository:
 
     async def get_table_by_id(self, table_id: int) -> Optional[TableResponse]:
         """Fetch a specific table by ID."""
-        sql_file = QUERY_PATH / "get_by_id.sql"
-        query = sql_file.read_text()
+        query = QUERIES["get_by_id"]
 
         async with self.conn.cursor() as cur:
-            await cur.execute(query, {"id": table_id})
+            await query.execute(cur, {"id": table_id})
             row = await cur.fetchone()
 
             if not row:
@@ -1,8 +1,10 @@
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends, Request
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
+from typing import List, Optional
 from packages.common.src.models.tables_models import TableCreate, TableResponse
 from apps.api.modules.tables.repository import TableRepository
+from apps.api.core.database import get_read_connection
+from apps.api.core.etag import resource_etag, with_etag
 
 router = APIRouter(prefix="/tables", tags=["Tables"])
 logger = logging.getLogger(__name__)
@@ -15,6 +17,10 @@ def get_repository(conn=Depends(get_db_connection)):
     """Dependency to provide the TableRepository."""
     return TableRepository(conn)
 
+def get_read_repository(conn=Depends(get_read_connection)):
+    """TableRepository on the read replica, for the list endpoint."""
+    return TableRepository(conn)
+
 @router.delete("/{table_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_table(table_id: int, repo: TableRepository = Depends(get_repository)):
     try:
@@ -28,11 +34,17 @@ async def delete_table(table_id: int, repo: TableRepository = Depends(get_reposi
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.get("/", response_model=List[TableResponse])
-async def list_tables(repo: TableRepository = Depends(get_repository)):
+async def list_tables(
+    response: Response,
+    etag: Optional[str] = Depends(resource_etag("tables")),
+    repo: TableRepository = Depends(get_read_repository),
+):
     """
     Get all registered tables.
+    Conditional: answers 304 when If-None-Match holds the current ETag.
     """
     try:
+        with_etag(response, etag)
         return await repo.get_all_tables()
     except HTTPException as e:
         raise e
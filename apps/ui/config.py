@@ -2,6 +2,7 @@ import sys
 from pathlib import Path
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -15,6 +16,15 @@ class FrontendSettings(BaseSettings):
     """
     API_BASE_URL: str = "http://localhost:8000/api/v1"
     API_TIMEOUT: int = 10
+    API_POOL_SIZE: int = 20
+    API_RETRIES: int = 3
+    API_RETRY_BACKOFF: float = 0.3
+    API_COMPRESSION: bool = True
+    UI_CACHE_BACKEND: Literal["memory", "disk", "redis"] = "memory"
+    UI_CACHE_DIR: str = ""
+    UI_CACHE_URL: str = "redis://localhost:6379/0"
+    UI_CACHE_SECRET: str = ""
+    UI_FOLLOW_ORDER_EVENTS: bool = True
     PAGE_TITLE: str = "Restaurant Manager"
 
     model_config = SettingsConfigDict(
@@ -0,0 +1,398 @@
+"""
+Pluggable result cache for the UI services layer.
+
+`@cached(ttl=...)` is a drop-in for `@st.cache_data(ttl=..., show_spinner=False)`
+on service methods: arguments whose name starts with '_' (such as `_self`)
+are not part of the key, `service.method.clear()` drops every entry of
+that method and `service.method.invalidate(*args)` only the entry for those
+arguments. Values are pickled, so callers always get their own copy.
+
+Where the entries live is chosen by UI_CACHE_BACKEND:
+    memory  per process (the default; what st.cache_data did)
+    disk    files under UI_CACHE_DIR, shared by the replicas on the host that
+            run as the same user. The directory must be theirs alone (mode
+            0700); by default a per-user one under /dev/shm (shared memory)
+            when available
+    redis   any server speaking the Redis protocol at UI_CACHE_URL, shared
+            by every replica; entries are signed with UI_CACHE_SECRET
+Since values are pickled, a shared backend only accepts entries nobody else
+could have written. Entries that do not load (corrupt, or pickled by an older
+release) are misses. A failing backend never fails the page: the call just
+goes to the API.
+"""
+import sys
+from pathlib import Path
+project_root = Path(__file__).resolve().parents[3]
+sys.path.append(str(project_root))
+from abc import ABC, abstractmethod
+import functools
+import hashlib
+import hmac
+import inspect
+import logging
+import os
+import pickle
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from apps.ui.config import settings
+
+logger = logging.getLogger("frontend.cache")
+# Bump the version when cached values change shape, so entries pickled by an
+# older release are never read.
+KEY_PREFIX = "ui-cache:v1"
+
+
+class CacheBackend(ABC):
+    """Stores pickled values by key, each with its own time to live."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """Drops every key of `namespace` (keys are '<namespace>:<digest>')."""
+
+
+class MemoryBackend(CacheBackend):
+    """Per-process dictionary; entries expire on read."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(f"{namespace}:")]:
+                del self._entries[key]
+
+
+class DiskBackend(CacheBackend):
+    """
+    One file per entry under `directory` (a directory per namespace).
+    Files are written to a temporary name and renamed, so concurrent readers
+    in other processes never see a partial entry. Each file starts with its
+    expiry time (wall clock, so every process agrees on it).
+    """
+
+    HEADER = struct.Struct("!d")
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private_dir(self.directory)
+
+    def _path(self, key: str) -> Path:
+        namespace, _, digest = key.rpartition(":")
+        return self.directory / namespace / digest
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(data) < self.HEADER.size:
+            return None
+        (expires,) = self.HEADER.unpack_from(data)
+        if expires < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return data[self.HEADER.size :]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        path = self._path(key)
+        path.parent.mkdir(mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.HEADER.pack(time.time() + ttl))
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self, namespace: str) -> None:
+        directory = self.directory / namespace
+        if directory.is_dir():
+            for path in directory.iterdir():
+                path.unlink(missing_ok=True)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Minimal RESP2 client (GET, SET PX, SCAN, DEL) over one socket per thread.
+    Speaks to Redis, Valkey or any local stand-in implementing those commands.
+    Values are stored after an HMAC-SHA256 of their key and bytes under
+    `secret`; one that does not carry a valid MAC reads as a miss.
+    """
+
+    MAC_SIZE = hashlib.sha256().digest_size
+
+    def __init__(self, url: str, secret: str, timeout: float = 1.0):
+        if not secret:
+            raise ValueError("The redis UI cache needs UI_CACHE_SECRET to sign its entries")
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.secret = secret.encode()
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection((self.host, self.port), self.timeout)
+            conn = (sock, sock.makefile("rb"))
+            self._local.conn = conn
+            if self.password:
+                self._command("AUTH", self.password)
+            if self.db:
+                self._command("SELECT", str(self.db))
+        return conn
+
+    def _command(self, *args: Any) -> Any:
+        sock, reader = self._connection()
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        try:
+            sock.sendall(b"".join(parts))
+            return self._read(reader)
+        except OSError:
+            self._local.conn = None
+            sock.close()
+            raise
+
+    def _read(self, reader) -> Any:
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("Cache server closed the connection")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RuntimeError(f"Cache server error: {rest.decode()}")
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            data = reader.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            size = int(rest)
+            return None if size < 0 else [self._read(reader) for _ in range(size)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def _mac(self, key: str, value: bytes) -> bytes:
+        return hmac.new(self.secret, key.encode() + b"\0" + value, hashlib.sha256).digest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self._command("GET", key)
+        if data is None:
+            return None
+        mac, value = data[: self.MAC_SIZE], data[self.MAC_SIZE :]
+        if not hmac.compare_digest(mac, self._mac(key, value)):
+            logger.warning(f"Ignoring cache entry {key}: missing or invalid signature")
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._command(
+            "SET", key, self._mac(key, value) + value, "PX", max(int(ttl * 1000), 1)
+        )
+
+    def delete(self, key: str) -> None:
+        self._command("DEL", key)
+
+    def clear(self, namespace: str) -> None:
+        cursor = b"0"
+        while True:
+            cursor, keys = self._command("SCAN", cursor, "MATCH", f"{namespace}:*", "COUNT", 500)
+            if keys:
+                self._command("DEL", *keys)
+            if cursor in (b"0", "0"):
+                return
+
+
+def _check_private_dir(path: Path) -> None:
+    """
+    Refuses a cache directory another user could write to: whoever can write
+    an entry can run code in the UI when it is unpickled.
+    """
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"UI cache path {path} is not a directory")
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"UI cache directory {path} belongs to another user")
+    if info.st_mode & 0o077:
+        os.chmod(path, 0o700)
+
+
+def _default_cache_dir() -> Path:
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else Path(tempfile.gettempdir())
+    name = "restaurante-ui-cache"
+    if hasattr(os, "getuid"):  # /dev/shm and /tmp are shared: one directory per user
+        name += f"-{os.getuid()}"
+    return base / name
+
+
+_backend_lock = threading.Lock()
+_backend: Optional[CacheBackend] = None
+
+
+def get_backend() -> CacheBackend:
+    """The process-wide backend selected by UI_CACHE_BACKEND."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            kind = settings.UI_CACHE_BACKEND
+            try:
+                if kind == "redis":
+                    _backend = RedisBackend(settings.UI_CACHE_URL, settings.UI_CACHE_SECRET)
+                elif kind == "disk":
+                    _backend = DiskBackend(
+                        Path(settings.UI_CACHE_DIR)
+                        if settings.UI_CACHE_DIR
+                        else _default_cache_dir()
+                    )
+                else:
+                    _backend = MemoryBackend()
+            except (OSError, ValueError) as e:
+                logger.error(f"UI cache backend '{kind}' unusable, caching per process: {e}")
+                _backend = MemoryBackend()
+            logger.info(f"UI cache backend: {type(_backend).__name__}")
+        return _backend
+
+
+_namespaces: List[str] = []
+BYPASS_SECONDS = 10.0
+_bypass_until = 0.0
+
+
+def _use_backend(op: str, namespace: str, action: Callable[[CacheBackend], Any]) -> Any:
+    """
+    Runs `action` on the backend, returning None if it fails.
+    After a failure the cache is bypassed for a few seconds, so an
+    unreachable server does not add a timeout to every call.
+    """
+    global _bypass_until
+    if time.monotonic() < _bypass_until:
+        return None
+    try:
+        return action(get_backend())
+    except Exception as e:
+        _bypass_until = time.monotonic() + BYPASS_SECONDS
+        logger.warning(
+            f"Cache {op} failed for {namespace}, bypassing for {BYPASS_SECONDS:.0f}s: {e}"
+        )
+        return None
+
+
+def clear_all() -> None:
+    """Drops the entries of every cached function (e.g. a manual reload)."""
+    for namespace in _namespaces:
+        _use_backend("clear", namespace, lambda backend: backend.clear(namespace))
+
+
+class CachedFunction:
+    """A function whose results go through the configured backend."""
+
+    def __init__(self, func: Callable, ttl: float):
+        self.func = func
+        self.ttl = ttl
+        self.signature = inspect.signature(func)
+        self.namespace = f"{KEY_PREFIX}:{func.__module__}.{func.__qualname__}"
+        _namespaces.append(self.namespace)
+        functools.update_wrapper(self, func)
+
+    def _key(self, args: tuple, kwargs: dict) -> str:
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        hashed = sorted(
+            (name, value)
+            for name, value in bound.arguments.items()
+            if not name.startswith("_")
+        )
+        digest = hashlib.sha256(pickle.dumps(hashed)).hexdigest()[:32]
+        return f"{self.namespace}:{digest}"
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = self._key(args, kwargs)
+        data = _use_backend("read", self.namespace, lambda backend: backend.get(key))
+        if data is not None:
+            try:
+                return pickle.loads(data)
+            except Exception as e:
+                logger.warning(f"Unreadable cache entry in {self.namespace}, reloading: {e}")
+        value = self.func(*args, **kwargs)
+        payload = pickle.dumps(value)
+        _use_backend("write", self.namespace, lambda backend: backend.set(key, payload, self.ttl))
+        return value
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        bound = functools.partial(self.__call__, instance)
+        bound.clear = self.clear
+        bound.invalidate = functools.partial(self.invalidate, instance)
+        return bound
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> None:
+        """Drops the entry cached for these arguments (same call as the cached one)."""
+        key = self._key(args, kwargs)
+        _use_backend("delete", self.namespace, lambda backend: backend.delete(key))
+
+    def clear(self) -> None:
+        _use_backend("clear", self.namespace, lambda backend: backend.clear(self.namespace))
+
+
+def cached(ttl: float) -> Callable[[Callable], CachedFunction]:
+    """Caches a service method's result for `ttl` seconds in the configured backend."""
+
+    def decorator(func: Callable) -> CachedFunction:
+        return CachedFunction(func, ttl)
+
+    return decorator
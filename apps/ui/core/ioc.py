@@ -8,12 +8,14 @@ from apps.ui.viewmodels.menu import MenuViewModel
 
 project_root = Path(__file__).resolve().parents[3]
 sys.path.append(str(project_root))
+from apps.ui.config import settings
 from apps.ui.services.reviews import ReviewService
 from apps.ui.services.menu import MenuService
 from apps.ui.services.customers import CustomerService
 from apps.ui.services.analytics import AnalyticsService
 from apps.ui.services.order import OrderService
 from apps.ui.services.tables import TableService
+from apps.ui.services.kitchen import KitchenService
 from apps.ui.services.staff import StaffService
 from apps.ui.viewmodels.reviews import ReviewsViewModel
 from apps.ui.viewmodels.dashboard import DashboardViewModel
@@ -51,7 +53,15 @@ class DIContainer:
     @staticmethod
     @st.cache_resource
     def _get_order_service() -> OrderService:
-        return OrderService()
+        service = OrderService()
+        if settings.UI_FOLLOW_ORDER_EVENTS:
+            service.follow_changes()
+        return service
+
+    @staticmethod
+    @st.cache_resource
+    def _get_kitchen_service() -> KitchenService:
+        return KitchenService()
 
     @staticmethod
     @st.cache_resource
@@ -65,11 +75,7 @@ class DIContainer:
 
     @staticmethod
     def get_reviews_viewmodel() -> ReviewsViewModel:
-        return ReviewsViewModel(
-            review_service=DIContainer._get_review_service(),
-            menu_service=DIContainer._get_menu_service(),
-            customer_service=DIContainer._get_customer_service(),
-        )
+        return ReviewsViewModel(review_service=DIContainer._get_review_service())
 
     @staticmethod
     def get_dashboard_viewmodel() -> DashboardViewModel:
@@ -80,13 +86,7 @@ class DIContainer:
     @staticmethod
     def get_orders_viewmodel() -> OrdersViewModel:
         """Factory for OrdersViewModel with all dependencies injected."""
-        return OrdersViewModel(
-            order_service=DIContainer._get_order_service(),
-            customer_service=DIContainer._get_customer_service(),
-            table_service=DIContainer._get_table_service(),
-            staff_service=DIContainer._get_staff_service(),
-            menu_service=DIContainer._get_menu_service(),
-        )
+        return OrdersViewModel(order_service=DIContainer._get_order_service())
 
     @staticmethod
     def get_staff_viewmodel() -> StaffViewModel:
@@ -111,5 +111,6 @@ class DIContainer:
     def get_kitchen_viewmodel() -> KitchenViewModel:
         """Factory for KitchenViewModel."""
         return KitchenViewModel(
-            order_service=DIContainer._get_order_service()
+            kitchen_service=DIContainer._get_kitchen_service(),
+            state=st.session_state,
         )
\ No newline at end of file
@@ -13,7 +13,7 @@ def warm_up_cache():
     menu_service = MenuService()
     table_service = TableService()
     with ThreadPoolExecutor() as executor:
-        executor.submit(menu_service.get_categories)
+        executor.submit(menu_service.get_menu)
         executor.submit(table_service.get_tables)
 
 warm_up_cache()
@@ -1,12 +1,13 @@
-from typing import List
+from typing import List, Tuple
 import sys
 from pathlib import Path
-import streamlit as st
 
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
 from apps.api.modules import DailyRevenue, DishPopularity, WaiterPerformance
 from apps.ui.services.api_client import APIClient
+from apps.ui.services.async_client import AsyncAPIClient
+from apps.ui.core.cache import cached
 
 
 class AnalyticsService:
@@ -17,8 +18,28 @@ class AnalyticsService:
 
     def __init__(self):
         self.client = APIClient()
+        self.async_client = AsyncAPIClient()
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
+    def get_dashboard(
+        _self,
+    ) -> Tuple[List[DailyRevenue], List[DishPopularity], List[WaiterPerformance]]:
+        """
+        Fetch revenue, popular dishes and staff stats concurrently.
+        Cached for 60 seconds.
+        """
+        revenue, dishes, staff = _self.async_client.gather(
+            _self.async_client.get("/analytics/revenue"),
+            _self.async_client.get("/analytics/popular-dishes"),
+            _self.async_client.get("/analytics/staff-performance"),
+        )
+        return (
+            [DailyRevenue.model_validate(item) for item in revenue],
+            [DishPopularity.model_validate(item) for item in dishes],
+            [WaiterPerformance.model_validate(item) for item in staff],
+        )
+
+    @cached(ttl=60)
     def get_revenue_stats(_self) -> List[DailyRevenue]:
         """
         Fetch daily revenue statistics.
@@ -28,7 +49,7 @@ class AnalyticsService:
         data = _self.client.get("/analytics/revenue")
         return [DailyRevenue.model_validate(item) for item in data]
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_popular_dishes(_self) -> List[DishPopularity]:
         """
         Fetch the top 10 most popular dishes.
@@ -37,7 +58,7 @@ class AnalyticsService:
         data = _self.client.get("/analytics/popular-dishes")
         return [DishPopularity.model_validate(item) for item in data]
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_staff_performance(_self) -> List[WaiterPerformance]:
         """
         Fetch performance stats for waiters.
@@ -2,9 +2,16 @@ import sys
 from pathlib import Path
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
+import json
 import logging
+import threading
+import time
 import requests
-from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 from apps.ui.config import settings
 from apps.ui.utils.exceptions import (
     APIConnectionError,
@@ -15,6 +22,108 @@ from apps.ui.utils.exceptions import (
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("frontend.api_client")
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+RETRY_STATUSES = (502, 503, 504)
+
+_adapter_lock = threading.Lock()
+_adapter: Optional[HTTPAdapter] = None
+_sessions = threading.local()
+
+
+def _get_adapter() -> HTTPAdapter:
+    """
+    The process-wide connection pool (urllib3's pool is thread-safe).
+    Connect errors are retried for every method, since nothing was sent;
+    read errors and 502/503/504 only for idempotent methods (GET, DELETE...).
+    """
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            retry = Retry(
+                total=settings.API_RETRIES,
+                backoff_factor=settings.API_RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            )
+            _adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.API_POOL_SIZE,
+                max_retries=retry,
+            )
+        return _adapter
+
+
+class RevalidationStore:
+    """
+    Last ETag and parsed body per GET (url + query), shared by every session
+    and by both API clients. It keeps the parsed value, so an unchanged
+    resource (304) costs neither a download nor model validation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[str, Any]] = {}
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+    def headers(self, key: str, headers: Dict[str, str]) -> Dict[str, str]:
+        """`headers` plus If-None-Match when a validator is stored for `key`."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return dict(headers, **{"If-None-Match": entry[0]}) if entry else headers
+
+    def cached(self, key: str) -> Any:
+        with self._lock:
+            return self._entries[key][1]
+
+    def store(self, key: str, etag: Optional[str], value: Any) -> None:
+        with self._lock:
+            if etag:
+                self._entries[key] = (etag, value)
+            else:
+                self._entries.pop(key, None)
+
+
+revalidation_store = RevalidationStore()
+
+
+def api_error(status: int, detail: str) -> AppError:
+    """Maps an API error status to the application's typed exceptions."""
+    if status == 404:
+        return ResourceNotFoundError(f"Resource not found: {detail}")
+    if status in (400, 422):
+        return ValidationError(f"Validation error: {detail}")
+    return AppError(f"Server error ({status}): {detail}")
+
+
+def accept_encoding() -> str:
+    """
+    Accept-Encoding for API calls: every coding urllib3 can decode here
+    (gzip, deflate, plus br when brotli is installed), or identity with
+    API_COMPRESSION off, e.g. when the API sits on the same host.
+    """
+    return ACCEPT_ENCODING if settings.API_COMPRESSION else "identity"
+
+
+def get_session() -> requests.Session:
+    """
+    A keep-alive session for the calling thread.
+    Sessions are per thread (they are not thread-safe), but all of them
+    share one connection pool, so sockets are reused across reruns and
+    across threads.
+    """
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["Accept-Encoding"] = accept_encoding()
+        adapter = _get_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _sessions.session = session
+    return session
 
 
 class APIClient:
@@ -50,17 +159,30 @@ class APIClient:
                 error_detail = str(http_err)
 
             logger.error(f"API Error ({status}): {error_detail}")
-
-            if status == 404:
-                raise ResourceNotFoundError(f"Resource not found: {error_detail}")
-            elif status in (400, 422):
-                raise ValidationError(f"Validation error: {error_detail}")
-            else:
-                raise AppError(f"Server error ({status}): {error_detail}")
+            raise api_error(status, error_detail)
         except Exception as err:
             logger.error(f"Unexpected Error processing response: {err}")
             raise AppError(f"An unexpected error occurred: {err}")
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends one request on the pooled session, timing it at DEBUG level.
+        Connection failures (after retries) become APIConnectionError.
+        """
+        kwargs.setdefault("headers", self.headers)
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            logger.critical(f"Connection failed: {url}")
+            raise APIConnectionError("Backend unreachable", original_error=e)
+        logger.debug(
+            f"{method} {url} -> {response.status_code} "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return response
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Perform a GET request.
@@ -74,35 +196,115 @@ class APIClient:
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"GET {url}")
+        response = self._request("GET", url, params=params)
+        return self._handle_response(response)
+
+    def get_conditional(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Perform a GET revalidated with the last ETag seen for it.
+
+        Args:
+            endpoint (str): The API path (e.g., "/menu/dishes").
+            params (dict, optional): Query parameters.
+            parse (callable, optional): Turns the JSON into the value to keep.
+
+        Returns:
+            Any: The parsed body; the stored one when the API answers 304.
+        """
+        url = f"{self.base_url}{endpoint}"
+        key = revalidation_store.key(url, params)
+        logger.info(f"GET {url} (conditional)")
+        response = self._request(
+            "GET", url, params=params, headers=revalidation_store.headers(key, self.headers)
+        )
+        if response.status_code == 304:
+            return revalidation_store.cached(key)
+        data = self._handle_response(response)
+        value = parse(data) if parse else data
+        revalidation_store.store(key, response.headers.get("ETag"), value)
+        return value
+
+    def stream(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        Perform a streaming GET, asking the API for NDJSON.
+        Rows are yielded as their lines arrive, so parsing starts with the
+        first chunk instead of after the whole body.
+
+        Args:
+            endpoint (str): The API path (e.g., "/menu/dishes").
+            params (dict, optional): Query parameters.
+
+        Yields:
+            Any: One decoded JSON row at a time.
+        """
+        url = f"{self.base_url}{endpoint}"
+        logger.info(f"GET {url} (stream)")
+        headers = dict(self.headers, Accept=NDJSON_MEDIA_TYPE)
         try:
-            response = requests.get(
-                url, headers=self.headers, params=params, timeout=self.timeout
-            )
-            return self._handle_response(response)
+            with self._request(
+                "GET", url, headers=headers, params=params, stream=True
+            ) as response:
+                if not response.ok:
+                    self._handle_response(response)
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
         except requests.exceptions.ConnectionError as e:
             logger.critical(f"Connection failed: {url}")
             raise APIConnectionError("Backend unreachable", original_error=e)
+        except requests.exceptions.ChunkedEncodingError as e:
+            logger.error(f"Stream interrupted: {url}")
+            raise AppError(f"Stream interrupted: {e}")
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Any:
+    def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+    ) -> List[Any]:
+        """
+        Follow a keyset-paginated listing to the end.
+
+        Args:
+            endpoint (str): The API path.
+            params (dict, optional): Extra query parameters.
+            page_size (int): Rows per request (`limit`).
+
+        Returns:
+            List[Any]: The rows of every page, in order.
+        """
+        url = f"{self.base_url}{endpoint}"
+        query = dict(params or {}, limit=page_size)
+        rows: List[Any] = []
+        while True:
+            logger.info(f"GET {url} (after={query.get('after', 0)})")
+            response = self._request("GET", url, params=query)
+            rows.extend(self._handle_response(response))
+            next_after = response.headers.get("X-Next-After")
+            if not next_after:
+                return rows
+            query["after"] = next_after
+
+    def post(self, endpoint: str, data: Union[Dict[str, Any], List[Any]]) -> Any:
         """
         Perform a POST request.
 
         Args:
             endpoint (str): The API path.
-            data (dict): The JSON payload.
+            data (dict | list): The JSON payload.
 
         Returns:
             Any: The JSON response.
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"POST {url}")
-        try:
-            response = requests.post(
-                url, headers=self.headers, json=data, timeout=self.timeout
-            )
-            return self._handle_response(response)
-        except requests.exceptions.ConnectionError as e:
-            raise APIConnectionError("Backend unreachable", original_error=e)
+        response = self._request("POST", url, json=data)
+        return self._handle_response(response)
 
     def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -117,13 +319,8 @@ class APIClient:
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"PATCH {url}")
-        try:
-            response = requests.patch(
-                url, headers=self.headers, json=data or {}, timeout=self.timeout
-            )
-            return self._handle_response(response)
-        except requests.exceptions.ConnectionError as e:
-            raise APIConnectionError("Backend unreachable", original_error=e)
+        response = self._request("PATCH", url, json=data or {})
+        return self._handle_response(response)
 
     def delete(self, endpoint: str) -> Any:
         """
@@ -137,8 +334,5 @@ class APIClient:
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"DELETE {url}")
-        try:
-            response = requests.delete(url, headers=self.headers, timeout=self.timeout)
-            return self._handle_response(response)
-        except requests.exceptions.ConnectionError as e:
-            raise APIConnectionError("Backend unreachable", original_error=e)
\ No newline at end of file
+        response = self._request("DELETE", url)
+        return self._handle_response(response)
\ No newline at end of file
@@ -0,0 +1,197 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.append(str(project_root))
+import asyncio
+import json
+import logging
+import threading
+import time
+import httpx
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from apps.ui.config import settings
+from apps.ui.services.api_client import (
+    NDJSON_MEDIA_TYPE,
+    accept_encoding,
+    api_error,
+    revalidation_store,
+)
+from apps.ui.utils.exceptions import APIConnectionError, AppError
+
+logger = logging.getLogger("frontend.async_client")
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    The process-wide event loop, running on one daemon thread.
+    Streamlit runs each session's script on its own thread; they all submit
+    their coroutines here instead of starting loops or thread pools per rerun.
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="api-async-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def _get_http() -> httpx.AsyncClient:
+    """The shared keep-alive HTTP client; only used from the background loop."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            timeout=settings.API_TIMEOUT,
+            headers={"Accept-Encoding": accept_encoding()},
+            limits=httpx.Limits(
+                max_connections=settings.API_POOL_SIZE,
+                max_keepalive_connections=settings.API_POOL_SIZE,
+            ),
+            # Connect failures only: nothing was sent, so any method is safe to retry.
+            transport=httpx.AsyncHTTPTransport(retries=settings.API_RETRIES),
+        )
+    return _http
+
+
+class AsyncAPIClient:
+    """
+    asyncio counterpart of APIClient, for fetching several resources at once.
+
+    Coroutines (`get`, `get_rows`) run on a shared background loop with a
+    shared httpx client; `gather` is the blocking entry point for the
+    (synchronous) Streamlit code.
+    """
+
+    def __init__(self):
+        self.base_url = settings.API_BASE_URL.rstrip("/")
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def gather(self, *calls: Awaitable[Any]) -> List[Any]:
+        """
+        Runs the given coroutines concurrently and returns their results in order.
+        The first failure is raised once every call has finished.
+        """
+        async def run_all():
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return results
+
+        future = asyncio.run_coroutine_threadsafe(run_all(), _get_loop())
+        return future.result()
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Perform a GET request.
+
+        Args:
+            endpoint (str): The API path (e.g., "/menu/dishes").
+            params (dict, optional): Query parameters.
+
+        Returns:
+            Any: The JSON response.
+        """
+        url = f"{self.base_url}{endpoint}"
+        logger.info(f"GET {url} (async)")
+        started = time.perf_counter()
+        try:
+            response = await _get_http().get(url, headers=self.headers, params=params)
+        except httpx.TransportError as e:
+            logger.critical(f"Connection failed: {url}")
+            raise APIConnectionError("Backend unreachable", original_error=e)
+        self._log_timing("GET", url, response.status_code, started)
+        return self._handle_response(response)
+
+    async def get_conditional(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Perform a GET revalidated with the last ETag seen for it
+        (same store and contract as APIClient.get_conditional).
+
+        Returns:
+            Any: The parsed body; the stored one when the API answers 304.
+        """
+        url = f"{self.base_url}{endpoint}"
+        key = revalidation_store.key(url, params)
+        logger.info(f"GET {url} (async conditional)")
+        started = time.perf_counter()
+        try:
+            response = await _get_http().get(
+                url, headers=revalidation_store.headers(key, self.headers), params=params
+            )
+        except httpx.TransportError as e:
+            logger.critical(f"Connection failed: {url}")
+            raise APIConnectionError("Backend unreachable", original_error=e)
+        self._log_timing("GET", url, response.status_code, started)
+        if response.status_code == 304:
+            return revalidation_store.cached(key)
+        data = self._handle_response(response)
+        value = parse(data) if parse else data
+        revalidation_store.store(key, response.headers.get("ETag"), value)
+        return value
+
+    async def get_rows(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Perform a streaming GET (NDJSON), decoding rows as their lines arrive.
+
+        Args:
+            endpoint (str): The API path (e.g., "/menu/dishes").
+            params (dict, optional): Query parameters.
+
+        Returns:
+            List[Any]: Every decoded row.
+        """
+        url = f"{self.base_url}{endpoint}"
+        logger.info(f"GET {url} (async stream)")
+        headers = dict(self.headers, Accept=NDJSON_MEDIA_TYPE)
+        started = time.perf_counter()
+        try:
+            async with _get_http().stream("GET", url, headers=headers, params=params) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._handle_response(response)
+                rows = [json.loads(line) async for line in response.aiter_lines() if line]
+        except httpx.TransportError as e:
+            logger.critical(f"Connection failed: {url}")
+            raise APIConnectionError("Backend unreachable", original_error=e)
+        self._log_timing("GET", url, response.status_code, started)
+        return rows
+
+    @staticmethod
+    def _log_timing(method: str, url: str, status: int, started: float) -> None:
+        logger.debug(
+            f"{method} {url} -> {status} in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> Any:
+        """Same contract as APIClient._handle_response, for httpx responses."""
+        if response.is_error:
+            try:
+                detail = response.json().get("detail", response.reason_phrase)
+            except Exception:
+                detail = response.reason_phrase
+            logger.error(f"API Error ({response.status_code}): {detail}")
+            raise api_error(response.status_code, detail)
+        if response.status_code == 204:
+            return None
+        try:
+            return response.json()
+        except ValueError as err:
+            logger.error(f"Unexpected Error processing response: {err}")
+            raise AppError(f"An unexpected error occurred: {err}")
@@ -1,22 +1,35 @@
 import sys
 from pathlib import Path
-import streamlit as st
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
 from typing import List
 from apps.api.modules import CustomerResponse, CustomerCreate
 from apps.ui.services.api_client import APIClient
+from apps.ui.core.cache import cached
 
 class CustomerService:
     def __init__(self):
         self.client = APIClient()
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_customers(_self) -> List[CustomerResponse]:
-        data = _self.client.get("/customers/")
-        return [CustomerResponse.model_validate(c) for c in data]
+        """Customer rows only (no order history), sorted by name."""
+        customers = [
+            CustomerResponse.model_validate(c) for c in _self.client.stream("/customers/")
+        ]
+        return sorted(customers, key=lambda c: c.nome)
+
+    @cached(ttl=60)
+    def get_customers_with_orders(_self, orders_limit: int = 20) -> List[CustomerResponse]:
+        """Customers with their latest `orders_limit` orders each."""
+        data = _self.client.get_all_pages(
+            "/customers/", {"include": "orders", "orders_limit": orders_limit}
+        )
+        customers = [CustomerResponse.model_validate(c) for c in data]
+        return sorted(customers, key=lambda c: c.nome)
 
     def create_customer(self, customer: CustomerCreate) -> CustomerResponse:
         data = self.client.post("/customers/", customer.model_dump())
         self.get_customers.clear()
+        self.get_customers_with_orders.clear()
         return CustomerResponse.model_validate(data)
\ No newline at end of file
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.append(str(project_root))
+from typing import Optional
+from apps.api.modules import KitchenTickets
+from apps.ui.services.api_client import APIClient
+
+
+class KitchenService:
+    """
+    Service layer for the kitchen display.
+    """
+
+    def __init__(self):
+        self.client = APIClient()
+
+    def get_tickets(self, since: Optional[str] = None) -> KitchenTickets:
+        """
+        Kitchen tickets changed since a previous sync cursor ('sincronizado_em'),
+        or every ticket without one. Not cached: the caller applies the delta.
+        """
+        params = {"since": since} if since else None
+        return KitchenTickets.model_validate(self.client.get("/kitchen/tickets", params=params))
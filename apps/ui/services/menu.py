@@ -1,34 +1,57 @@
 import sys
 from pathlib import Path
-import streamlit as st
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
-from typing import List
+from typing import List, Tuple
 from apps.api.modules import DishResponse, DishCreate, DishUpdate
 from apps.ui.services.api_client import APIClient
+from apps.ui.services.async_client import AsyncAPIClient
+from apps.ui.core.cache import cached
+
+# The UI never shows the reviews nested in dishes; the API then skips aggregating them.
+DISH_PARAMS = {"exclude": "avaliacoes"}
+
+
+def _parse_dishes(data) -> List[DishResponse]:
+    return [DishResponse.model_validate(item) for item in data]
+
 
 class MenuService:
     """
     Service layer for managing the restaurant menu.
-    Cached because menus change rarely but are read often.
+    Cached because menus change rarely but are read often; expired entries
+    are revalidated with the ETag instead of downloaded again.
     """
 
     def __init__(self):
         self.client = APIClient()
+        self.async_client = AsyncAPIClient()
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_dishes(_self) -> List[DishResponse]:
-        data = _self.client.get("/menu/dishes")
-        return [DishResponse.model_validate(item) for item in data]
+        return _self.client.get_conditional("/menu/dishes", DISH_PARAMS, _parse_dishes)
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_categories(_self) -> List[str]:
-        return _self.client.get("/menu/categories")
+        return _self.client.get_conditional("/menu/categories")
 
-    def create_dish(self, dish: DishCreate) -> DishResponse:
-        response_data = self.client.post("/menu/dishes", dish.model_dump(mode='json'))
+    @cached(ttl=60)
+    def get_menu(_self) -> Tuple[List[DishResponse], List[str]]:
+        """Dishes and categories, fetched concurrently."""
+        dishes, categories = _self.async_client.gather(
+            _self.async_client.get_conditional("/menu/dishes", DISH_PARAMS, _parse_dishes),
+            _self.async_client.get_conditional("/menu/categories"),
+        )
+        return dishes, categories
+
+    def _clear_caches(self) -> None:
         self.get_dishes.clear()
         self.get_categories.clear()
+        self.get_menu.clear()
+
+    def create_dish(self, dish: DishCreate) -> DishResponse:
+        response_data = self.client.post("/menu/dishes", dish.model_dump(mode='json'))
+        self._clear_caches()
         return DishResponse.model_validate(response_data)
 
     def update_dish(self, dish_id: int, updates: DishUpdate) -> DishResponse:
@@ -36,11 +59,9 @@ class MenuService:
             f"/menu/dishes/{dish_id}",
             updates.model_dump(mode='json', exclude_unset=True)
         )
-        self.get_dishes.clear()
-        self.get_categories.clear()
+        self._clear_caches()
         return DishResponse.model_validate(response_data)
 
     def delete_dish(self, dish_id: int) -> None:
         self.client.delete(f"/menu/dishes/{dish_id}")
-        self.get_dishes.clear()
-        self.get_categories.clear()
\ No newline at end of file
+        self._clear_caches()
\ No newline at end of file
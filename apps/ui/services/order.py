@@ -1,32 +1,95 @@
 import sys
 from pathlib import Path
-import streamlit as st
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
-from typing import List
-from apps.api.modules import OrderCreate, OrderResponse, OrderItemCreate
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+from apps.api.modules import (
+    OrderChanges,
+    OrderCreate,
+    OrderResponse,
+    OrderItemCreate,
+    OrdersPage,
+)
 from apps.ui.services.api_client import APIClient
+from apps.ui.services.order_events import OrderEventListener
+from apps.ui.core.cache import cached
+
+logger = logging.getLogger("frontend.services.order")
+_listener_lock = threading.Lock()
+_listener: Optional[OrderEventListener] = None
 
 class OrderService:
     """
     Service layer for handling orders.
+    Writes only drop the cache entries of the order they touched (and the
+    list); `follow_changes()` does the same for writes made elsewhere.
     """
 
     def __init__(self):
         self.client = APIClient()
 
+    def follow_changes(self) -> None:
+        """
+        Starts (once per process) the listener that applies the API's order
+        change events to these caches, so other sessions' writes show up
+        without waiting for the TTLs.
+        """
+        global _listener
+        with _listener_lock:
+            if _listener is None:
+                _listener = OrderEventListener(self.apply_order_event)
+                _listener.start()
+
+    def apply_order_event(self, event: Dict[str, Any]) -> None:
+        """
+        Invalidates what an order change event affects: the listed orders'
+        details and the list; the page options too when an order row itself
+        changed (it may have taken or freed a table). Without order ids
+        (RESYNC, bulk changes) every order cache is dropped.
+        """
+        order_ids = event.get("orders")
+        if event.get("op") == "RESYNC" or order_ids is None:
+            logger.info(f"Order caches reset ({event.get('op')})")
+            self.get_order_details.clear()
+            self.list_orders.clear()
+            self.get_orders_page.clear()
+            return
+        for order_id in order_ids:
+            self.get_order_details.invalidate(order_id)
+        self.list_orders.clear()
+        if event.get("table") == "pedido":
+            self.get_orders_page.clear()
 
-    @st.cache_data(ttl=10, show_spinner=False)
+    @cached(ttl=10)
     def list_orders(_self) -> List[OrderResponse]:
         """
         Fetches all orders. Cached for 10 seconds.
-        Note: '_self' is used to exclude the service instance from hashing if needed,
-        though Streamlit handles Pydantic/Simple classes well.
+        Note: '_self' is used to exclude the service instance from the cache key.
+        """
+        return [
+            OrderResponse.model_validate(item) for item in _self.client.stream("/orders/")
+        ]
+
+    @cached(ttl=30)
+    def get_orders_page(_self) -> OrdersPage:
+        """
+        Customers, free tables, waiters and dishes for the page forms, in
+        one request. Cached for 30 seconds; order changes that free or take
+        a table clear it.
+        """
+        return OrdersPage.model_validate(_self.client.get("/ui/orders-page"))
+
+    def get_order_changes(self, since: Optional[str] = None) -> OrderChanges:
         """
-        data = _self.client.get("/orders/")
-        return [OrderResponse.model_validate(item) for item in data]
+        Orders changed since a previous sync cursor ('sincronizado_em').
+        Not cached: each caller keeps its own cursor and applies the delta.
+        """
+        params = {"since": since} if since else None
+        return OrderChanges.model_validate(self.client.get("/orders/changes", params=params))
 
-    @st.cache_data(ttl=10, show_spinner=False)
+    @cached(ttl=10)
     def get_order_details(_self, order_id: int) -> OrderResponse:
         """Fetches a single order. Cached for 10 seconds."""
         data = _self.client.get(f"/orders/{order_id}")
@@ -37,22 +100,34 @@ class OrderService:
         """Open a new order and invalidate list cache."""
         response = self.client.post("/orders/", order.model_dump())
         self.list_orders.clear()
+        self.get_orders_page.clear()
         return OrderResponse.model_validate(response)
 
     def add_item(self, order_id: int, item: OrderItemCreate) -> OrderResponse:
         """Add item, invalidate specific order cache and list cache."""
         data = self.client.post(f"/orders/{order_id}/items", item.model_dump())
-        self.get_order_details.clear()
+        self.get_order_details.invalidate(order_id)
+        self.list_orders.clear()
+        return OrderResponse.model_validate(data)
+
+    def add_items(self, order_id: int, items: List[OrderItemCreate]) -> OrderResponse:
+        """Add a round of items in one request, then invalidate caches."""
+        data = self.client.post(
+            f"/orders/{order_id}/items:batch", [item.model_dump() for item in items]
+        )
+        self.get_order_details.invalidate(order_id)
         self.list_orders.clear()
         return OrderResponse.model_validate(data)
 
     def remove_item(self, order_id: int, item_id: int) -> None:
         self.client.delete(f"/orders/{order_id}/items/{item_id}")
-        self.get_order_details.clear()
+        self.get_order_details.invalidate(order_id)
         self.list_orders.clear()
+        self.get_orders_page.clear()
 
     def close_order(self, order_id: int) -> OrderResponse:
         data = self.client.patch(f"/orders/{order_id}/close")
-        self.get_order_details.clear()
+        self.get_order_details.invalidate(order_id)
         self.list_orders.clear()
+        self.get_orders_page.clear()
         return OrderResponse.model_validate(data)
\ No newline at end of file
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+project_root = Path(__file__).resolve().parents[2]
+sys.path.append(str(project_root))
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+import requests
+from apps.ui.config import settings
+from apps.ui.services.api_client import get_session
+
+logger = logging.getLogger("frontend.order_events")
+RESYNC_EVENT: Dict[str, Any] = {"table": None, "op": "RESYNC", "orders": None}
+# The API sends a heartbeat every 15s by default; a silent stream past this is dead.
+READ_TIMEOUT_SECONDS = 60
+
+
+class OrderEventListener:
+    """
+    Follows the API's order change feed (GET /orders/stream, Server-Sent
+    Events) on a daemon thread and hands every event to `on_event`.
+
+    After a reconnect `on_event` gets a RESYNC event first, since anything
+    published while the stream was down is lost.
+    """
+
+    def __init__(self, on_event: Callable[[Dict[str, Any]], None]):
+        self.url = f"{settings.API_BASE_URL.rstrip('/')}/orders/stream"
+        self.on_event = on_event
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="order-event-listener", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        delay = 1.0
+        connected_before = False
+        while True:
+            try:
+                with get_session().get(
+                    self.url,
+                    headers={"Accept": "text/event-stream"},
+                    stream=True,
+                    timeout=(settings.API_TIMEOUT, READ_TIMEOUT_SECONDS),
+                ) as response:
+                    response.raise_for_status()
+                    logger.info(f"Following order changes at {self.url}")
+                    if connected_before:
+                        self._dispatch(dict(RESYNC_EVENT))
+                    connected_before = True
+                    delay = 1.0
+                    self._consume(response)
+            except Exception as e:
+                logger.warning(f"Order change feed lost, retrying in {delay:.0f}s: {e}")
+            time.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _consume(self, response: requests.Response) -> None:
+        """Parses the SSE stream: 'data:' lines up to a blank line make one event."""
+        data = []
+        for line in response.iter_lines(decode_unicode=True):
+            if line:
+                if line.startswith("data:"):
+                    data.append(line[5:].strip())
+                continue
+            if data:
+                try:
+                    event = json.loads("\n".join(data))
+                except ValueError:
+                    logger.warning(f"Malformed order change event: {data!r}")
+                    event = dict(RESYNC_EVENT)
+                data = []
+                self._dispatch(event)
+
+    def _dispatch(self, event: Dict[str, Any]) -> None:
+        try:
+            self.on_event(event)
+        except Exception as e:
+            logger.exception(f"Order change handler failed: {e}")
@@ -2,14 +2,24 @@ import sys
 from pathlib import Path
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
-from typing import List
-from apps.api.modules import ReviewResponse, ReviewCreate, ReviewUpdate
+from typing import List, Optional
+from apps.api.modules import ReviewResponse, ReviewCreate, ReviewUpdate, ReviewsPage
 from apps.ui.services.api_client import APIClient
+from apps.ui.core.cache import cached
 
 class ReviewService:
     def __init__(self):
         self.client = APIClient()
 
+    @cached(ttl=30)
+    def get_reviews_page(_self, customer_id: Optional[int] = None) -> ReviewsPage:
+        """
+        Dishes, customers with closed orders and, given `customer_id`, the
+        dishes that customer can review, in one request. Cached for 30 seconds.
+        """
+        params = {"customer_id": customer_id} if customer_id is not None else None
+        return ReviewsPage.model_validate(_self.client.get("/ui/reviews-page", params=params))
+
     def create_review(self, review: ReviewCreate) -> ReviewResponse:
         data = self.client.post("/reviews/", review.model_dump())
         return ReviewResponse.model_validate(data)
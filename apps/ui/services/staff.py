@@ -1,48 +1,70 @@
 import sys
 import json
 from pathlib import Path
-import streamlit as st
 project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
-from typing import List
+from typing import List, Tuple
 from apps.api.modules import WaiterResponse, WaiterCreate, ChefResponse, ChefCreate
 from apps.ui.services.api_client import APIClient
+from apps.ui.services.async_client import AsyncAPIClient
+from apps.ui.core.cache import cached
+
+def _parse_waiters(data) -> List[WaiterResponse]:
+    return [WaiterResponse.model_validate(item) for item in data]
+
+
+def _parse_chefs(data) -> List[ChefResponse]:
+    return [ChefResponse.model_validate(item) for item in data]
+
 
 class StaffService:
     """
     Service layer for managing employees.
-    Cached for dropdown performance.
+    Cached for dropdown performance; expired entries are revalidated (ETag).
     """
 
     def __init__(self):
         self.client = APIClient()
+        self.async_client = AsyncAPIClient()
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_waiters(_self) -> List[WaiterResponse]:
-        data = _self.client.get("/staff/waiters")
-        return [WaiterResponse.model_validate(item) for item in data]
+        return _self.client.get_conditional("/staff/waiters", parse=_parse_waiters)
+
+    @cached(ttl=60)
+    def get_staff(_self) -> Tuple[List[WaiterResponse], List[ChefResponse]]:
+        """Waiters and chefs, fetched concurrently."""
+        waiters, chefs = _self.async_client.gather(
+            _self.async_client.get_conditional("/staff/waiters", parse=_parse_waiters),
+            _self.async_client.get_conditional("/staff/chefs", parse=_parse_chefs),
+        )
+        return waiters, chefs
+
+    def _clear_caches(self) -> None:
+        self.get_waiters.clear()
+        self.get_chefs.clear()
+        self.get_staff.clear()
 
     def create_waiter(self, waiter_data: WaiterCreate) -> WaiterResponse:
         payload = json.loads(waiter_data.model_dump_json())
         response = self.client.post("/staff/waiters", payload)
-        self.get_waiters.clear()
+        self._clear_caches()
         return WaiterResponse.model_validate(response)
 
     def delete_waiter(self, waiter_id: int) -> None:
         self.client.delete(f"/staff/waiters/{waiter_id}")
-        self.get_waiters.clear()
+        self._clear_caches()
 
-    @st.cache_data(ttl=60, show_spinner=False)
+    @cached(ttl=60)
     def get_chefs(_self) -> List[ChefResponse]:
-        data = _self.client.get("/staff/chefs")
-        return [ChefResponse.model_validate(item) for item in data]
+        return _self.client.get_conditional("/staff/chefs", parse=_parse_chefs)
 
     def create_chef(self, chef_data: ChefCreate) -> ChefResponse:
         payload = json.loads(chef_data.model_dump_json())
         response = self.client.post("/staff/chefs", payload)
-        self.get_chefs.clear()
+        self._clear_caches()
         return ChefResponse.model_validate(response)
 
     def delete_chef(self, chef_id: int) -> None:
         self.client.delete(f"/staff/chefs/{chef_id}")
-        self.get_chefs.clear()
\ No newline at end of file
+        self._clear_caches()
\ No newline at end of file
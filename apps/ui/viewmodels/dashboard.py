@@ -1,5 +1,4 @@
 from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from dataclasses import dataclass
 from apps.ui.services.analytics import AnalyticsService
@@ -18,7 +17,7 @@ class KPIMetrics:
 class DashboardViewModel:
     """
     Business Logic for the Dashboard.
-    Optimized with Threading for parallel data fetching.
+    The three analytics resources are fetched concurrently (async client).
     """
 
     def __init__(self, analytics_service: AnalyticsService):
@@ -33,18 +32,16 @@ class DashboardViewModel:
         Fetches all required data from the backend IN PARALLEL.
         """
         self._error = None
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_rev = executor.submit(self._service.get_revenue_stats)
-            future_dish = executor.submit(self._service.get_popular_dishes)
-            future_perf = executor.submit(self._service.get_staff_performance)
-            try:
-                self._revenue_data = future_rev.result()
-                self._popular_dishes = future_dish.result()
-                self._staff_performance = future_perf.result()
-            except AppError as e:
-                self._error = str(e)
-            except Exception as e:
-                self._error = f"Erro inesperado ao carregar dashboard: {str(e)}"
+        try:
+            (
+                self._revenue_data,
+                self._popular_dishes,
+                self._staff_performance,
+            ) = self._service.get_dashboard()
+        except AppError as e:
+            self._error = str(e)
+        except Exception as e:
+            self._error = f"Erro inesperado ao carregar dashboard: {str(e)}"
 
     @property
     def has_error(self) -> bool:
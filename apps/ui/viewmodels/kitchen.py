@@ -1,9 +1,11 @@
-from typing import List, Optional
-from dataclasses import dataclass
-from datetime import datetime
-from apps.ui.services.order import OrderService
+from typing import Dict, List, MutableMapping, Optional, Set
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from apps.ui.services.kitchen import KitchenService
 from apps.ui.utils.exceptions import AppError
 
+ALERT_AFTER_MINUTES = 20
+
 
 @dataclass
 class KitchenTicketItem:
@@ -17,79 +19,130 @@ class KitchenTicket:
     """
     Presentation-ready data for a Kitchen Ticket.
     Decouples the UI from the raw API response structure.
+    The elapsed time is derived on access, so a stored ticket stays current;
+    it is left out of comparisons, which only look at the ticket contents.
     """
     order_id: int
     table_label: str
     waiter_label: str
-    time_elapsed_label: str
     items: List[KitchenTicketItem]
-    is_alert: bool
+    created_at: Optional[datetime] = field(default=None, compare=False)
+
+    @property
+    def minutes_elapsed(self) -> Optional[int]:
+        if not self.created_at:
+            return None
+        return int((datetime.now() - self.created_at).total_seconds() / 60)
+
+    @property
+    def time_elapsed_label(self) -> str:
+        minutes = self.minutes_elapsed
+        if minutes is None:
+            return "Agora há pouco"
+        return f"{minutes} minutos atrás"
+
+    @property
+    def is_alert(self) -> bool:
+        minutes = self.minutes_elapsed
+        return minutes is not None and minutes > ALERT_AFTER_MINUTES
 
 
 class KitchenViewModel:
     """
     Business Logic for the Kitchen Display System.
     Handles data fetching, filtering, and transformation into UI-ready tickets.
+
+    Tickets live in the session (`state`), not in the view model, and are
+    kept current by incremental syncs of GET /kitchen/tickets: each `sync()`
+    only downloads the tickets changed since the previous one.
     """
 
-    def __init__(self, order_service: OrderService):
-        self._service = order_service
-        self.tickets: List[KitchenTicket] = []
-        self.last_updated: str = ""
+    STATE_TICKETS = "kitchen_tickets"
+    STATE_CURSOR = "kitchen_cursor"
+    STATE_UPDATED = "kitchen_last_updated"
+
+    def __init__(self, kitchen_service: KitchenService, state: MutableMapping):
+        self._service = kitchen_service
+        self._state = state
+        self._state.setdefault(self.STATE_TICKETS, {})
+        self._state.setdefault(self.STATE_CURSOR, None)
+        self._state.setdefault(self.STATE_UPDATED, "")
         self.last_error: Optional[str] = None
 
-    def load_orders(self) -> None:
+    @property
+    def _tickets(self) -> Dict[int, KitchenTicket]:
+        return self._state[self.STATE_TICKETS]
+
+    @property
+    def tickets(self) -> List[KitchenTicket]:
+        """Tickets in display order (newest order first)."""
+        return sorted(self._tickets.values(), key=lambda t: t.order_id, reverse=True)
+
+    @property
+    def last_updated(self) -> str:
+        return self._state[self.STATE_UPDATED]
+
+    def get_ticket(self, order_id: int) -> Optional[KitchenTicket]:
+        return self._tickets.get(order_id)
+
+    def sync(self) -> Set[int]:
         """
-        Fetches orders, filters for active kitchen tickets, and formats them.
+        Applies the orders changed since the last sync to the stored tickets.
+        The first call (or one after `reset()`) is a full sync.
+
+        Returns:
+            Set[int]: Order ids whose ticket was added, changed or removed.
         """
         self.last_error = None
         try:
-            orders = self._service.list_orders()
-            # Filter: Open orders that have items
-            active_orders = [
-                o for o in orders
-                if str(o.status).lower() not in ['ABERTO', 'FECHADO', 'CANCELADO']
-                and o.itens
-            ]
-            self.tickets = [self._to_ticket(o) for o in active_orders]
-            self.last_updated = datetime.now().strftime("%H:%M:%S")
+            changes = self._service.get_tickets(self._state[self.STATE_CURSOR])
         except AppError as e:
             self.last_error = str(e)
-            self.tickets = []
-
-    def _to_ticket(self, order) -> KitchenTicket:
-        """Transforms a raw Order model into a KitchenTicket DTO."""
-        time_label = "Agora há pouco"
-        is_alert = False
-        if hasattr(order, "criado_em") and order.criado_em:
-            try:
-                if isinstance(order.criado_em, datetime):
-                    created_dt = order.criado_em
-                else:
-                    created_dt = datetime.fromisoformat(str(order.criado_em))
-                delta = datetime.now() - created_dt
-                minutes = int(delta.total_seconds() / 60)
-                time_label = f"{minutes} minutos atrás"
-                if minutes > 20:
-                    is_alert = True
-            except Exception:
-                pass
-        table_disp = getattr(order, "numero_mesa", getattr(order, "id_mesa", "?"))
-        waiter_disp = getattr(order, "nome_garcom", getattr(order, "id_garcom", "?"))
+            return set()
+
+        tickets = self._tickets
+        changed: Set[int] = set()
+        if changes.completo:
+            changed.update(tickets)
+            tickets.clear()
+        for data in changes.tickets:
+            ticket = self._to_ticket(data)
+            if tickets.get(ticket.order_id) != ticket:
+                tickets[ticket.order_id] = ticket
+                changed.add(ticket.order_id)
+        for order_id in changes.removidos:
+            if tickets.pop(order_id, None) is not None:
+                changed.add(order_id)
+
+        self._state[self.STATE_CURSOR] = changes.sincronizado_em.isoformat()
+        self._state[self.STATE_UPDATED] = datetime.now().strftime("%H:%M:%S")
+        return changed
+
+    def reset(self) -> None:
+        """Forgets the cursor so the next sync downloads every ticket."""
+        self._state[self.STATE_CURSOR] = None
+
+    def _to_ticket(self, data) -> KitchenTicket:
+        """Transforms an API kitchen ticket into a KitchenTicket DTO."""
+        known = self._tickets.get(data.id_pedido)
+        created_at = (
+            known.created_at
+            if known
+            else datetime.now() - timedelta(minutes=data.minutos_espera)
+        )
         items = [
             KitchenTicketItem(
                 quantity=i.quantidade,
                 dish_name=i.nome_prato,
                 notes=i.observacoes
             )
-            for i in order.itens
+            for i in data.itens
         ]
 
         return KitchenTicket(
-            order_id=order.id,
-            table_label=str(table_disp),
-            waiter_label=str(waiter_disp),
-            time_elapsed_label=time_label,
+            order_id=data.id_pedido,
+            table_label=str(data.numero_mesa),
+            waiter_label=data.nome_garcom,
             items=items,
-            is_alert=is_alert
-        )
\ No newline at end of file
+            created_at=created_at,
+        )
@@ -1,5 +1,4 @@
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from apps.api.modules import (
     OrderResponse,
@@ -7,10 +6,6 @@ from apps.api.modules import (
     OrderItemCreate,
 )
 from apps.ui.services.order import OrderService
-from apps.ui.services.customers import CustomerService
-from apps.ui.services.tables import TableService
-from apps.ui.services.staff import StaffService
-from apps.ui.services.menu import MenuService
 from apps.ui.utils.exceptions import AppError
 
 
@@ -24,19 +19,8 @@ class NewOrderOptions:
 
 
 class OrdersViewModel:
-    def __init__(
-        self,
-        order_service: OrderService,
-        customer_service: CustomerService,
-        table_service: TableService,
-        staff_service: StaffService,
-        menu_service: MenuService,
-    ):
+    def __init__(self, order_service: OrderService):
         self._order_service = order_service
-        self._customer_service = customer_service
-        self._table_service = table_service
-        self._staff_service = staff_service
-        self._menu_service = menu_service
         self.active_orders: List[OrderResponse] = []
         self._order_cache: Dict[int, OrderResponse] = {}
         self.last_error: Optional[str] = None
@@ -85,7 +69,7 @@ class OrdersViewModel:
         Returns: {id: "Name ($Price)"}
         """
         try:
-            dishes = self._menu_service.get_dishes()
+            dishes = self._order_service.get_orders_page().pratos
             return {d.id: f"{d.nome} (${d.preco:.2f})" for d in dishes}
         except AppError:
             return {}
@@ -93,38 +77,30 @@ class OrdersViewModel:
     def get_new_order_options(self) -> NewOrderOptions:
         """
         Fetches auxiliary data needed to open a new table.
-        Uses threading to fetch Customers, Tables, and Waiters in parallel.
+        Customers, free Tables and Waiters come from the page endpoint.
         """
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_cust = executor.submit(self._customer_service.get_customers)
-            future_tables = executor.submit(self._table_service.get_tables)
-            future_waiters = executor.submit(self._staff_service.get_waiters)
-
-            try:
-                customers = future_cust.result()
-                tables = future_tables.result()
-                waiters = future_waiters.result()
-                cust_map = {c.id: c.nome for c in customers}
-                waiter_map = {w.id: w.nome for w in waiters}
-                table_map = {
-                    t.id: f"Table {t.numero} ({t.capacidade} Seats) - {t.localizacao}"
-                    for t in tables
-                    if not t.eh_ocupada
-                }
-                return NewOrderOptions(
-                    customers=cust_map, tables=table_map, waiters=waiter_map
-                )
-            except AppError as e:
-                self.last_error = f"Failed to load options: {e}"
-                return NewOrderOptions({}, {}, {})
-            except Exception as e:
-                self.last_error = f"Unexpected error: {e}"
-                return NewOrderOptions({}, {}, {})
+        try:
+            page = self._order_service.get_orders_page()
+            cust_map = {c.id: c.nome for c in page.clientes}
+            waiter_map = {w.id: w.nome for w in page.garcons}
+            table_map = {
+                t.id: f"Table {t.numero} ({t.capacidade} Seats) - {t.localizacao}"
+                for t in page.mesas_livres
+            }
+            return NewOrderOptions(
+                customers=cust_map, tables=table_map, waiters=waiter_map
+            )
+        except AppError as e:
+            self.last_error = f"Failed to load options: {e}"
+            return NewOrderOptions({}, {}, {})
+        except Exception as e:
+            self.last_error = f"Unexpected error: {e}"
+            return NewOrderOptions({}, {}, {})
 
     def check_table_capacity(self, table_id: int, guest_count: int) -> Optional[str]:
         """Pre-validation check for table capacity."""
         try:
-            tables = self._table_service.get_tables()
+            tables = self._order_service.get_orders_page().mesas_livres
             selected = next((t for t in tables if t.id == table_id), None)
             if selected and guest_count > selected.capacidade:
                 return (
@@ -168,6 +144,30 @@ class OrdersViewModel:
             self.last_error = str(e)
             return False
 
+    def add_items_to_order(self, order_id: int, round_items: Dict[int, int]) -> bool:
+        """
+        Sends a whole round ({dish_id: quantity}) in a single batch request.
+        """
+        self.last_error = None
+        if not round_items:
+            self.last_error = "The round is empty."
+            return False
+        if any(qty < 1 for qty in round_items.values()):
+            self.last_error = "Quantity must be at least 1."
+            return False
+
+        try:
+            items = [
+                OrderItemCreate(id_prato=dish_id, quantidade=qty)
+                for dish_id, qty in round_items.items()
+            ]
+            self._order_service.add_items(order_id, items)
+            self._invalidate_cache(order_id)
+            return True
+        except AppError as e:
+            self.last_error = str(e)
+            return False
+
     def remove_item_from_order(self, order_id: int, item_id: int) -> bool:
         self.last_error = None
         try:
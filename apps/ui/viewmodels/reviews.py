@@ -2,8 +2,6 @@ from typing import List, Dict
 from dataclasses import dataclass
 from apps.api.modules import ReviewResponse, ReviewCreate, ReviewUpdate
 from apps.ui.services.reviews import ReviewService
-from apps.ui.services.menu import MenuService
-from apps.ui.services.customers import CustomerService
 from apps.ui.utils.exceptions import AppError
 
 
@@ -21,19 +19,12 @@ class ReviewsViewModel:
     Zero Streamlit dependencies. Testable.
     """
 
-    def __init__(
-        self,
-        review_service: ReviewService,
-        menu_service: MenuService,
-        customer_service: CustomerService,
-    ):
+    def __init__(self, review_service: ReviewService):
         self._review_service = review_service
-        self._menu_service = menu_service
-        self._customer_service = customer_service
 
     def get_dishes_map(self) -> Dict[int, str]:
         try:
-            dishes = self._menu_service.get_dishes()
+            dishes = self._review_service.get_reviews_page().pratos
             return {d.id: d.nome for d in dishes}
         except AppError:
             return {}
@@ -44,41 +35,27 @@ class ReviewsViewModel:
     def get_eligible_customers(self) -> Dict[int, str]:
         """Returns {id: name} of customers with closed orders."""
         try:
-            customers = self._customer_service.get_customers()
-            eligible = {}
-            for c in customers:
-                if any(str(o.status).upper() == "FECHADO" and o.itens for o in c.pedidos):
-                    eligible[c.id] = c.nome
-            return eligible
+            customers = self._review_service.get_reviews_page().clientes
+            return {c.id: c.nome for c in customers}
         except AppError:
             return {}
 
     def get_customer_reviewable_items(self, customer_id: int) -> List[ReviewableItem]:
         try:
-            all_customers = self._customer_service.get_customers()
-            customer = next((c for c in all_customers if c.id == customer_id), None)
-            if not customer:
-                return []
+            page = self._review_service.get_reviews_page(customer_id)
             items = []
-            sorted_orders = sorted(
-                customer.pedidos, key=lambda o: o.criado_em or "", reverse=True
-            )
-            for order in sorted_orders:
-                if str(order.status).upper() == "FECHADO" and order.itens:
-                    date_lbl = (
-                        order.criado_em.strftime("%Y-%m-%d")
-                        if order.criado_em
-                        else "?"
+            for item in page.itens:
+                date_lbl = (
+                    item.data_pedido.strftime("%Y-%m-%d") if item.data_pedido else "?"
+                )
+                items.append(
+                    ReviewableItem(
+                        label=f"{item.nome_prato} (Order #{item.id_pedido} - {date_lbl})",
+                        order_id=item.id_pedido,
+                        dish_id=item.id_prato,
+                        dish_name=item.nome_prato,
                     )
-                    for item in order.itens:
-                        items.append(
-                            ReviewableItem(
-                                label=f"{item.nome_prato} (Order #{order.id} - {date_lbl})",
-                                order_id=order.id,
-                                dish_id=item.id_prato,
-                                dish_name=item.nome_prato,
-                            )
-                        )
+                )
             return items
         except AppError:
             return []
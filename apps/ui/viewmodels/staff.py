@@ -1,5 +1,4 @@
 from typing import List, Optional, Set
-from concurrent.futures import ThreadPoolExecutor
 from apps.api.modules import WaiterResponse, WaiterCreate, ChefResponse, ChefCreate
 from apps.ui.services.staff import StaffService
 from apps.ui.utils.exceptions import AppError
@@ -8,7 +7,7 @@ from apps.ui.utils.exceptions import AppError
 class StaffViewModel:
     """
     Business Logic for the Staff Management Page.
-    Handles parallel data fetching for Waiters and Chefs.
+    Waiters and Chefs are fetched concurrently (async client).
     """
 
     def __init__(self, staff_service: StaffService):
@@ -19,23 +18,19 @@ class StaffViewModel:
 
     def load_staff(self) -> None:
         """
-        Refreshes the local state of waiters and chefs using Parallel Execution.
+        Refreshes the local state of waiters and chefs.
         """
         self.last_error = None
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_waiters = executor.submit(self._service.get_waiters)
-            future_chefs = executor.submit(self._service.get_chefs)
-            try:
-                self.waiters = future_waiters.result()
-                self.chefs = future_chefs.result()
-            except AppError as e:
-                self.last_error = str(e)
-                self.waiters = []
-                self.chefs = []
-            except Exception as e:
-                self.last_error = f"Unexpected error: {str(e)}"
-                self.waiters = []
-                self.chefs = []
+        try:
+            self.waiters, self.chefs = self._service.get_staff()
+        except AppError as e:
+            self.last_error = str(e)
+            self.waiters = []
+            self.chefs = []
+        except Exception as e:
+            self.last_error = f"Unexpected error: {str(e)}"
+            self.waiters = []
+            self.chefs = []
 
     def get_existing_specialties(self) -> List[str]:
         """Extracts unique specialties from existing chefs for autocomplete."""
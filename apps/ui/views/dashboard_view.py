@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.express as px
 from apps.ui.viewmodels.dashboard import DashboardViewModel
+from apps.ui.core.cache import clear_all
 
 
 class DashboardView:
@@ -30,7 +31,7 @@ class DashboardView:
         st.divider()
         self._render_staff_section()
         if st.button("🔄 Recarregar Dados"):
-            st.cache_data.clear()
+            clear_all()
             st.rerun()
 
     def _render_kpis(self):
@@ -1,12 +1,18 @@
 import streamlit as st
-import time
 from apps.ui.viewmodels.kitchen import KitchenViewModel, KitchenTicket
 
+SYNC_INTERVAL_SECONDS = 5
+
 
 class KitchenView:
     """
     Handles the UI Rendering for the Kitchen Display System (KDS).
     Strictly presentation logic; delegates data ops to KitchenViewModel.
+
+    The grid is drawn once per full run, one placeholder per ticket. A
+    fragment then syncs every few seconds and redraws only the tickets that
+    changed (or whose elapsed minutes moved on); the whole page reruns only
+    when tickets are added or removed.
     """
 
     def __init__(self, view_model: KitchenViewModel):
@@ -16,31 +22,53 @@ class KitchenView:
         st.title("🍳 Sistema de Cozinha")
         top_col, _ = st.columns([6, 1])
         with top_col:
-            st.caption("Feed Automático • Recarrega a cada 30s")
-        content_placeholder = st.empty()
-        self.vm.load_orders()
-        with content_placeholder.container():
-            if self.vm.last_error:
-                st.error(f"🔌 Conexão Perdida: {self.vm.last_error}")
-            elif not self.vm.tickets:
-                self._render_empty_state()
-            else:
-                self._render_ticket_grid()
+            st.caption(f"Feed Automático • Sincroniza a cada {SYNC_INTERVAL_SECONDS}s")
+        self.vm.sync()
+        placeholders = {}
+        if self.vm.last_error:
+            st.error(f"🔌 Conexão Perdida: {self.vm.last_error}")
+        elif not self.vm.tickets:
+            self._render_empty_state()
+        else:
+            placeholders = self._render_ticket_grid()
         st.markdown("---")
         c1, c2 = st.columns([6, 1])
         with c1:
-            if self.vm.last_updated:
-                st.caption(f"Última atualização: {self.vm.last_updated}")
+            self._sync_fragment(placeholders)
         with c2:
             if st.button("🔄 Recarregar"):
+                self.vm.reset()
                 st.rerun()
 
+    @st.fragment(run_every=SYNC_INTERVAL_SECONDS)
+    def _sync_fragment(self, placeholders):
+        """
+        Pulls the delta and patches the affected ticket placeholders in place.
+        A change in the set of tickets needs a new grid, so it reruns the page.
+        """
+        changed = self.vm.sync()
+        if self.vm.last_error:
+            st.caption(f"🔌 Falha na sincronização: {self.vm.last_error}")
+            return
+        if {t.order_id for t in self.vm.tickets} != set(placeholders):
+            st.rerun()
+        drawn = st.session_state.setdefault("kitchen_drawn_labels", {})
+        for order_id, placeholder in placeholders.items():
+            ticket = self.vm.get_ticket(order_id)
+            if order_id in changed or drawn.get(order_id) != ticket.time_elapsed_label:
+                with placeholder.container():
+                    self._render_ticket(ticket)
+        if self.vm.last_updated:
+            st.caption(f"Última atualização: {self.vm.last_updated}")
+
     def _render_empty_state(self):
         st.success("✅ Todos os pedidos entregues! A cozinha está calma.")
 
     def _render_ticket_grid(self):
+        """Draws every ticket into its own placeholder and returns them by order id."""
         COLUMNS_PER_ROW = 3
         tickets = self.vm.tickets
+        placeholders = {}
 
         for i in range(0, len(tickets), COLUMNS_PER_ROW):
             row_tickets = tickets[i : i + COLUMNS_PER_ROW]
@@ -48,13 +76,19 @@ class KitchenView:
 
             for col, ticket in zip(cols, row_tickets):
                 with col:
-                    self._render_ticket(ticket)
+                    placeholders[ticket.order_id] = st.empty()
+                    with placeholders[ticket.order_id].container():
+                        self._render_ticket(ticket)
+        return placeholders
 
     def _render_ticket(self, ticket: KitchenTicket):
         """
         Renders a single ticket card.
         Moved here from components/cards.py for better cohesion.
         """
+        st.session_state.setdefault("kitchen_drawn_labels", {})[ticket.order_id] = (
+            ticket.time_elapsed_label
+        )
 
         with st.container(border=True):
             # Header
@@ -78,4 +112,4 @@ class KitchenView:
                 for item in ticket.items:
                     st.markdown(f"#### **{item.quantity}x** {item.dish_name}")
                     if item.notes:
-                        st.caption(f"📝 {item.notes}")
\ No newline at end of file
+                        st.caption(f"📝 {item.notes}")
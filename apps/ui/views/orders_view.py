@@ -84,6 +84,27 @@ class OrdersView:
         else:
             st.toast(f"❌ {self.vm.last_error}")
 
+    def _handle_add_to_round(self, order_id: int):
+        dish_id = st.session_state.get(f"add_dish_sel_{order_id}")
+        qty = st.session_state.get(f"add_qty_{order_id}") or 1
+        if not dish_id:
+            st.toast("⚠️ Selecione um prato.")
+            return
+        pending = st.session_state.setdefault(f"round_{order_id}", {})
+        pending[dish_id] = pending.get(dish_id, 0) + qty
+
+    def _handle_send_round(self, order_id: int):
+        round_key = f"round_{order_id}"
+        pending = st.session_state.get(round_key) or {}
+        if self.vm.add_items_to_order(order_id, pending):
+            st.session_state[round_key] = {}
+            st.toast(f"✅ Rodada enviada ao pedido #{order_id}")
+        else:
+            st.toast(f"❌ {self.vm.last_error}")
+
+    def _handle_clear_round(self, order_id: int):
+        st.session_state[f"round_{order_id}"] = {}
+
     def _handle_remove_item(self, order_id: int):
         sel_key = f"rem_item_sel_{order_id}"
         item_id = st.session_state.get(sel_key)
@@ -221,13 +242,56 @@ class OrdersView:
                 label_visibility="collapsed",
             )
 
-        st.button(
-            "➕ Adicionar",
-            key=f"btn_add_{order_id}",
-            on_click=self._handle_add_item,
-            args=(order_id,),
-            use_container_width=True,
+        b1, b2 = st.columns(2)
+        with b1:
+            st.button(
+                "➕ Adicionar",
+                key=f"btn_add_{order_id}",
+                on_click=self._handle_add_item,
+                args=(order_id,),
+                use_container_width=True,
+            )
+        with b2:
+            st.button(
+                "🧺 Adicionar à rodada",
+                key=f"btn_round_add_{order_id}",
+                on_click=self._handle_add_to_round,
+                args=(order_id,),
+                use_container_width=True,
+            )
+        self._render_pending_round(order_id, dish_options)
+
+    def _render_pending_round(self, order_id: int, dish_options):
+        """Items queued for the table's round, sent together in one request."""
+        pending = st.session_state.get(f"round_{order_id}") or {}
+        if not pending:
+            return
+
+        st.caption("Rodada pendente")
+        st.table(
+            [
+                {"Prato": dish_options.get(dish_id, dish_id), "Qtd": qty}
+                for dish_id, qty in pending.items()
+            ]
         )
+        c1, c2 = st.columns([3, 1])
+        with c1:
+            st.button(
+                f"📤 Enviar rodada ({sum(pending.values())} itens)",
+                key=f"btn_round_send_{order_id}",
+                type="primary",
+                on_click=self._handle_send_round,
+                args=(order_id,),
+                use_container_width=True,
+            )
+        with c2:
+            st.button(
+                "Limpar",
+                key=f"btn_round_clear_{order_id}",
+                on_click=self._handle_clear_round,
+                args=(order_id,),
+                use_container_width=True,
+            )
 
     def _render_remove_item_form(self, order):
         if not order.itens:
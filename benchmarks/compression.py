@@ -0,0 +1,93 @@
+"""
+Bytes on the wire and end-to-end latency of the list endpoints, per encoding.
+
+For every endpoint and content coding (identity, gzip and, when the brotli
+package is installed on both ends, br) it reports the response size as sent
+and the client-side latency up to a parsed JSON body (download, decompression
+and parsing included). Run it against an API started with the default
+settings; compare with API_COMPRESSION_MIN_SIZE / API_GZIP_LEVEL /
+API_BROTLI_QUALITY changes, or across a real network link:
+
+    uv run uvicorn apps.api.main:app --port 8000
+    uv run python benchmarks/compression.py --requests 200
+"""
+import argparse
+import gzip
+import json
+import statistics
+import time
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENDPOINTS = (
+    "/customers/",
+    "/menu/dishes",
+    "/orders/",
+    "/tables/",
+    "/staff/waiters",
+    "/staff/chefs",
+    "/kitchen/tickets",
+)
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def decode(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br":
+        return brotli.decompress(body)
+    return body
+
+
+def fetch(session: requests.Session, url: str, accept: str):
+    """One request; returns (wire bytes, coding used, latency in ms)."""
+    started = time.perf_counter()
+    with session.get(url, headers={"Accept-Encoding": accept}, stream=True) as response:
+        response.raise_for_status()
+        wire = response.raw.read(decode_content=False)
+        encoding = response.headers.get("Content-Encoding", "identity")
+    json.loads(decode(wire, encoding))
+    return len(wire), encoding, (time.perf_counter() - started) * 1000
+
+
+def run(base_url: str, endpoints, requests_count: int, warmup: int) -> None:
+    session = requests.Session()
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    print(f"{'endpoint':<18} {'accept':<9} {'sent as':<9} {'bytes':>10} {'ratio':>6} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+    for endpoint in endpoints:
+        url = f"{base_url}{endpoint}"
+        identity_size = None
+        for accept in encodings:
+            for _ in range(warmup):
+                fetch(session, url, accept)
+            samples = []
+            for _ in range(requests_count):
+                size, used, elapsed = fetch(session, url, accept)
+                samples.append(elapsed)
+            if identity_size is None:
+                identity_size = size
+            print(
+                f"{endpoint:<18} {accept:<9} {used:<9} {size:>10} "
+                f"{size / identity_size:>6.2f} {percentile(samples, 50):>8.2f} "
+                f"{percentile(samples, 99):>8.2f} {statistics.fmean(samples):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--endpoint", action="append", help="Repeat to pick endpoints")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    args = parser.parse_args()
+    run(args.base_url.rstrip("/"), args.endpoint or ENDPOINTS, args.requests, args.warmup)
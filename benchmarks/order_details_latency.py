@@ -0,0 +1,54 @@
+"""
+Latency benchmark for GET /orders/{id}.
+
+Run it once against an API started with DB_PREPARE_ENABLED=false and once
+with the default settings, then compare the p50/p99 figures:
+
+    DB_PREPARE_ENABLED=false uv run uvicorn apps.api.main:app --port 8000
+    uv run python benchmarks/order_details_latency.py --order-id 1000
+
+    uv run uvicorn apps.api.main:app --port 8000
+    uv run python benchmarks/order_details_latency.py --order-id 1000
+"""
+import argparse
+import statistics
+import time
+import requests
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(base_url: str, order_id: int, requests_count: int, warmup: int) -> None:
+    session = requests.Session()
+    url = f"{base_url}/orders/{order_id}"
+    for _ in range(warmup):
+        session.get(url).raise_for_status()
+
+    before = session.get(f"{base_url}/health/prepared").json()
+    samples = []
+    for _ in range(requests_count):
+        started = time.perf_counter()
+        session.get(url).raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+    after = session.get(f"{base_url}/health/prepared").json()
+
+    print(f"GET {url} x{requests_count} (prepare enabled: {after['enabled']})")
+    print(f"  p50  {percentile(samples, 50):7.2f} ms")
+    print(f"  p99  {percentile(samples, 99):7.2f} ms")
+    print(f"  mean {statistics.fmean(samples):7.2f} ms")
+    print(f"  prepared executions   +{after['prepared'] - before['prepared']}")
+    print(f"  unprepared executions +{after['unprepared'] - before['unprepared']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--order-id", type=int, required=True)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+    run(args.base_url.rstrip("/"), args.order_id, args.requests, args.warmup)
@@ -0,0 +1,151 @@
+"""
+Serialization CPU per request for GET /customers/ and GET /menu/dishes.
+
+Compares, on synthetic rows shaped like the repositories' query results:
+  before: validated model construction + FastAPI's response_model pass
+          (dump, re-validate, serialize) + JSONResponse
+  after:  trusted construction (model_construct) + FastJSONResponse (orjson)
+
+No database is needed; both paths must produce the same JSON, which is
+checked before timing.
+
+    PYTHONPATH=.:packages/db/src uv run python benchmarks/serialization.py
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from packages.common.src.models.customers_models import CustomerResponse
+from packages.common.src.models.menu_models import DishResponse
+from packages.common.src.models.reviews_models import ReviewResponse
+from apps.api.core.responses import FastJSONResponse
+from apps.api.modules.customers.repository import CustomerRepository
+from apps.api.modules.customers.router import router as customer_router
+from apps.api.modules.menu.repository import MenuRepository
+from apps.api.modules.menu.router import router as menu_router
+
+
+def customer_rows(count: int):
+    return [
+        {
+            "id_cliente": i,
+            "nome": f"Cliente {i}",
+            "telefone": f"(11) 9{i:04d}-0000",
+            "email": f"cliente{i}@exemplo.com",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def dish_rows(count: int, reviews_per_dish: int):
+    start = datetime(2025, 11, 1, 12, 0, 0, 123456)
+    return [
+        {
+            "id_prato": d,
+            "nome": f"Prato {d}",
+            "preco": Decimal("25.00") + d,
+            "categoria": "Prato Principal",
+            "reviews": [
+                {
+                    "id": d * 1000 + r,
+                    "nota": 1 + r % 5,
+                    "comentario": "Muito bom.",
+                    "criado_em": (start + timedelta(minutes=r)).isoformat(),
+                    "id_cliente": r,
+                    "id_prato": d,
+                    "id_pedido": 1000 + r,
+                    "nome_cliente": f"Cliente {r}",
+                    "nome_prato": f"Prato {d}",
+                }
+                for r in range(reviews_per_dish)
+            ],
+        }
+        for d in range(1, count + 1)
+    ]
+
+
+def validated_customer(row) -> CustomerResponse:
+    return CustomerResponse(
+        id=row["id_cliente"],
+        nome=row["nome"],
+        telefone=row["telefone"],
+        email=row["email"],
+        pedidos=[],
+    )
+
+
+def validated_dish(row) -> DishResponse:
+    return DishResponse(
+        id=row["id_prato"],
+        nome=row["nome"],
+        preco=row["preco"],
+        categoria=row["categoria"],
+        avaliacoes=[ReviewResponse(**r) for r in row["reviews"]],
+    )
+
+
+def response_field(router, path: str):
+    return next(
+        r.response_field for r in router.routes if r.path == path and "GET" in r.methods
+    )
+
+
+async def before(rows, mapper, field) -> bytes:
+    models = [mapper(row) for row in rows]
+    content = await serialize_response(field=field, response_content=models)
+    return JSONResponse(content).body
+
+
+async def after(rows, mapper) -> bytes:
+    return FastJSONResponse([mapper(row) for row in rows]).body
+
+
+async def cpu_ms(fn, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        await fn()
+    return (time.process_time() - started) * 1000 / iterations
+
+
+async def run(customers: int, dishes: int, reviews: int, iterations: int) -> None:
+    cases = [
+        (
+            f"/customers/ ({customers} customers)",
+            customer_rows(customers),
+            validated_customer,
+            CustomerRepository._map_row_to_response,
+            response_field(customer_router, "/customers/"),
+        ),
+        (
+            f"/menu/dishes ({dishes} dishes x {reviews} reviews)",
+            dish_rows(dishes, reviews),
+            validated_dish,
+            MenuRepository._map_row_to_response,
+            response_field(menu_router, "/menu/dishes"),
+        ),
+    ]
+    for label, rows, old_mapper, new_mapper, field in cases:
+        old_body = await before(rows, old_mapper, field)
+        new_body = await after(rows, new_mapper)
+        assert json.loads(old_body) == json.loads(new_body), f"{label}: output differs"
+
+        old_ms = await cpu_ms(lambda: before(rows, old_mapper, field), iterations)
+        new_ms = await cpu_ms(lambda: after(rows, new_mapper), iterations)
+        print(label)
+        print(f"  before {old_ms:8.2f} ms CPU/request  ({len(old_body)} bytes)")
+        print(f"  after  {new_ms:8.2f} ms CPU/request  ({len(new_body)} bytes)")
+        print(f"  speedup {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--dishes", type=int, default=20)
+    parser.add_argument("--reviews", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.customers, args.dishes, args.reviews, args.iterations))
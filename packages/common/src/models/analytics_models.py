@@ -1,4 +1,5 @@
-from datetime import date as date_type
+from datetime import date as date_type, datetime
+from typing import Optional
 from decimal import Decimal
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -6,7 +7,8 @@ from pydantic import BaseModel, Field, ConfigDict
 class DailyRevenue(BaseModel):
     """Schema for daily revenue aggregation."""
 
-    data: date_type = Field(..., description="Date of sales")
+    data: date_type = Field(..., description="Date of sales (start of the bucket)")
+    periodo: Optional[datetime] = Field(None, description="Start of the time bucket")
     receita_total: Decimal = Field(..., description="Total revenue for that day")
     quantidade_ordem: int = Field(..., description="Number of orders placed")
     model_config = ConfigDict(from_attributes=True)
@@ -15,6 +17,9 @@ class DailyRevenue(BaseModel):
 class DishPopularity(BaseModel):
     """Schema for dish sales statistics."""
 
+    periodo: Optional[datetime] = Field(
+        None, description="Start of the time bucket, when grouped by one"
+    )
     nome_prato: str = Field(..., description="Name of the dish")
     categoria: str = Field(..., description="Dish category")
     quantidade_vendida: int = Field(..., description="Total quantity sold")
@@ -25,6 +30,9 @@ class DishPopularity(BaseModel):
 class WaiterPerformance(BaseModel):
     """Schema for waiter performance statistics."""
 
+    periodo: Optional[datetime] = Field(
+        None, description="Start of the time bucket, when grouped by one"
+    )
     nome_garcom: str = Field(..., description="Name of the waiter")
     pedidos_atentidos: int = Field(..., description="Total orders managed")
     vendas_totais: Decimal = Field(..., description="Total sales value generated")
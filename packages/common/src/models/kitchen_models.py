@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class KitchenTicketItem(BaseModel):
+    """Schema for a pending dish on a kitchen ticket."""
+    quantidade: int = Field(..., description="Quantity to prepare")
+    nome_prato: str = Field(..., description="Name of the dish")
+    observacoes: Optional[str] = Field(None, description="Preparation notes")
+
+
+class KitchenTicket(BaseModel):
+    """Schema for a kitchen ticket: one open order and its pending items."""
+    id_pedido: int = Field(..., description="ID of the order")
+    numero_mesa: int = Field(..., description="Physical Table number")
+    nome_garcom: str = Field(..., description="Name of the waiter")
+    minutos_espera: int = Field(..., description="Minutes since the order was opened")
+    itens: List[KitchenTicketItem] = Field(default=[], description="Pending items")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class KitchenTickets(BaseModel):
+    """Schema for a (full or incremental) kitchen ticket sync."""
+    tickets: List[KitchenTicket] = Field(
+        default=[], description="Tickets added or changed since the cursor"
+    )
+    removidos: List[int] = Field(
+        default=[], description="Order ids that no longer have a ticket"
+    )
+    sincronizado_em: datetime = Field(
+        ..., description="Cursor to send as 'since' on the next sync"
+    )
+    completo: bool = Field(
+        ..., description="True for a full sync (every ticket, no cursor given)"
+    )
+    model_config = ConfigDict(from_attributes=True)
@@ -49,4 +49,20 @@ class OrderResponse(BaseModel):
     itens: List[OrderItemResponse] = Field(
         default=[], description="List of items in the order"
     )
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class OrderChanges(BaseModel):
+    """Schema for an incremental order sync (GET /orders/changes)."""
+    pedidos: List[OrderResponse] = Field(
+        default=[], description="Orders changed since the given cursor, in any status"
+    )
+    removidos: List[int] = Field(
+        default=[], description="Order ids deleted since the given cursor"
+    )
+    sincronizado_em: datetime = Field(
+        ..., description="Cursor to send as 'since' on the next sync"
+    )
+    completo: bool = Field(
+        ..., description="True for a full sync (every active order, no cursor given)"
+    )
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,56 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class NamedOption(BaseModel):
+    """Schema for a dropdown entry (customer, waiter, ...): id and name only."""
+    id: int = Field(..., description="ID of the record")
+    nome: str = Field(..., description="Display name")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DishOption(BaseModel):
+    """Schema for a dish dropdown entry."""
+    id: int = Field(..., description="ID of the dish")
+    nome: str = Field(..., description="Name of the dish")
+    preco: Decimal = Field(..., description="Current price")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FreeTable(BaseModel):
+    """Schema for a table without an open order."""
+    id: int = Field(..., description="ID of the table")
+    numero: int = Field(..., description="Physical Table number")
+    capacidade: int = Field(..., description="Seats")
+    localizacao: str = Field(..., description="Location in the restaurant")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReviewableItem(BaseModel):
+    """Schema for a dish of a closed order that the customer can review."""
+    id_pedido: int = Field(..., description="ID of the order")
+    id_prato: int = Field(..., description="ID of the dish")
+    nome_prato: str = Field(..., description="Name of the dish")
+    data_pedido: Optional[datetime] = Field(None, description="When the order was opened")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrdersPage(BaseModel):
+    """Everything the Orders page forms need, in one response."""
+    clientes: List[NamedOption] = Field(default=[], description="Customers, by name")
+    mesas_livres: List[FreeTable] = Field(default=[], description="Tables free for a new order")
+    garcons: List[NamedOption] = Field(default=[], description="Waiters, by name")
+    pratos: List[DishOption] = Field(default=[], description="Dishes, by name")
+
+
+class ReviewsPage(BaseModel):
+    """Everything the Reviews page needs, in one response."""
+    pratos: List[NamedOption] = Field(default=[], description="Dishes, by name")
+    clientes: List[NamedOption] = Field(
+        default=[], description="Customers with closed orders, by name"
+    )
+    itens: List[ReviewableItem] = Field(
+        default=[], description="Reviewable dishes of the requested customer"
+    )
@@ -0,0 +1,69 @@
+-- Keeps pedido.valor_total up to date incrementally.
+-- Statement-level triggers read the transition tables and apply one
+-- delta per affected order, so a line change costs O(changed rows)
+-- instead of re-summing every item of the order.
+
+CREATE OR REPLACE FUNCTION apply_order_total_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT n.id_pedido, SUM(n.quantidade * pr.preco) AS delta
+            FROM new_items n
+                JOIN prato pr ON pr.id_prato = n.id_prato
+            GROUP BY n.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total - d.delta
+        FROM (
+            SELECT o.id_pedido, SUM(o.quantidade * pr.preco) AS delta
+            FROM old_items o
+                JOIN prato pr ON pr.id_prato = o.id_prato
+            GROUP BY o.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT c.id_pedido, SUM(c.quantidade * pr.preco) AS delta
+            FROM (
+                SELECT id_pedido, id_prato, quantidade FROM new_items
+                UNION ALL
+                SELECT id_pedido, id_prato, -quantidade FROM old_items
+            ) c
+                JOIN prato pr ON pr.id_prato = c.id_prato
+            GROUP BY c.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND d.delta <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_order_total_insert ON item_pedido;
+DROP TRIGGER IF EXISTS trg_order_total_delete ON item_pedido;
+DROP TRIGGER IF EXISTS trg_order_total_update ON item_pedido;
+
+CREATE TRIGGER trg_order_total_insert
+AFTER INSERT ON item_pedido
+REFERENCING NEW TABLE AS new_items
+FOR EACH STATEMENT
+EXECUTE FUNCTION apply_order_total_delta();
+
+CREATE TRIGGER trg_order_total_delete
+AFTER DELETE ON item_pedido
+REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT
+EXECUTE FUNCTION apply_order_total_delta();
+
+CREATE TRIGGER trg_order_total_update
+AFTER UPDATE ON item_pedido
+REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT
+EXECUTE FUNCTION apply_order_total_delta();
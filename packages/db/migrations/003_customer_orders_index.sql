@@ -0,0 +1,4 @@
+-- Serves the per-customer "latest N orders" lookup of GET /customers/?include=orders
+-- as an index range scan. It also covers every lookup idx_pedido_cliente served.
+CREATE INDEX IF NOT EXISTS idx_pedido_cliente_data ON pedido(id_cliente, data_pedido DESC);
+DROP INDEX IF EXISTS idx_pedido_cliente;
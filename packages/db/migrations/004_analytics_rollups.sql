@@ -0,0 +1,56 @@
+-- Daily rollups for the analytics dashboard.
+-- Rows are added when an order is closed (orders/queries/order/close.sql)
+-- and rebuilt from scratch by `db rebuild-rollups`. The orders closed before
+-- this migration are folded in below, so existing installs keep their history.
+
+CREATE TABLE IF NOT EXISTS resumo_vendas_diario (
+    dia DATE PRIMARY KEY,
+    total_pedidos INT NOT NULL DEFAULT 0,
+    receita_total DECIMAL(12, 2) NOT NULL DEFAULT 0.00
+);
+
+CREATE TABLE IF NOT EXISTS resumo_prato_diario (
+    dia DATE NOT NULL,
+    id_prato INT NOT NULL,
+    quantidade_vendida INT NOT NULL DEFAULT 0,
+    receita DECIMAL(12, 2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (dia, id_prato),
+    FOREIGN KEY (id_prato) REFERENCES prato(id_prato) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS resumo_garcom_diario (
+    dia DATE NOT NULL,
+    id_funcionario INT NOT NULL,
+    total_pedidos INT NOT NULL DEFAULT 0,
+    total_vendas DECIMAL(12, 2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (dia, id_funcionario),
+    FOREIGN KEY (id_funcionario) REFERENCES garcom(id_funcionario) ON DELETE CASCADE
+);
+
+-- Open orders are still aggregated live; keep that lookup small.
+CREATE INDEX IF NOT EXISTS idx_pedido_aberto ON pedido(data_pedido) WHERE status = 'ABERTO';
+
+-- Backfill from the orders already closed (same statements as
+-- ROLLUP_REBUILD_SQL in packages/db/src/db/operations.py).
+INSERT INTO resumo_vendas_diario (dia, total_pedidos, receita_total)
+SELECT DATE(data_pedido), COUNT(*), SUM(valor_total)
+FROM pedido
+WHERE status = 'FECHADO'
+GROUP BY DATE(data_pedido)
+ON CONFLICT (dia) DO NOTHING;
+
+INSERT INTO resumo_garcom_diario (dia, id_funcionario, total_pedidos, total_vendas)
+SELECT DATE(data_pedido), id_funcionario, COUNT(*), SUM(valor_total)
+FROM pedido
+WHERE status = 'FECHADO'
+GROUP BY DATE(data_pedido), id_funcionario
+ON CONFLICT (dia, id_funcionario) DO NOTHING;
+
+INSERT INTO resumo_prato_diario (dia, id_prato, quantidade_vendida, receita)
+SELECT DATE(p.data_pedido), ip.id_prato, SUM(ip.quantidade), SUM(ip.quantidade * pr.preco)
+FROM pedido p
+    JOIN item_pedido ip ON ip.id_pedido = p.id_pedido
+    JOIN prato pr ON pr.id_prato = ip.id_prato
+WHERE p.status = 'FECHADO'
+GROUP BY DATE(p.data_pedido), ip.id_prato
+ON CONFLICT (dia, id_prato) DO NOTHING;
@@ -0,0 +1,4 @@
+-- Serves the analytics range filters (status + data_pedido slice) as an
+-- index range scan. It also covers the open-orders lookup idx_pedido_aberto served.
+CREATE INDEX IF NOT EXISTS idx_pedido_status_data ON pedido(status, data_pedido);
+DROP INDEX IF EXISTS idx_pedido_aberto;
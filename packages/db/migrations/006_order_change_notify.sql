@@ -0,0 +1,83 @@
+-- Publishes compact order change events on the 'order_changes' channel.
+-- One NOTIFY per statement, listing the affected order ids:
+--   {"table": "pedido" | "item_pedido", "op": "INSERT" | "UPDATE" | "DELETE", "orders": [ids]}
+-- "orders" is null when a statement touches too many orders to list
+-- (NOTIFY payloads are capped at 8000 bytes); listeners then reload everything.
+-- valor_total-only updates of pedido (made by the total triggers) are skipped,
+-- the item_pedido event already covers them.
+
+CREATE OR REPLACE FUNCTION notify_order_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    order_ids INT[];
+BEGIN
+    IF TG_TABLE_NAME = 'pedido' AND TG_OP = 'UPDATE' THEN
+        SELECT array_agg(n.id_pedido ORDER BY n.id_pedido) INTO order_ids
+        FROM new_rows n
+            JOIN old_rows o ON o.id_pedido = n.id_pedido
+        WHERE (n.status, n.id_mesa, n.id_cliente, n.id_funcionario, n.quantidade_pessoas)
+            IS DISTINCT FROM (o.status, o.id_mesa, o.id_cliente, o.id_funcionario, o.quantidade_pessoas);
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT id_pedido) INTO order_ids FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT id_pedido) INTO order_ids FROM new_rows;
+    END IF;
+
+    IF order_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM pg_notify(
+        'order_changes',
+        json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', TG_OP,
+            'orders', CASE WHEN cardinality(order_ids) <= 500 THEN order_ids END
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_order_notify_insert ON pedido;
+DROP TRIGGER IF EXISTS trg_order_notify_update ON pedido;
+DROP TRIGGER IF EXISTS trg_order_notify_delete ON pedido;
+DROP TRIGGER IF EXISTS trg_item_notify_insert ON item_pedido;
+DROP TRIGGER IF EXISTS trg_item_notify_update ON item_pedido;
+DROP TRIGGER IF EXISTS trg_item_notify_delete ON item_pedido;
+
+CREATE TRIGGER trg_order_notify_insert
+AFTER INSERT ON pedido
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
+
+CREATE TRIGGER trg_order_notify_update
+AFTER UPDATE ON pedido
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
+
+CREATE TRIGGER trg_order_notify_delete
+AFTER DELETE ON pedido
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
+
+CREATE TRIGGER trg_item_notify_insert
+AFTER INSERT ON item_pedido
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
+
+CREATE TRIGGER trg_item_notify_update
+AFTER UPDATE ON item_pedido
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
+
+CREATE TRIGGER trg_item_notify_delete
+AFTER DELETE ON item_pedido
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_order_change();
@@ -0,0 +1,21 @@
+-- Change tracking for incremental clients (GET /orders/changes?since=).
+-- atualizado_em is bumped on every pedido update, including the valor_total
+-- updates the total triggers make when items are added or removed.
+ALTER TABLE pedido ADD COLUMN IF NOT EXISTS atualizado_em TIMESTAMPTZ NOT NULL DEFAULT now();
+
+CREATE OR REPLACE FUNCTION touch_order_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.atualizado_em := clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_order_touch ON pedido;
+
+CREATE TRIGGER trg_order_touch
+BEFORE UPDATE ON pedido
+FOR EACH ROW
+EXECUTE FUNCTION touch_order_updated_at();
+
+CREATE INDEX IF NOT EXISTS idx_pedido_atualizado ON pedido(atualizado_em);
@@ -0,0 +1,72 @@
+-- Change counters for the rarely changing lists the API serves with ETags
+-- (menu, tables, waiters, chefs). Every statement that can change what a list
+-- returns bumps its counter in the same transaction, so a version is never
+-- visible before the data it describes.
+-- atualizado_em goes into the ETag too, so counters that restart (database
+-- re-created) do not repeat an ETag a client may still hold.
+CREATE TABLE IF NOT EXISTS recurso_versao (
+    recurso TEXT PRIMARY KEY,
+    versao BIGINT NOT NULL DEFAULT 0,
+    atualizado_em TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+INSERT INTO recurso_versao (recurso)
+VALUES ('menu'), ('tables'), ('waiters'), ('chefs')
+ON CONFLICT (recurso) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_resource_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE recurso_versao
+    SET versao = versao + 1,
+        atualizado_em = clock_timestamp()
+    WHERE recurso = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_version_menu_prato ON prato;
+DROP TRIGGER IF EXISTS trg_version_menu_avaliacao ON avaliacao;
+DROP TRIGGER IF EXISTS trg_version_menu_cliente ON cliente;
+DROP TRIGGER IF EXISTS trg_version_tables_mesa ON mesa;
+DROP TRIGGER IF EXISTS trg_version_tables_pedido ON pedido;
+DROP TRIGGER IF EXISTS trg_version_waiters ON garcom;
+DROP TRIGGER IF EXISTS trg_version_chefs ON cozinheiro;
+
+-- Menu: dishes, their reviews and the reviewers' names.
+CREATE TRIGGER trg_version_menu_prato
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON prato
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('menu');
+
+CREATE TRIGGER trg_version_menu_avaliacao
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON avaliacao
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('menu');
+
+CREATE TRIGGER trg_version_menu_cliente
+AFTER UPDATE OF nome ON cliente
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('menu');
+
+-- Tables: the tables themselves and their occupancy (open orders).
+-- valor_total updates (items added or removed) do not touch occupancy.
+CREATE TRIGGER trg_version_tables_mesa
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON mesa
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('tables');
+
+CREATE TRIGGER trg_version_tables_pedido
+AFTER INSERT OR DELETE OR TRUNCATE OR UPDATE OF status, id_mesa ON pedido
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('tables');
+
+CREATE TRIGGER trg_version_waiters
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON garcom
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('waiters');
+
+CREATE TRIGGER trg_version_chefs
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON cozinheiro
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_resource_version('chefs');
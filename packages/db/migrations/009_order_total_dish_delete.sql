@@ -0,0 +1,71 @@
+-- Deleting a prato cascades to its item_pedido rows. By the time the
+-- item delete trigger runs the prato rows are gone, so the price join of
+-- 002 found nothing and left valor_total too high.
+-- Open orders that lost lines of a deleted dish are now re-summed from their
+-- remaining lines; every other order still gets its delta. Closed orders
+-- keep their total: it is the bill that was charged and what the daily
+-- rollups counted.
+
+CREATE OR REPLACE FUNCTION apply_order_total_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT n.id_pedido, SUM(n.quantidade * pr.preco) AS delta
+            FROM new_items n
+                JOIN prato pr ON pr.id_prato = n.id_prato
+            GROUP BY n.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido;
+    ELSIF TG_OP = 'DELETE' THEN
+        -- Lines whose dish no longer exists (prato delete cascade).
+        UPDATE pedido p
+        SET valor_total = COALESCE((
+            SELECT SUM(i.quantidade * pr.preco)
+            FROM item_pedido i
+                JOIN prato pr ON pr.id_prato = i.id_prato
+            WHERE i.id_pedido = p.id_pedido
+        ), 0)
+        WHERE p.status = 'ABERTO'
+            AND p.id_pedido IN (
+                SELECT o.id_pedido
+                FROM old_items o
+                WHERE NOT EXISTS (SELECT 1 FROM prato pr WHERE pr.id_prato = o.id_prato)
+            );
+
+        UPDATE pedido p
+        SET valor_total = p.valor_total - d.delta
+        FROM (
+            SELECT o.id_pedido, SUM(o.quantidade * pr.preco) AS delta
+            FROM old_items o
+                JOIN prato pr ON pr.id_prato = o.id_prato
+            GROUP BY o.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND NOT EXISTS (
+                SELECT 1
+                FROM old_items o
+                WHERE o.id_pedido = d.id_pedido
+                    AND NOT EXISTS (SELECT 1 FROM prato pr WHERE pr.id_prato = o.id_prato)
+            );
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT c.id_pedido, SUM(c.quantidade * pr.preco) AS delta
+            FROM (
+                SELECT id_pedido, id_prato, quantidade FROM new_items
+                UNION ALL
+                SELECT id_pedido, id_prato, -quantidade FROM old_items
+            ) c
+                JOIN prato pr ON pr.id_prato = c.id_prato
+            GROUP BY c.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND d.delta <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,34 @@
+-- Deleted orders for incremental clients (GET /orders/changes,
+-- GET /kitchen/tickets). A deleted pedido has no atualizado_em left to find
+-- it by, so every delete (direct, last item removed, or cascaded from
+-- cliente/mesa/garcom) leaves a tombstone with the time it happened.
+-- Tombstones older than a day are pruned on the next delete; the API sends
+-- clients whose cursor is older than that through a full sync.
+CREATE TABLE IF NOT EXISTS pedido_removido (
+    id_pedido INT PRIMARY KEY,
+    removido_em TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+CREATE INDEX IF NOT EXISTS idx_pedido_removido_em ON pedido_removido(removido_em);
+
+CREATE OR REPLACE FUNCTION record_order_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM pedido_removido
+    WHERE removido_em < clock_timestamp() - interval '1 day';
+
+    INSERT INTO pedido_removido (id_pedido, removido_em)
+    SELECT id_pedido, clock_timestamp()
+    FROM old_rows
+    ON CONFLICT (id_pedido) DO UPDATE SET removido_em = EXCLUDED.removido_em;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_order_tombstone ON pedido;
+
+CREATE TRIGGER trg_order_tombstone
+AFTER DELETE ON pedido
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION record_order_delete();
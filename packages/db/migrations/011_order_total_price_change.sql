@@ -0,0 +1,118 @@
+-- Order totals after a prato price change.
+-- item_pedido does not store the price a line was sold at, so the deltas of
+-- 002 use the dish's current price: after a price change, editing or removing
+-- a line applied a different amount than the one added, and valor_total
+-- drifted. Open orders are now re-summed when a dish they contain changes
+-- price, so their total always equals their lines at current prices, and the
+-- deltas only touch open orders. A closed order's total is the bill that was
+-- charged (and what the daily rollups counted); later changes leave it alone.
+
+CREATE OR REPLACE FUNCTION apply_order_total_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT n.id_pedido, SUM(n.quantidade * pr.preco) AS delta
+            FROM new_items n
+                JOIN prato pr ON pr.id_prato = n.id_prato
+            GROUP BY n.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND p.status = 'ABERTO';
+    ELSIF TG_OP = 'DELETE' THEN
+        -- Lines whose dish no longer exists (prato delete cascade).
+        UPDATE pedido p
+        SET valor_total = COALESCE((
+            SELECT SUM(i.quantidade * pr.preco)
+            FROM item_pedido i
+                JOIN prato pr ON pr.id_prato = i.id_prato
+            WHERE i.id_pedido = p.id_pedido
+        ), 0)
+        WHERE p.status = 'ABERTO'
+            AND p.id_pedido IN (
+                SELECT o.id_pedido
+                FROM old_items o
+                WHERE NOT EXISTS (SELECT 1 FROM prato pr WHERE pr.id_prato = o.id_prato)
+            );
+
+        UPDATE pedido p
+        SET valor_total = p.valor_total - d.delta
+        FROM (
+            SELECT o.id_pedido, SUM(o.quantidade * pr.preco) AS delta
+            FROM old_items o
+                JOIN prato pr ON pr.id_prato = o.id_prato
+            GROUP BY o.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND p.status = 'ABERTO'
+            AND NOT EXISTS (
+                SELECT 1
+                FROM old_items o
+                WHERE o.id_pedido = d.id_pedido
+                    AND NOT EXISTS (SELECT 1 FROM prato pr WHERE pr.id_prato = o.id_prato)
+            );
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE pedido p
+        SET valor_total = p.valor_total + d.delta
+        FROM (
+            SELECT c.id_pedido, SUM(c.quantidade * pr.preco) AS delta
+            FROM (
+                SELECT id_pedido, id_prato, quantidade FROM new_items
+                UNION ALL
+                SELECT id_pedido, id_prato, -quantidade FROM old_items
+            ) c
+                JOIN prato pr ON pr.id_prato = c.id_prato
+            GROUP BY c.id_pedido
+        ) d
+        WHERE p.id_pedido = d.id_pedido
+            AND p.status = 'ABERTO'
+            AND d.delta <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables cannot be combined with UPDATE OF <column>, so this runs
+-- on every prato update and only acts on dishes whose price changed.
+CREATE OR REPLACE FUNCTION resum_orders_on_price_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE pedido p
+    SET valor_total = COALESCE((
+        SELECT SUM(i.quantidade * pr.preco)
+        FROM item_pedido i
+            JOIN prato pr ON pr.id_prato = i.id_prato
+        WHERE i.id_pedido = p.id_pedido
+    ), 0)
+    WHERE p.status = 'ABERTO'
+        AND EXISTS (
+            SELECT 1
+            FROM item_pedido i
+                JOIN new_dishes n ON n.id_prato = i.id_prato
+                JOIN old_dishes o ON o.id_prato = n.id_prato
+            WHERE i.id_pedido = p.id_pedido
+                AND n.preco IS DISTINCT FROM o.preco
+        );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_order_total_price ON prato;
+
+CREATE TRIGGER trg_order_total_price
+AFTER UPDATE ON prato
+REFERENCING OLD TABLE AS old_dishes NEW TABLE AS new_dishes
+FOR EACH STATEMENT
+EXECUTE FUNCTION resum_orders_on_price_change();
+
+-- Open orders that already drifted.
+UPDATE pedido p
+SET valor_total = COALESCE((
+    SELECT SUM(i.quantidade * pr.preco)
+    FROM item_pedido i
+        JOIN prato pr ON pr.id_prato = i.id_prato
+    WHERE i.id_pedido = p.id_pedido
+), 0)
+WHERE p.status = 'ABERTO';
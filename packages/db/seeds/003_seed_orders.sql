@@ -3,6 +3,8 @@
 
 TRUNCATE TABLE pedido, item_pedido RESTART IDENTITY CASCADE;
 ALTER TABLE pedido ALTER COLUMN id_pedido RESTART WITH 1000;
+-- Totals are precomputed below; keep the total trigger from adding them again
+ALTER TABLE item_pedido DISABLE TRIGGER trg_order_total_insert;
 
 -- Pedidos for 2025-11-07
 INSERT INTO pedido (data_pedido, valor_total, id_cliente, id_mesa, id_funcionario, status, quantidade_pessoas) VALUES
@@ -2562,3 +2564,4 @@ INSERT INTO item_pedido (id_pedido, id_prato, quantidade, observacao) VALUES
 (1616, 13, 1, 'Bem passado'),
 (1617, 16, 1, NULL);
 
+ALTER TABLE item_pedido ENABLE TRIGGER trg_order_total_insert;
@@ -6,7 +6,9 @@ from .operations import (
     apply_migrations,
     reset_database,
     generate_seeds as generate_seeds_op,
-    apply_seeds as apply_seeds_op
+    apply_seeds as apply_seeds_op,
+    verify_order_totals,
+    rebuild_rollups as rebuild_rollups_op,
 )
 from .config import logger
 
@@ -53,6 +55,29 @@ def seed():
         logger.error(f"Seeding failed: {e}")
         sys.exit(1)
 
+@app.command()
+def verify_totals(
+    sample: int = typer.Option(200, help="Open orders to check at random (0 = all)."),
+    fix: bool = typer.Option(False, help="Rewrite drifted totals from their items."),
+):
+    """Report open orders whose stored total drifted from their items."""
+    try:
+        drifted = verify_order_totals(sample=sample, fix=fix)
+    except Exception as e:
+        logger.error(f"Total verification failed: {e}")
+        sys.exit(1)
+    if drifted and not fix:
+        sys.exit(2)
+
+@app.command()
+def rebuild_rollups():
+    """Recompute the analytics rollups from closed orders."""
+    try:
+        rebuild_rollups_op()
+    except Exception as e:
+        logger.error(f"Rollup rebuild failed: {e}")
+        sys.exit(1)
+
 if __name__ == "__main__":
     setup_logging(app_name="db_cli", log_dir=None)
     app()
\ No newline at end of file
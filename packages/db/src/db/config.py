@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
@@ -13,10 +14,51 @@ class DBSettings(BaseSettings):
     API_TIMEOUT: int
     PAGE_TITLE: str
     PROJECT_NAME: str
+    DB_READ_HOST: Optional[str] = None
+    DB_READ_PORT: Optional[int] = None
+    DB_READ_USER: Optional[str] = None
+    DB_READ_PASSWORD: Optional[str] = None
+    DB_READ_NAME: Optional[str] = None
+    DB_READ_MAX_LAG: float = 5.0
+    DB_READ_CHECK_INTERVAL: float = 2.0
+    DB_READ_CHECKOUT_TIMEOUT: float = 1.0
+    DB_POOL_MIN_SIZE: int = 4
+    DB_POOL_MAX_SIZE: int = 20
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_MAX_WAITING: int = 0
+    DB_POOL_MAX_LIFETIME: float = 3600.0
+    DB_POOL_MAX_IDLE: float = 600.0
+    DB_POOL_RECONNECT_TIMEOUT: float = 300.0
+    DB_POOL_OPEN_TIMEOUT: float = 30.0
+    DB_POOL_CHECK: bool = True
+    DB_POOL_STATS_INTERVAL: int = 60
+    DB_PREPARE_ENABLED: bool = True
+    DB_PREPARE_THRESHOLD: Optional[int] = 5
+    DB_PREPARED_MAX: int = 100
+    API_STREAM_CHUNK_SIZE: int = 500
+    API_JSON_PASSTHROUGH: bool = False
+    API_ANALYTICS_CACHE_SIZE: int = 256
+    API_EVENTS_QUEUE_SIZE: int = 100
+    API_SSE_HEARTBEAT: int = 15
+    API_COMPRESSION_ENABLED: bool = True
+    API_COMPRESSION_MIN_SIZE: int = 1024
+    API_GZIP_LEVEL: int = 6
+    API_BROTLI_QUALITY: int = 4
 
     @property
     def database_url(self) -> str:
         logger.debug(f"Connecting to database at 'postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}'")
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def read_database_url(self) -> Optional[str]:
+        """Read replica URL, or None without DB_READ_HOST. Unset DB_READ_* fall back to DB_*."""
+        if not self.DB_READ_HOST:
+            return None
+        user = self.DB_READ_USER or self.DB_USER
+        password = self.DB_READ_PASSWORD or self.DB_PASSWORD
+        port = self.DB_READ_PORT or self.DB_PORT
+        name = self.DB_READ_NAME or self.DB_NAME
+        return f"postgresql://{user}:{password}@{self.DB_READ_HOST}:{port}/{name}"
+
 settings = DBSettings()
\ No newline at end of file
@@ -1,30 +1,128 @@
+import asyncio
 import logging
+from typing import Any, Dict, Optional
+import orjson
 from psycopg_pool import AsyncConnectionPool
 from psycopg.rows import dict_row
+from psycopg.types.json import set_json_loads
 from .config import settings
+from .prepared import configure_prepared_statements
 
 logger = logging.getLogger(__name__)
 
-async def create_db_pool() -> AsyncConnectionPool:
+
+async def configure_connection(conn) -> None:
+    """
+    Pool `configure` callback, run once per new connection.
+    Decodes json/jsonb columns with orjson and sets up prepared statements.
+    """
+    set_json_loads(orjson.loads, conn)
+    await configure_prepared_statements(conn)
+
+
+async def create_db_pool(
+    conninfo: Optional[str] = None, name: str = "shared_pool", wait: bool = True
+) -> AsyncConnectionPool:
     """
     Creates and returns a psycopg AsyncConnectionPool.
     Framework agnostic.
+
+    Connects to `conninfo` (the primary, settings.database_url, by default).
+    Sizes, timeouts and connection recycling come from the DB_POOL_* settings.
+    With `wait`, opening waits until DB_POOL_MIN_SIZE connections are ready,
+    so the first requests do not pay for connection setup; without it the
+    pool connects in the background (and keeps retrying). With DB_POOL_CHECK
+    every connection is checked on checkout and a broken one is replaced.
     """
     try:
         new_pool = AsyncConnectionPool(
-            conninfo=settings.database_url,
-            min_size=1,
-            max_size=20,
+            conninfo=conninfo or settings.database_url,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            timeout=settings.DB_POOL_TIMEOUT,
+            max_waiting=settings.DB_POOL_MAX_WAITING,
+            max_lifetime=settings.DB_POOL_MAX_LIFETIME,
+            max_idle=settings.DB_POOL_MAX_IDLE,
+            reconnect_timeout=settings.DB_POOL_RECONNECT_TIMEOUT,
             kwargs={
                 "row_factory": dict_row,
                 "autocommit": False,
             },
             open=False,
-            name="shared_pool",
+            configure=configure_connection,
+            check=AsyncConnectionPool.check_connection if settings.DB_POOL_CHECK else None,
+            name=name,
+        )
+        await new_pool.open(wait=wait, timeout=settings.DB_POOL_OPEN_TIMEOUT)
+        logger.info(
+            f"Database connection pool '{name}' created successfully "
+            f"({settings.DB_POOL_MIN_SIZE} connections {'ready' if wait else 'requested'}, "
+            f"max {settings.DB_POOL_MAX_SIZE})."
         )
-        await new_pool.open()
-        logger.info("Database connection pool created successfully.")
         return new_pool
     except Exception as e:
         logger.error(f"Failed to create database pool: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+def pool_stats(pool: AsyncConnectionPool) -> Dict[str, Any]:
+    """
+    Current usage of `pool` plus its counters since it opened.
+    wait_ms is the total time requests spent queued for a connection;
+    errors are checkout timeouts, failed connection attempts, connections
+    lost (failed checks) and connections returned broken.
+    """
+    raw = pool.get_stats()
+    size = raw.get("pool_size", 0)
+    idle = raw.get("pool_available", 0)
+    requests = raw.get("requests_num", 0)
+    wait_ms = raw.get("requests_wait_ms", 0)
+    return {
+        "name": pool.name,
+        "min_size": raw.get("pool_min", pool.min_size),
+        "max_size": raw.get("pool_max", pool.max_size),
+        "size": size,
+        "in_use": max(size - idle, 0),
+        "idle": idle,
+        "waiting": raw.get("requests_waiting", 0),
+        "requests": requests,
+        "queued": raw.get("requests_queued", 0),
+        "wait_ms": wait_ms,
+        "avg_wait_ms": round(wait_ms / requests, 3) if requests else 0.0,
+        "usage_ms": raw.get("usage_ms", 0),
+        "errors": {
+            "timeouts": raw.get("requests_errors", 0),
+            "connect_failures": raw.get("connections_errors", 0),
+            "lost": raw.get("connections_lost", 0),
+            "returned_bad": raw.get("returns_bad", 0),
+        },
+        "connections_opened": raw.get("connections_num", 0),
+    }
+
+
+async def log_pool_stats(pool: AsyncConnectionPool, interval: float) -> None:
+    """
+    Logs the pool's usage every `interval` seconds until cancelled, with the
+    requests, queueing and errors of each interval. A warning is logged
+    instead of an info line when requests queued or errors occurred.
+    """
+    previous: Optional[Dict[str, Any]] = None
+    while True:
+        await asyncio.sleep(interval)
+        current = pool_stats(pool)
+        before = previous or {"requests": 0, "queued": 0, "wait_ms": 0, "errors": {}}
+        requests = current["requests"] - before["requests"]
+        queued = current["queued"] - before["queued"]
+        wait_ms = current["wait_ms"] - before["wait_ms"]
+        errors = sum(
+            value - before["errors"].get(key, 0) for key, value in current["errors"].items()
+        )
+        previous = current
+        level = logging.WARNING if queued or errors or current["waiting"] else logging.INFO
+        logger.log(
+            level,
+            f"Pool {current['name']}: {current['in_use']}/{current['size']} in use "
+            f"(max {current['max_size']}), {current['idle']} idle, {current['waiting']} waiting; "
+            f"last {interval:.0f}s: {requests} requests, {queued} queued, "
+            f"{wait_ms} ms waiting, {errors} errors",
+        )
@@ -121,7 +121,9 @@ def generate_003_orders(output_dir: Path, orders_list: list):
         f.write("-- 003_seed_orders.sql\n")
         f.write("-- Pedido and Item_Pedido\n\n")
         f.write("TRUNCATE TABLE pedido, item_pedido RESTART IDENTITY CASCADE;\n")
-        f.write("ALTER TABLE pedido ALTER COLUMN id_pedido RESTART WITH 1000;\n\n")
+        f.write("ALTER TABLE pedido ALTER COLUMN id_pedido RESTART WITH 1000;\n")
+        f.write("-- Totals are precomputed below; keep the total trigger from adding them again\n")
+        f.write("ALTER TABLE item_pedido DISABLE TRIGGER trg_order_total_insert;\n\n")
         curr_date = START_DATE
         while curr_date <= END_DATE:
             is_weekend = curr_date.weekday() >= 4
@@ -185,6 +187,8 @@ def generate_003_orders(output_dir: Path, orders_list: list):
 
             curr_date += timedelta(days=1)
 
+        f.write("ALTER TABLE item_pedido ENABLE TRIGGER trg_order_total_insert;\n")
+
 
 def generate_004_reviews(output_dir: Path, orders_list: list):
     filepath = output_dir / "004_seed_reviews.sql"
@@ -363,6 +367,7 @@ def apply_seeds() -> None:
             sql_content = filepath.read_text(encoding="utf-8")
             if sql_content.strip():
                 cursor.execute(sql_content)
+        _rebuild_rollups(cursor)
         conn.commit()
         logger.info("All seeds applied successfully!")
     except Exception as e:
@@ -373,5 +378,114 @@ def apply_seeds() -> None:
         cursor.close()
         conn.close()
 
+
+def verify_order_totals(sample: int = 200, fix: bool = False) -> int:
+    """
+    Compares pedido.valor_total with the sum of its items for a random
+    sample of open orders (sample=0 checks every one). Closed orders are
+    skipped: their total is the bill charged at the prices of the time.
+    Returns the number of drifted orders; with fix=True they are rewritten.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            WITH sampled AS (
+                SELECT id_pedido, valor_total
+                FROM pedido
+                WHERE status = 'ABERTO'
+                ORDER BY random()
+                LIMIT %s
+            )
+            SELECT s.id_pedido, s.valor_total, COALESCE(SUM(ip.quantidade * pr.preco), 0)
+            FROM sampled s
+                LEFT JOIN item_pedido ip ON ip.id_pedido = s.id_pedido
+                LEFT JOIN prato pr ON pr.id_prato = ip.id_prato
+            GROUP BY s.id_pedido, s.valor_total
+            HAVING s.valor_total IS DISTINCT FROM COALESCE(SUM(ip.quantidade * pr.preco), 0)
+            ORDER BY s.id_pedido
+            """,
+            (sample or None,),
+        )
+        drifted = cursor.fetchall()
+        checked = sample or "all open"
+        if not drifted:
+            logger.info(f"Order totals OK ({checked} orders checked).")
+            return 0
+
+        for order_id, stored, computed in drifted:
+            logger.warning(
+                f"Order {order_id} total drift. Stored: {stored}, Items: {computed}"
+            )
+        logger.warning(f"{len(drifted)} drifted order totals ({checked} orders checked).")
+
+        if fix:
+            cursor.executemany(
+                "UPDATE pedido SET valor_total = %s WHERE id_pedido = %s",
+                [(computed, order_id) for order_id, _, computed in drifted],
+            )
+            conn.commit()
+            logger.info(f"Fixed {len(drifted)} order totals.")
+        return len(drifted)
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Order total verification failed: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+ROLLUP_REBUILD_SQL = """
+TRUNCATE TABLE resumo_vendas_diario, resumo_prato_diario, resumo_garcom_diario;
+
+INSERT INTO resumo_vendas_diario (dia, total_pedidos, receita_total)
+SELECT DATE(data_pedido), COUNT(*), SUM(valor_total)
+FROM pedido
+WHERE status = 'FECHADO'
+GROUP BY DATE(data_pedido);
+
+INSERT INTO resumo_garcom_diario (dia, id_funcionario, total_pedidos, total_vendas)
+SELECT DATE(data_pedido), id_funcionario, COUNT(*), SUM(valor_total)
+FROM pedido
+WHERE status = 'FECHADO'
+GROUP BY DATE(data_pedido), id_funcionario;
+
+INSERT INTO resumo_prato_diario (dia, id_prato, quantidade_vendida, receita)
+SELECT DATE(p.data_pedido), ip.id_prato, SUM(ip.quantidade), SUM(ip.quantidade * pr.preco)
+FROM pedido p
+    JOIN item_pedido ip ON ip.id_pedido = p.id_pedido
+    JOIN prato pr ON pr.id_prato = ip.id_prato
+WHERE p.status = 'FECHADO'
+GROUP BY DATE(p.data_pedido), ip.id_prato;
+"""
+
+
+def _rebuild_rollups(cursor) -> None:
+    logger.info("Rebuilding analytics rollups from closed orders...")
+    cursor.execute(ROLLUP_REBUILD_SQL)
+
+
+def rebuild_rollups() -> None:
+    """
+    Recomputes the daily analytics rollups from every FECHADO order.
+    Needed after bulk loads or manual edits that bypass the close endpoint.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        _rebuild_rollups(cursor)
+        conn.commit()
+        logger.info("Analytics rollups rebuilt.")
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Rollup rebuild failed: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
 if __name__ == "__main__":
     generate_seeds()
\ No newline at end of file
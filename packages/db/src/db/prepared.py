@@ -0,0 +1,92 @@
+import logging
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# psycopg prepares a statement on its own after `prepare_threshold` plain
+# executions; a None threshold would disable preparing altogether, even with
+# an explicit prepare=True. This value keeps auto-preparing out of reach so
+# only the prepare= flag passed by Query.execute decides.
+NO_AUTO_PREPARE = 2**31 - 1
+
+
+class PrepareStats:
+    """
+    Process-wide counters of executions run as prepared statements (the
+    prepare=True ones; psycopg prepares on the first of them, and again
+    after it dropped its statements on ROLLBACK or DEALLOCATE) and as plain
+    statements.
+    """
+
+    def __init__(self):
+        self.prepared = 0
+        self.unprepared = 0
+        self.per_query: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"prepared": 0, "unprepared": 0}
+        )
+
+    def record(self, key: str, prepared: bool) -> None:
+        field = "prepared" if prepared else "unprepared"
+        setattr(self, field, getattr(self, field) + 1)
+        self.per_query[key][field] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.prepared + self.unprepared
+        return {
+            "enabled": settings.DB_PREPARE_ENABLED,
+            "connections": len(_caches),
+            "prepared": self.prepared,
+            "unprepared": self.unprepared,
+            "prepared_ratio": round(self.prepared / total, 4) if total else 0.0,
+            "queries": {key: dict(value) for key, value in sorted(self.per_query.items())},
+        }
+
+
+class PreparedStatementCache:
+    """
+    Per-connection execution counts, to decide when a query crosses its
+    prepare threshold. Which statements are actually prepared is left to
+    psycopg, which also evicts them (`prepared_max`) and re-prepares them
+    after discarding its statements.
+    """
+
+    def __init__(self):
+        self._executions: Dict[str, int] = defaultdict(int)
+
+    def should_prepare(self, key: str, threshold: Optional[int]) -> bool:
+        """
+        Decides the `prepare=` flag for one execution of `key`.
+        A statement is prepared once it has run more than `threshold` times
+        on this connection; a None threshold never prepares it.
+        """
+        self._executions[key] += 1
+        prepare = (
+            settings.DB_PREPARE_ENABLED
+            and threshold is not None
+            and self._executions[key] > threshold
+        )
+        stats.record(key, prepare)
+        return prepare
+
+
+stats = PrepareStats()
+_caches: "weakref.WeakKeyDictionary[Any, PreparedStatementCache]" = weakref.WeakKeyDictionary()
+
+
+async def configure_prepared_statements(conn) -> None:
+    """
+    Pool `configure` callback.
+    Turns off psycopg's own auto-prepare so each query's threshold decides.
+    """
+    conn.prepare_threshold = NO_AUTO_PREPARE
+    conn.prepared_max = settings.DB_PREPARED_MAX
+    _caches[conn] = PreparedStatementCache()
+
+
+def get_prepared_cache(conn) -> Optional[PreparedStatementCache]:
+    """Returns the cache of a pooled connection, or None for foreign connections."""
+    return _caches.get(conn)
@@ -0,0 +1,18 @@
+"""
+The API reads its settings (db.config) at import time; the tests here never
+connect, so the values of .env.example are enough.
+"""
+import os
+
+for name, value in {
+    "DB_USER": "postgres",
+    "DB_PASSWORD": "password",
+    "DB_NAME": "restaurante",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "API_BASE_URL": "http://localhost:8000/api/v1",
+    "API_TIMEOUT": "10",
+    "PAGE_TITLE": "Sistema de Gestão de Restaurante",
+    "PROJECT_NAME": "RestauranteApp",
+}.items():
+    os.environ.setdefault(name, value)
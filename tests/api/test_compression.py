@@ -0,0 +1,74 @@
+"""Accept-Encoding negotiation and the per-chunk flush of streamed bodies."""
+import zlib
+import pytest
+from apps.api.core.compression import _Encoder, negotiate_encoding
+
+OFFERED = ("br", "gzip")
+ROWS = [b'{"id_pedido": %d, "status": "ABERTO"}\n' % i for i in range(1, 6)]
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("GZIP ; Q=0.8", "gzip"),
+        ("*", "br"),
+        ("*;q=0.5, gzip", "gzip"),
+        ("gzip;q=0.2, *;q=0.5", "br"),
+        ("*;q=0, gzip", "gzip"),
+        ("*;q=0", None),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("gzip;q=high, br;q=0.1", "br"),
+        ("deflate, identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, OFFERED) == expected
+
+
+def test_ties_follow_the_offered_order():
+    assert negotiate_encoding("br, gzip", ("gzip", "br")) == "gzip"
+    assert negotiate_encoding("br", ("gzip",)) is None
+
+
+def gzip_decoder():
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    return decoder.decompress, decoder
+
+
+def brotli_decoder():
+    brotli = pytest.importorskip("brotli")
+    decoder = brotli.Decompressor()
+    return decoder.process, decoder
+
+
+@pytest.mark.parametrize(
+    "encoding, make_decoder", [("gzip", gzip_decoder), ("br", brotli_decoder)]
+)
+def test_each_chunk_decodes_as_soon_as_it_is_sent(encoding, make_decoder):
+    decode, decoder = make_decoder()
+    encoder = _Encoder(encoding, gzip_level=6, brotli_quality=4)
+
+    for row in ROWS:
+        assert decode(encoder.chunk(row)) == row
+    assert decode(encoder.finish(b"]")) == b"]"
+    if encoding == "gzip":
+        assert decoder.eof
+    else:
+        assert decoder.is_finished()
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_finish_alone_is_a_complete_stream(encoding):
+    body = b"".join(ROWS)
+    if encoding == "br":
+        brotli = pytest.importorskip("brotli")
+        decompress = brotli.decompress
+    else:
+        decompress = lambda data: zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+    assert decompress(_Encoder(encoding, 6, 4).finish(body)) == body
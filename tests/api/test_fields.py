@@ -0,0 +1,75 @@
+"""Sparse fieldsets: parsing ?fields= / ?exclude= and shaping the output."""
+from typing import List
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from apps.api.core.fields import FieldSet, shaped, sparse_fields, wants
+
+
+class Order(BaseModel):
+    id: int
+    nome: str
+    total: float
+    itens: List[str]
+
+
+select = sparse_fields(Order)
+
+
+def test_no_selection_means_the_full_document():
+    assert select(fields=None, exclude=None) is None
+    assert wants(None, "itens")
+
+
+def test_fields_keep_the_id_in_model_order():
+    fieldset = select(fields=" itens,nome ,", exclude=None)
+
+    assert fieldset == FieldSet(("id", "nome", "itens"))
+    assert wants(fieldset, "itens")
+    assert not wants(fieldset, "total")
+
+
+def test_exclude_keeps_the_id():
+    assert select(fields=None, exclude="itens,id").names == ("id", "nome", "total")
+
+
+@pytest.mark.parametrize(
+    "fields, exclude, detail",
+    [
+        ("nome,preco,cliente", None, "Unknown field(s): cliente, preco."),
+        (None, "Itens", "Unknown field(s): Itens."),
+        ("nome", "itens", "Use either 'fields' or 'exclude', not both."),
+    ],
+)
+def test_invalid_selection_is_a_bad_request(fields, exclude, detail):
+    with pytest.raises(HTTPException) as error:
+        select(fields=fields, exclude=exclude)
+
+    assert error.value.status_code == 400
+    assert error.value.detail == detail
+
+
+def test_pick_and_shaped_emit_only_the_selected_fields():
+    order = Order(id=1, nome="Mesa 4", total=12.5, itens=["a"])
+    fieldset = FieldSet(("id", "total"))
+
+    assert fieldset.pick(order) == {"id": 1, "total": 12.5}
+    assert shaped(fieldset, lambda row: Order(**row))(order.model_dump()) == {"id": 1, "total": 12.5}
+    assert shaped(None, lambda row: order)(None) is order
+
+
+def test_query_string_is_validated_by_the_route():
+    app = FastAPI()
+
+    @app.get("/orders")
+    def orders(fields=Depends(select)):
+        return None if fields is None else list(fields.names)
+
+    client = TestClient(app)
+
+    assert client.get("/orders").json() is None
+    assert client.get("/orders", params={"fields": "total"}).json() == ["id", "total"]
+    response = client.get("/orders", params={"fields": "total,desconto"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown field(s): desconto."}
@@ -0,0 +1,36 @@
+"""OrderService._merge_item_lines: one line per dish and notes in a batch."""
+from packages.common.src.models.orders_models import OrderItemCreate
+from apps.api.modules.orders.service import OrderService
+
+merge = OrderService._merge_item_lines
+
+
+def line(dish, quantity, notes=None):
+    return OrderItemCreate(id_prato=dish, quantidade=quantity, observacoes=notes)
+
+
+def test_duplicate_lines_are_summed_in_first_seen_order():
+    merged = merge([line(2, 1), line(1, 2), line(2, 3), line(1, 1)])
+
+    assert [(i.id_prato, i.quantidade) for i in merged] == [(2, 4), (1, 3)]
+
+
+def test_different_notes_stay_separate_lines():
+    merged = merge([line(1, 1), line(1, 1, "sem cebola"), line(1, 2, "sem cebola"), line(1, 1)])
+
+    assert [(i.observacoes, i.quantidade) for i in merged] == [(None, 2), ("sem cebola", 3)]
+
+
+def test_input_lines_are_not_modified():
+    first = line(1, 1)
+    merged = merge([first, line(1, 2)])
+
+    assert merged[0].quantidade == 3
+    assert first.quantidade == 1
+
+
+def test_distinct_lines_pass_through():
+    items = [line(1, 1), line(2, 1, "bem passado"), line(3, 5)]
+
+    assert merge(items) == items
+    assert merge([]) == []
@@ -0,0 +1,112 @@
+"""QueryRegistry parsing: the `-- prepare:` header and statement validation."""
+import pytest
+from apps.api.core.exceptions import QueryRegistryError
+from apps.api.core.queries import QueryRegistry
+from db.config import settings
+
+
+def write_query(root, name, sql, module="orders"):
+    path = root / module / "queries" / f"{name}.sql"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(sql, encoding="utf-8")
+
+
+def load(root, *required, module="orders"):
+    registry = QueryRegistry(root)
+    queries = registry.bind(module, required=required)
+    registry.load()
+    return queries
+
+
+def test_prepare_header_sets_the_threshold(tmp_path):
+    write_query(tmp_path, "hot", "-- prepare: 0\nSELECT 1;")
+    write_query(tmp_path, "warm", "-- Orders by id.\n-- prepare: 12\nSELECT 1;")
+    write_query(tmp_path, "cold", "-- prepare: OFF\nSELECT 1;")
+    write_query(tmp_path, "plain", "SELECT 1;")
+
+    queries = load(tmp_path)
+
+    assert queries["hot"].prepare_threshold == 0
+    assert queries["warm"].prepare_threshold == 12
+    assert queries["cold"].prepare_threshold is None
+    assert queries["plain"].prepare_threshold == settings.DB_PREPARE_THRESHOLD
+
+
+@pytest.mark.parametrize("value", ["-1", "soon", "5x"])
+def test_invalid_prepare_header_fails_the_load(tmp_path, value):
+    write_query(tmp_path, "bad", f"-- prepare: {value}\nSELECT 1;")
+
+    with pytest.raises(QueryRegistryError, match="orders:bad: invalid prepare directive"):
+        load(tmp_path)
+
+
+def test_placeholders_are_collected(tmp_path):
+    write_query(
+        tmp_path,
+        "find",
+        "SELECT * FROM pedido WHERE id_pedido = %(id)s AND status = %(status)s "
+        "AND observacao LIKE '100%%' OR id_pedido = %(id)s;",
+    )
+
+    query = load(tmp_path)["find"]
+
+    assert query.params == frozenset({"id", "status"})
+    assert query.key == "orders:find"
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT * FROM pedido WHERE id_pedido = %s;",
+        "SELECT * FROM pedido WHERE id_pedido = %(id);",
+        "SELECT * FROM pedido WHERE id_pedido = %(id)d;",
+    ],
+)
+def test_malformed_placeholders_fail_the_load(tmp_path, sql):
+    write_query(tmp_path, "bad", sql)
+
+    with pytest.raises(QueryRegistryError, match="malformed placeholder"):
+        load(tmp_path)
+
+
+def test_semicolons_in_comments_and_literals_are_one_statement(tmp_path):
+    write_query(
+        tmp_path,
+        "one",
+        "-- first; second\nSELECT 'a;b', \"c;d\" /* ; */ FROM pedido;\n",
+    )
+
+    assert load(tmp_path)["one"].sql.startswith("-- first")
+
+
+@pytest.mark.parametrize(
+    "sql, message",
+    [
+        ("SELECT 1; SELECT 2;", "more than one statement"),
+        ("-- only a comment\n;", "file is empty"),
+    ],
+)
+def test_invalid_files_fail_the_load(tmp_path, sql, message):
+    write_query(tmp_path, "bad", sql)
+
+    with pytest.raises(QueryRegistryError, match=message):
+        load(tmp_path)
+
+
+def test_missing_required_query_fails_the_load(tmp_path):
+    write_query(tmp_path, "present", "SELECT 1;")
+
+    with pytest.raises(QueryRegistryError, match="orders:absent: query file not found"):
+        load(tmp_path, "present", "absent")
+
+
+def test_unknown_query_and_unloaded_registry(tmp_path):
+    write_query(tmp_path, "present", "SELECT 1;")
+    registry = QueryRegistry(tmp_path)
+    queries = registry.bind("orders")
+
+    with pytest.raises(QueryRegistryError, match="has not been loaded"):
+        queries["present"]
+    registry.load()
+    with pytest.raises(QueryRegistryError, match="Unknown query 'orders:absent'"):
+        queries["absent"]
@@ -0,0 +1,157 @@
+"""ResultCache: shared loads, generations and the settle window after invalidation."""
+import asyncio
+import pytest
+from apps.api.core import cache as cache_module
+from apps.api.core.cache import ResultCache
+
+
+class Loader:
+    """Counts calls; each call waits for `release` when one is given."""
+
+    def __init__(self, release=None):
+        self.calls = 0
+        self.release = release
+
+    async def __call__(self):
+        self.calls += 1
+        value = f"value {self.calls}"
+        if self.release is not None:
+            await self.release.wait()
+        return value
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_hit_after_a_load():
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        loader = Loader()
+        assert await cache.get_or_load("k", loader) == "value 1"
+        assert await cache.get_or_load("k", loader) == "value 1"
+        return cache, loader
+
+    cache, loader = run(scenario())
+    assert loader.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        loader = Loader(asyncio.Event())
+        tasks = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        return await asyncio.gather(*tasks), loader
+
+    values, loader = run(scenario())
+    assert values == ["value 1"] * 3
+    assert loader.calls == 1
+
+
+def test_invalidation_mid_fetch_is_not_stored():
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        loader = Loader(asyncio.Event())
+        first = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        cache.invalidate("write during the load")
+        loader.release.set()
+        stale = await first
+        stored = "k" in cache._entries
+        fresh = await cache.get_or_load("k", loader)
+        return cache, loader, stale, stored, fresh
+
+    cache, loader, stale, stored, fresh = run(scenario())
+    assert stale == "value 1"
+    assert not stored
+    assert fresh == "value 2"
+    assert cache.generation == 1
+    assert loader.calls == 2
+
+
+def test_waiter_of_an_invalidated_load_loads_again():
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        loader = Loader(asyncio.Event())
+        first = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        loader.release.set()
+        return await first, await waiter, loader
+
+    first, waiter, loader = run(scenario())
+    assert first == "value 1"
+    assert waiter == "value 2"
+    assert loader.calls == 2
+
+
+def test_loads_within_the_settle_window_are_not_stored(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        cache.settle_seconds = 5.0
+        loader = Loader()
+        cache.invalidate()
+        now[0] += 4.9
+        await cache.get_or_load("k", loader)
+        await cache.get_or_load("k", loader)
+        settling_calls = loader.calls
+        now[0] += 0.2
+        await cache.get_or_load("k", loader)
+        await cache.get_or_load("k", loader)
+        return settling_calls, loader.calls
+
+    settling_calls, calls = run(scenario())
+    assert settling_calls == 2
+    assert calls == 3
+
+
+def test_settle_window_is_measured_from_when_the_load_started(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    async def scenario():
+        cache = ResultCache("test", max_size=4)
+        cache.settle_seconds = 5.0
+        loader = Loader(asyncio.Event())
+        cache.invalidate()
+        now[0] += 1.0
+        task = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        now[0] += 10.0
+        loader.release.set()
+        await task
+        return "k" in cache._entries
+
+    assert run(scenario()) is False
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def scenario():
+        cache = ResultCache("test", max_size=2)
+        for key in ("a", "b"):
+            await cache.get_or_load(key, Loader())
+        await cache.get_or_load("a", Loader())
+        await cache.get_or_load("c", Loader())
+        return list(cache._entries)
+
+    assert run(scenario()) == ["a", "c"]
+
+
+@pytest.mark.parametrize("max_size", [0, -1])
+def test_disabled_cache_always_loads(max_size):
+    async def scenario():
+        cache = ResultCache("test", max_size=max_size)
+        loader = Loader()
+        await cache.get_or_load("k", loader)
+        await cache.get_or_load("k", loader)
+        return loader.calls
+
+    assert run(scenario()) == 2
@@ -0,0 +1,227 @@
+"""
+RedisBackend against a small in-process RESP2 server.
+
+The stand-in implements only what the backend sends (GET, SET PX, DEL and
+SCAN MATCH COUNT), pages SCAN results like Redis does, and can drop every
+client connection to exercise the reconnect path.
+"""
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+import pytest
+from apps.ui.core import cache
+from apps.ui.core.cache import RedisBackend
+
+SECRET = "test-secret"
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    scan_page = 2
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), RespHandler)
+        self.lock = threading.Lock()
+        self.data = {}
+        self.clients = []
+        self.commands = []
+        self.scans = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"redis://{host}:{port}/0"
+
+    def drop_clients(self) -> None:
+        with self.lock:
+            clients, self.clients = self.clients, []
+        for conn in clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:  # already closed by its client
+                pass
+
+    def run(self, args):
+        name = args[0].decode().upper()
+        self.commands.append(name)
+        with self.lock:
+            if name == "GET":
+                value, expires = self.data.get(args[1], (None, None))
+                if expires is not None and expires < time.monotonic():
+                    del self.data[args[1]]
+                    value = None
+                return value
+            if name == "SET":
+                expires = None
+                if len(args) == 5 and args[3].upper() == b"PX":
+                    expires = time.monotonic() + int(args[4]) / 1000
+                self.data[args[1]] = (args[2], expires)
+                return "OK"
+            if name == "DEL":
+                return sum(self.data.pop(key, None) is not None for key in args[1:])
+            if name == "SCAN":
+                # Cursors resume after the last key returned, so keys deleted
+                # between pages do not make the scan skip any (as in Redis).
+                after = self.scans.pop(int(args[1]), b"")
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                keys = sorted(k for k in self.data if k > after)
+                page = keys[: self.scan_page]
+                cursor = 0
+                if len(keys) > self.scan_page:
+                    cursor = len(self.scans) + 1
+                    self.scans[cursor] = page[-1]
+                return [
+                    str(cursor).encode(),
+                    [k for k in page if fnmatch.fnmatchcase(k.decode(), pattern)],
+                ]
+        return RuntimeError(f"ERR unknown command '{name}'")
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        with self.server.lock:
+            self.server.clients.append(self.request)
+        try:
+            while True:
+                args = self.read_command()
+                if args is None:
+                    return
+                self.wfile.write(encode(self.server.run(args)))
+        except OSError:  # dropped by drop_clients()
+            pass
+        finally:
+            with self.server.lock:
+                if self.request in self.server.clients:
+                    self.server.clients.remove(self.request)
+
+    def read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+
+def encode(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, RuntimeError):
+        return b"-%s\r\n" % str(value).encode()
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(encode(item) for item in value)
+
+
+@pytest.fixture
+def server():
+    server = RespServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.drop_clients()
+    server.server_close()
+
+
+@pytest.fixture
+def backend(server):
+    return RedisBackend(server.url, SECRET)
+
+
+def test_get_returns_what_set_stored(backend, server):
+    backend.set("ns:a", b"value", ttl=60)
+
+    assert backend.get("ns:a") == b"value"
+    assert backend.get("ns:missing") is None
+    stored, expires = server.data[b"ns:a"]
+    assert stored.endswith(b"value") and stored != b"value"
+    assert expires is not None
+
+
+def test_set_passes_ttl_as_px(backend):
+    backend.set("ns:a", b"value", ttl=0.05)
+    time.sleep(0.1)
+
+    assert backend.get("ns:a") is None
+
+
+def test_unsigned_or_foreign_entries_are_misses(backend, server):
+    backend.set("ns:a", b"value", ttl=60)
+    server.data[b"ns:b"] = (server.data[b"ns:a"][0], None)
+    server.data[b"ns:c"] = (b"raw pickle", None)
+
+    assert backend.get("ns:b") is None
+    assert backend.get("ns:c") is None
+    assert RedisBackend(server.url, "other-secret").get("ns:a") is None
+
+
+def test_clear_scans_every_page_of_the_namespace(backend, server):
+    for i in range(7):
+        backend.set(f"ns:{i}", b"v", ttl=60)
+    backend.set("other:0", b"v", ttl=60)
+
+    backend.clear("ns")
+
+    assert list(server.data) == [b"other:0"]
+    assert server.commands.count("SCAN") > 1
+
+
+def test_delete(backend, server):
+    backend.set("ns:a", b"value", ttl=60)
+    backend.delete("ns:a")
+
+    assert b"ns:a" not in server.data
+
+
+def test_error_reply_raises_and_keeps_the_connection(backend):
+    backend.set("ns:a", b"value", ttl=60)
+    connection = backend._local.conn
+
+    with pytest.raises(RuntimeError, match="unknown command"):
+        backend._command("NOPE")
+
+    assert backend._local.conn is connection
+    assert backend.get("ns:a") == b"value"
+
+
+def test_reconnects_after_the_server_drops_the_connection(backend, server):
+    backend.set("ns:a", b"value", ttl=60)
+    server.drop_clients()
+
+    with pytest.raises(OSError):
+        backend.get("ns:a")
+    assert backend._local.conn is None
+    assert backend.get("ns:a") == b"value"
+
+
+def test_cached_function_survives_a_failing_server(backend, server, monkeypatch):
+    monkeypatch.setattr(cache, "_backend", backend)
+    monkeypatch.setattr(cache, "_bypass_until", 0.0)
+    calls = []
+
+    @cache.cached(ttl=60)
+    def load(x):
+        calls.append(x)
+        return {"x": x}
+
+    assert load(1) == load(1) == {"x": 1}
+    assert calls == [1]
+
+    server.drop_clients()
+    assert load(1) == {"x": 1}
+    assert calls == [1, 1]
+    assert cache._bypass_until > time.monotonic()
+
+    monkeypatch.setattr(cache, "_bypass_until", 0.0)
+    assert load(1) == {"x": 1}
+    assert calls == [1, 1]